@@ -5,11 +5,26 @@ Build script for SEGY GUI Viewer executable
 
 import os
 import sys
-import subprocess
-import shutil
+import argparse
 import re
+import json
+import hashlib
+import time
+from importlib import metadata
+from functools import lru_cache
 from pathlib import Path
 
+# Patterns used to read the version from segy_viewer.py and patch the spec file
+_VERSION_RE = re.compile(r'(?m)^\s*__version__\s*=\s*["\']([^"\']+)["\']')
+_NAME_RE = re.compile(r"name='[^']*'")
+
+# Inputs whose contents decide whether a previous PyInstaller build can be reused: the
+# bundled modules, the spec and the resources it adds to the executable
+BUILD_CACHE_SOURCES = ['segy_viewer.py', 'segy_format.py', 'trace_field_docs.py', 'pltsegy.py',
+                       'segy_viewer.spec', 'media/CCOM.ico', 'media/CCOM.png']
+BUILD_CACHE_FILE = os.path.join('dist', '.build_cache.json')
+
+@lru_cache(maxsize=1)
 def get_version_from_code():
     """Extract version from segy_viewer.py"""
     try:
@@ -17,16 +32,10 @@ def get_version_from_code():
             content = f.read()
         
         # Look for __version__ = "version_string" (find the uncommented one)
-        # Match lines that are not commented out
-        lines = content.split('\n')
-        for line in lines:
-            stripped = line.strip()
-            # Skip commented lines
-            if stripped.startswith('#'):
-                continue
-            match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', stripped)
-            if match:
-                return match.group(1)
+        # The pattern is anchored at line start, so commented-out lines never match
+        match = _VERSION_RE.search(content)
+        if match:
+            return match.group(1)
         return "unknown"
     except Exception as e:
         print(f"Warning: Could not extract version: {e}")
@@ -39,7 +48,7 @@ def update_spec_file(exe_name):
             content = f.read()
         
         # Replace the name in the EXE section
-        content = re.sub(r"name='[^']*'", f"name='{exe_name}'", content)
+        content = _NAME_RE.sub(f"name='{exe_name}'", content)
         
         with open('segy_viewer.spec', 'w', encoding='utf-8') as f:
             f.write(content)
@@ -48,8 +57,63 @@ def update_spec_file(exe_name):
     except Exception as e:
         print(f"Warning: Could not update spec file: {e}")
 
-def build_segy_gui():
+def get_build_cache_key():
+    """Hash the build inputs and toolchain versions into a single key for the build cache"""
+    digest = hashlib.sha256()
+    # A different interpreter or PyInstaller produces a different executable from the same sources
+    try:
+        pyinstaller_version = metadata.version('pyinstaller')
+    except metadata.PackageNotFoundError:
+        pyinstaller_version = 'unknown'
+    digest.update(f'{sys.version}\0{pyinstaller_version}\0'.encode('utf-8'))
+    for path in BUILD_CACHE_SOURCES:
+        if os.path.exists(path):
+            digest.update(path.encode('utf-8'))
+            digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+def read_build_cache():
+    """Read the record of the last successful build, or None if there is none"""
+    try:
+        with open(BUILD_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+def write_build_cache(key, exe_name):
+    """Record the inputs of a successful build so an unchanged rebuild can be skipped"""
+    try:
+        with open(BUILD_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'sha': key, 'exe_name': exe_name, 'mtime': time.time()}, f, indent=2)
+    except Exception as e:
+        print(f"Warning: Could not write build cache: {e}")
+
+def check_import(module='segy_viewer'):
+    """Import the application in a fresh interpreter, so a module that fails to load stops the build"""
+    import subprocess
+    result = subprocess.run([sys.executable, '-c', f'import {module}'], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"✗ Could not import {module}:")
+        print(result.stderr.strip())
+        return False
+    print(f"✓ {module} imports cleanly")
+    return True
+
+def icon_needs_refresh(png_path, icon_path):
+    """Tell whether the tracked ICO is missing or was built from a different PNG"""
+    if not os.path.exists(icon_path):
+        return True
+    # Without a hash sidecar the tracked ICO is taken as current
+    hash_path = icon_path + '.sha256'
+    if not os.path.exists(hash_path):
+        return False
+    png_hash = hashlib.sha256(Path(png_path).read_bytes()).hexdigest()
+    return Path(hash_path).read_text().strip() != png_hash
+
+def build_segy_gui(fresh=False, capture=False, refresh_icon=False):
     """Build the SEGY GUI executable using PyInstaller"""
+    import shutil
+    import subprocess
     
     # Get version from code
     version = get_version_from_code()
@@ -71,45 +135,73 @@ def build_segy_gui():
         print("Error: segy_viewer.spec not found.")
         return False
     
-    # Check if icon file exists
+    # Regenerate the icon only when asked or when it is stale, so a fresh clone keeps the
+    # tracked ICO and does not need Pillow
     icon_path = 'media/CCOM.ico'
+    png_path = 'media/CCOM.png'
+    if os.path.exists(png_path) and (refresh_icon or icon_needs_refresh(png_path, icon_path)):
+        from convert_icon import convert_png_to_ico
+        convert_png_to_ico(png_path, icon_path, force=refresh_icon)
+    
+    # Check if icon file exists
     if not os.path.exists(icon_path):
         print(f"Warning: Icon file {icon_path} not found. Building without custom icon.")
     else:
         print(f"✓ Icon file {icon_path} found")
     
     try:
-        # Clean previous builds
-        print("Cleaning previous builds...")
-        if os.path.exists('build'):
-            shutil.rmtree('build')
-        # Try to clean dist, but if exe is locked, just try to delete the exe file
-        if os.path.exists('dist'):
-            exe_path = os.path.join('dist', f'{exe_name}.exe')
-            if os.path.exists(exe_path):
+        # Clean previous builds only when asked, so PyInstaller can reuse its cache
+        if fresh:
+            print("Cleaning previous builds...")
+            if os.path.exists('build'):
+                shutil.rmtree('build')
+            # Try to clean dist, but if exe is locked, just try to delete the exe file
+            if os.path.exists('dist'):
+                exe_path = os.path.join('dist', f'{exe_name}.exe')
+                if os.path.exists(exe_path):
+                    try:
+                        os.remove(exe_path)
+                    except PermissionError:
+                        print(f"Warning: {exe_name}.exe is locked (may be running). PyInstaller will attempt to overwrite it.")
+                # Remove other files in dist if they exist
                 try:
-                    os.remove(exe_path)
-                except PermissionError:
-                    print(f"Warning: {exe_name}.exe is locked (may be running). PyInstaller will attempt to overwrite it.")
-            # Remove other files in dist if they exist
-            try:
-                for item in os.listdir('dist'):
-                    item_path = os.path.join('dist', item)
-                    if os.path.isfile(item_path) and item != f'{exe_name}.exe':
-                        os.remove(item_path)
-                    elif os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-            except Exception:
-                pass  # Continue even if cleanup fails
+                    for item in os.listdir('dist'):
+                        item_path = os.path.join('dist', item)
+                        if os.path.isfile(item_path) and item != f'{exe_name}.exe':
+                            os.remove(item_path)
+                        elif os.path.isdir(item_path):
+                            shutil.rmtree(item_path)
+                except Exception:
+                    pass  # Continue even if cleanup fails
         
         # Update spec file with version
         update_spec_file(exe_name)
         
+        # Reuse the previous executable if none of the build inputs changed
+        cache_key = get_build_cache_key()
+        cache = read_build_cache()
+        exe_path = Path(f'dist/{exe_name}.exe')
+        if (cache and cache.get('sha') == cache_key and cache.get('exe_name') == exe_name
+                and exe_path.exists()):
+            print(f"✓ Cached build reused (built {time.ctime(cache.get('mtime', 0))})")
+            print(f"✓ Location: {exe_path.absolute()}")
+            print("Build cache: hit")
+            return True
+        
+        # PyInstaller happily freezes a module that raises at import, so catch that first
+        if not check_import():
+            print("✗ Build failed!")
+            return False
+        
         # Run PyInstaller
         print("Running PyInstaller...")
-        cmd = [sys.executable, '-m', 'PyInstaller', '--clean', 'segy_viewer.spec']
+        cmd = [sys.executable, '-m', 'PyInstaller', '--noconfirm', 'segy_viewer.spec']
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Stream PyInstaller's log straight to the terminal unless a captured copy was requested
+        if capture:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        else:
+            result = subprocess.run(cmd, check=False)
         
         if result.returncode == 0:
             print("✓ Build successful!")
@@ -121,14 +213,17 @@ def build_segy_gui():
                 size_mb = exe_path.stat().st_size / (1024 * 1024)
                 print(f"✓ Executable size: {size_mb:.1f} MB")
                 print(f"✓ Location: {exe_path.absolute()}")
+                write_build_cache(cache_key, exe_name)
             else:
                 print("Warning: Executable not found in expected location")
             
+            print("Build cache: miss")
             return True
         else:
             print("✗ Build failed!")
-            print("STDOUT:", result.stdout)
-            print("STDERR:", result.stderr)
+            if capture:
+                print("STDOUT:", result.stdout)
+                print("STDERR:", result.stderr)
             return False
             
     except Exception as e:
@@ -137,20 +232,38 @@ def build_segy_gui():
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Build the SEGY GUI Viewer executable")
+    parser.add_argument('--fresh', action='store_true',
+                        help="remove previous build/ and dist/ output before building")
+    parser.add_argument('--capture', action='store_true',
+                        help="capture PyInstaller output and print it only if the build fails")
+    parser.add_argument('--refresh-icon', action='store_true',
+                        help="regenerate media/CCOM.ico from media/CCOM.png before building")
+    parser.add_argument('--version', action='store_true',
+                        help="print the version found in segy_viewer.py and exit")
+    args = parser.parse_args()
+    
+    if args.version:
+        print(get_version_from_code())
+        return 0
+    
+    import subprocess
+    
     print("SEGY GUI Viewer - Build Script")
     print("=" * 50)
     
-    # Check if PyInstaller is installed
-    try:
-        import PyInstaller
-        print(f"✓ PyInstaller version: {PyInstaller.__version__}")
-    except ImportError:
+    # Check if PyInstaller is installed (ask the module itself rather than importing it here)
+    result = subprocess.run([sys.executable, '-m', 'PyInstaller', '--version'],
+                            capture_output=True, text=True)
+    if result.returncode == 0:
+        print(f"✓ PyInstaller version: {result.stdout.strip()}")
+    else:
         print("✗ PyInstaller not found. Installing...")
         subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyinstaller'])
         print("✓ PyInstaller installed")
     
     # Build the executable
-    success = build_segy_gui()
+    success = build_segy_gui(fresh=args.fresh, capture=args.capture, refresh_icon=args.refresh_icon)
     
     if success:
         version = get_version_from_code()
@@ -164,7 +277,8 @@ def main():
         print("BUILD FAILED!")
         print("Check the error messages above for details.")
         print("=" * 50)
-        sys.exit(1)
+        return 1
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -4,19 +4,28 @@ Convert CCOM.png to CCOM.ico for use with PyInstaller
 """
 
 import os
-from PIL import Image
+import hashlib
+from pathlib import Path
 
-def convert_png_to_ico():
+def convert_png_to_ico(png_path='../media/CCOM.png', ico_path='CCOM.ico', force=False):
     """Convert CCOM.png to CCOM.ico with multiple sizes"""
     
-    png_path = '../media/CCOM.png'
-    ico_path = 'CCOM.ico'
-    
     if not os.path.exists(png_path):
         print(f"Error: {png_path} not found")
         return False
     
+    # Skip the conversion if the ICO was already built from this exact PNG
+    hash_path = ico_path + '.sha256'
+    png_hash = hashlib.sha256(Path(png_path).read_bytes()).hexdigest()
+    if not force and os.path.exists(ico_path) and os.path.exists(hash_path):
+        if Path(hash_path).read_text().strip() == png_hash:
+            print(f"✓ {ico_path} is up to date with {png_path}")
+            return True
+    
     try:
+        # Pillow is only needed when the icon actually has to be regenerated
+        from PIL import Image
+        
         # Open the PNG image
         img = Image.open(png_path)
         
@@ -24,17 +33,22 @@ def convert_png_to_ico():
         if img.mode != 'RGBA':
             img = img.convert('RGBA')
         
-        # Create multiple sizes for the ICO file (Windows standard sizes)
-        sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
+        # Create multiple sizes for the ICO file (Windows standard sizes), largest first
+        sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
+        
+        # Resample the original once, then area-average each smaller size from the previous one
+        prev = img.resize(sizes[0], Image.Resampling.LANCZOS)
+        icon_images = [prev]
+        for size in sizes[1:]:
+            prev = prev.resize(size, Image.Resampling.BOX)
+            icon_images.append(prev)
         
-        # Resize image for each size
-        icon_images = []
-        for size in sizes:
-            resized = img.resize(size, Image.Resampling.LANCZOS)
-            icon_images.append(resized)
+        # Save as ICO file from the largest image; Pillow drops sizes bigger than the base image
+        icon_images[0].save(ico_path, format='ICO', sizes=sizes,
+                            append_images=icon_images[1:])
         
-        # Save as ICO file
-        icon_images[0].save(ico_path, format='ICO', sizes=[(img.width, img.height) for img in icon_images])
+        # Record the source hash so unchanged PNGs are not converted again
+        Path(hash_path).write_text(png_hash)
         
         print(f"✓ Successfully converted {png_path} to {ico_path}")
         print(f"✓ Icon file size: {os.path.getsize(ico_path) / 1024:.1f} KB")
@@ -2,29 +2,51 @@
 
 import sys
 import re
+import mmap
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 import segyio
+from segy_format import SEGY_SAMPLE_SIZES, TRACE_HEADER_DTYPE
 
 filename = sys.argv[1]
 #filename = 'env-0001_2024_140_0744_130003_CHP3.5_FLT_000.sgy'
 
-def parse_trace_headers(segyfile, n_traces):
+# Text header card separator and newline-to-space table, built once
+_TEXT_HDR_SPLIT = re.compile(r'C ')
+_NEWLINE_TO_SPACE = str.maketrans('\n', ' ')
+
+def parse_trace_headers(segyfile, segy_path, n_traces):
     '''
-    Parse the segy file trace headers into a pandas dataframe.
+    Parse the segy file trace headers into a dict of numpy columns.
     Column names are defined from segyio internal tracefield
-    One row per trace
+    Row i of every column is trace i + 1
+    '''
+    # Trace headers repeat every (240 + trace data) bytes after the file headers
+    data_offset = 3600 + 3200 * segyfile.ext_headers
+    sample_size = SEGY_SAMPLE_SIZES.get(segyfile.bin[segyio.BinField.Format], 4)
+    trace_size = 240 + segyfile.samples.size * sample_size
+    # View every trace header at once through a strided structured array over the mapped file
+    with open(segy_path, 'rb') as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        hdrs = np.ndarray(shape=(n_traces,), dtype=TRACE_HEADER_DTYPE, buffer=mm,
+                          offset=data_offset, strides=(trace_size,))
+        cols = {k: hdrs[k].astype(np.int32) for k in TRACE_HEADER_DTYPE.names}
+        del hdrs  # release the view before the mapping is closed
+    return cols
+
+def downsample_max(img, max_rows, max_cols):
+    '''
+    Shrink a 2-D image to at most about max_rows x max_cols pixels by
+    taking the maximum of each block, so amplitude peaks survive.
+    The image is trimmed to a whole number of blocks first.
     '''
-    # Get all header keys
-    headers = segyio.tracefield.keys
-    # Initialize dataframe with trace id as index and headers as columns
-    df = pd.DataFrame(index=range(1, n_traces + 1),
-                      columns=headers.keys())
-    # Fill dataframe with all header values
-    for k, v in headers.items():
-        df[k] = segyfile.attributes(v)[:]
-    return df
+    rows, cols = img.shape
+    sy = max(1, rows // max_rows)
+    sx = max(1, cols // max_cols)
+    if sy == 1 and sx == 1:
+        return img
+    rows, cols = rows - rows % sy, cols - cols % sx
+    blocks = img[:rows, :cols].reshape(rows // sy, sy, cols // sx, sx)
+    return blocks.max(axis=(1, 3))
 
 def parse_text_header(segyfile):
     '''
@@ -32,9 +54,9 @@ def parse_text_header(segyfile):
     '''
     raw_header = segyio.tools.wrap(segyfile.text[0])
     # Cut on C*int pattern
-    cut_header = re.split(r'C ', raw_header)[1::]
+    cut_header = _TEXT_HDR_SPLIT.split(raw_header)[1:]
     # Remove end of line return
-    text_header = [x.replace('\n', ' ') for x in cut_header]
+    text_header = [x.translate(_NEWLINE_TO_SPACE) for x in cut_header]
     text_header[-1] = text_header[-1][:-2]
     # Format in dict
     clean_header = {}
@@ -46,30 +68,39 @@ def parse_text_header(segyfile):
     return clean_header
 
 with segyio.open(filename, ignore_geometry=True) as f:
+    # Memory-map the file so trace reads page in from disk instead of buffered I/O
+    f.mmap()
     # Get basic attributes
     n_traces = f.tracecount
     sample_rate = segyio.tools.dt(f) / 1000
     n_samples = f.samples.size
     twt = f.samples
-    data = f.trace.raw[:]  # Get all data into memory (could cause on big files)
+    # Stream traces into one preallocated array instead of materializing them all at once.
+    # Store it as (samples, traces), the orientation imshow draws, so no transpose is needed later
+    data = np.empty((n_samples, n_traces), dtype=np.float32)
+    for i in range(n_traces):
+        data[:, i] = f.trace[i]
     # Load headers
     bin_headers = f.bin
     text_headers = parse_text_header(f)
-    trace_headers = parse_trace_headers(f, n_traces)
+    trace_headers = parse_trace_headers(f, filename, n_traces)
 
 print(text_headers)
 
 f'N Traces: {n_traces}, N Samples: {n_samples}, Sample rate: {sample_rate}ms'
 bin_headers
 text_headers
-trace_headers.columns  # list the trace headers keys
+list(trace_headers)  # list the trace headers keys
 
-trace_headers.head()
+{k: v[:5] for k, v in trace_headers.items()}  # first five traces
 
-trace_headers.loc[1, 'FieldRecord']
+trace_headers['FieldRecord'][0]
 
 clip_percentile = 99
-vm = np.percentile(data, clip_percentile)
+# A single quantile only needs a linear-time selection, not a sort
+flat = data.reshape(-1)
+k = int(round(clip_percentile / 100 * (flat.size - 1)))
+vm = np.partition(flat, k)[k]
 f'The {clip_percentile}th percentile is {vm:.0f}; the max amplitude is {data.max():.0f}'
 
 #vm=200 
@@ -79,9 +110,21 @@ vm1 = vm
 
 fig = plt.figure(figsize=(18, 8))
 ax = fig.add_subplot(1, 1, 1)
-extent = [1, n_traces, twt[-1], twt[0]]  # define extent
-#ax.imshow(data.T, cmap="RdBu", vmin=-vm, vmax=vm, aspect='auto', extent=extent)
-ax.imshow(data.T, cmap="BuPu", vmin=vm0, vmax=vm1, aspect='auto', extent=extent)
+# Reduce the image to about the figure's pixel size before any per-pixel work
+fig_w, fig_h = fig.get_size_inches() * fig.dpi
+img = downsample_max(data, int(fig_h), int(fig_w))
+# Keep the extent on the samples/traces that survived trimming to whole blocks
+rows_kept = img.shape[0] * max(1, n_samples // int(fig_h))
+traces_kept = img.shape[1] * max(1, n_traces // int(fig_w))
+extent = [1, traces_kept, twt[rows_kept - 1], twt[0]]  # define extent
+# Quantize to 8 bits before plotting; a raster image cannot show more levels than that
+scale = 255.0 / max(vm1 - vm0, 1e-12)
+img8 = np.clip((img - vm0) * scale, 0, 255).astype(np.uint8)
+# Colour through a 256-entry RGBA lookup table so Agg receives ready-made uint8 pixels
+lut = plt.get_cmap("BuPu")(np.arange(256), bytes=True)
+rgba = lut[img8]
+#ax.imshow(data, cmap="RdBu", vmin=-vm, vmax=vm, aspect='auto', extent=extent)
+ax.imshow(rgba, aspect='auto', extent=extent)
 ax.set_xlabel('CDP number')
 ax.set_ylabel('TWT [ms]')
 ax.set_title(f'{filename}')
@@ -0,0 +1,29 @@
+"""
+On-disk layout tables shared by segy_viewer.py and pltsegy.py
+"""
+
+import sys
+import numpy as np
+import segyio
+
+def _trace_header_dtype():
+    """Build a big-endian structured dtype for the 240-byte trace header.
+    
+    Field offsets come from segyio's tracefield table; each field runs up to the start
+    of the next one.
+    """
+    fields = sorted(segyio.tracefield.keys.items(), key=lambda kv: kv[1])
+    names, formats, offsets = [], [], []
+    for i, (name, byte) in enumerate(fields):
+        end = fields[i + 1][1] if i + 1 < len(fields) else 241
+        # Interned so the header column names hit the identity fast path of the field tables
+        names.append(sys.intern(name))
+        formats.append('>i2' if end - byte == 2 else '>i4')
+        offsets.append(byte - 1)
+    return np.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': 240})
+
+TRACE_HEADER_DTYPE = _trace_header_dtype()
+
+# Bytes per sample for each SEG-Y data sample format code
+SEGY_SAMPLE_SIZES = {1: 4, 2: 4, 3: 2, 4: 4, 5: 4, 6: 8, 7: 3, 8: 1,
+                     9: 8, 10: 4, 11: 2, 12: 8, 15: 3, 16: 1}
@@ -4,22 +4,45 @@ import sys
 import re
 import os
 import json
+import hashlib
+import importlib.util
+import multiprocessing
+from collections import OrderedDict
+from functools import lru_cache
+from contextlib import contextmanager
+from types import MappingProxyType
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
 import numpy as np
 import pandas as pd
 import segyio
+from segy_format import SEGY_SAMPLE_SIZES, TRACE_HEADER_DTYPE
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QFileDialog, QTextEdit, 
                              QLabel, QSplitter, QMessageBox, QProgressBar,
-                             QProgressDialog, QGroupBox, QGridLayout, QSpinBox, QDoubleSpinBox, QComboBox,
+                             QProgressDialog, QGroupBox, QSpinBox, QDoubleSpinBox, QComboBox,
                              QCheckBox, QLineEdit, QDialog)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QPixmap
+from PyQt6.QtCore import Qt, QThread, QTimer, QObject, QRunnable, QThreadPool, QStandardPaths, pyqtSignal
+from PyQt6.QtGui import QFont, QPixmap, QResizeEvent, QTextCharFormat, QTextCursor
+
+# Numba is optional; without it clipping falls back to NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# pyqtgraph is optional; it provides a faster interactive plot view when enabled in the config
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
 
 """
 UNH/CCOM-JHC SEG-Y File Viewer
@@ -52,12 +75,491 @@ def resource_path(relative_path):
         base_path = os.path.abspath(os.path.dirname(__file__))
     return os.path.join(base_path, relative_path)
 
+# SEG-Y data sample format codes that numpy can map directly (big-endian on disk)
+SEGY_SAMPLE_DTYPES = {
+    1: '>u4',   # 4-byte IBM floating-point (raw bits, converted by ibm_to_ieee)
+    2: '>i4',   # 4-byte two's complement integer
+    3: '>i2',   # 2-byte two's complement integer
+    5: '>f4',   # 4-byte IEEE floating-point
+    6: '>f8',   # 8-byte IEEE floating-point
+    8: 'i1',    # 1-byte two's complement integer
+    9: '>i8',   # 8-byte two's complement integer
+    10: '>u4',  # 4-byte unsigned integer
+    11: '>u2',  # 2-byte unsigned integer
+    12: '>u8',  # 8-byte unsigned integer
+    16: 'u1',   # 1-byte unsigned integer
+}
+
+def trace_data_layout(filename, segyfile):
+    """Describe where the trace samples of an open SEGY file sit on disk.
+    
+    Returns None when the samples cannot be mapped directly (e.g. 3-byte integers) or the
+    file layout does not match the headers, so the caller can fall back to segyio.
+    """
+    sample_format = int(segyfile.bin[segyio.BinField.Format])
+    sample_dtype = SEGY_SAMPLE_DTYPES.get(sample_format)
+    if sample_dtype is None:
+        return None
+    layout = {
+        'format': sample_format,
+        'dtype': sample_dtype,
+        'offset': 3600 + 3200 * segyfile.ext_headers,
+        'n_traces': segyfile.tracecount,
+        'n_samples': segyfile.samples.size,
+    }
+    trace_size = 240 + layout['n_samples'] * np.dtype(sample_dtype).itemsize
+    if layout['offset'] + layout['n_traces'] * trace_size > os.path.getsize(filename):
+        return None
+    return layout
+
+def trace_record_dtype(layout):
+    """Structured dtype of one trace described by trace_data_layout: its header, then its samples"""
+    return np.dtype([('header', TRACE_HEADER_DTYPE), ('samples', layout['dtype'], (layout['n_samples'],))])
+
+def map_trace_samples(filename, layout):
+    """Map the raw traces described by trace_data_layout as a read-only array of trace_record_dtype"""
+    return np.memmap(filename, dtype=trace_record_dtype(layout), mode='r', offset=layout['offset'],
+                     shape=(layout['n_traces'],))
+
+# Traces per preadv call; each trace takes two buffers, well under the usual IOV_MAX of 1024
+PREAD_TRACES_PER_CALL = 256
+
+def _pread_into(fd, views, offset):
+    """Fill the writable buffers in views from consecutive bytes of fd starting at offset, retrying short reads"""
+    views = [memoryview(view).cast('B') for view in views]
+    first = 0
+    while first < len(views):
+        n = os.preadv(fd, views[first:], offset)
+        if n == 0:
+            raise EOFError(f"Unexpected end of file at byte {offset}")
+        offset += n
+        # Drop the buffers that were filled and trim the one the read stopped in
+        while first < len(views) and n >= len(views[first]):
+            n -= len(views[first])
+            first += 1
+        if n:
+            views[first] = views[first][n:]
+
+def _pread_trace_block(fd, rows, start, stop, offset, record_size):
+    """Read the samples of traces start..stop-1 into rows, reading their headers into a scratch buffer"""
+    header = bytearray(240)  # Headers are read past, not kept
+    for i in range(start, stop, PREAD_TRACES_PER_CALL):
+        j = min(i + PREAD_TRACES_PER_CALL, stop)
+        views = []
+        for row in rows[i:j]:
+            views.append(header)
+            views.append(row)
+        _pread_into(fd, views, offset + i * record_size)
+
+def pread_trace_samples(filename, layout, out, n_workers=None):
+    """Read the raw samples described by trace_data_layout into out with concurrent preads.
+    
+    out is a C-contiguous (n_traces, n_samples) array with the itemsize of the sample format;
+    only the sample bytes land in it, the 240-byte trace headers go to a scratch buffer. Blocks
+    of traces are read by a thread pool (preadv releases the GIL), keeping several requests in
+    flight. Returns out viewed with the on-disk sample dtype.
+    """
+    record_size = trace_record_dtype(layout).itemsize
+    rows = out.view(np.uint8).reshape(layout['n_traces'], -1)
+    if n_workers is None:
+        n_workers = min(8, os.cpu_count() or 1)
+    per_worker = PREAD_TRACES_PER_CALL * 8
+    fd = os.open(filename, os.O_RDONLY)
+    try:
+        # Ask the kernel to start reading the whole trace section ahead asynchronously
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, layout['offset'], layout['n_traces'] * record_size, os.POSIX_FADV_WILLNEED)
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(_pread_trace_block, fd, rows, start, min(start + per_worker, layout['n_traces']),
+                                   layout['offset'], record_size)
+                       for start in range(0, layout['n_traces'], per_worker)]
+            for future in futures:
+                future.result()
+    finally:
+        os.close(fd)
+    return out.view(layout['dtype'])
+
+def ibm_to_ieee(raw, out=None, chunk=4096):
+    """Convert big-endian IBM float bit patterns of shape (n_traces, n_samples) to float32.
+    
+    Each value is (-1)**sign * 0.fraction * 16**(exponent - 64); the conversion runs over
+    blocks of chunk traces so the temporaries stay small.
+    """
+    if out is None:
+        out = np.empty(raw.shape, dtype=np.float32)
+    for i in range(0, raw.shape[0], chunk):
+        # Byte-swap a block to native uint32 (numba only accepts native byte order)
+        bits = raw[i:i + chunk].astype(np.uint32)
+        if njit is not None:
+            _ibm_to_ieee_into(bits, out[i:i + chunk])
+            continue
+        sign = np.where(bits >> 31, -1.0, 1.0)
+        exponent = ((bits >> 24) & 0x7F).astype(np.int32) - 64
+        fraction = (bits & 0x00FFFFFF).astype(np.float64)
+        out[i:i + chunk] = sign * np.ldexp(fraction, 4 * exponent - 24)
+    return out
+
+def read_trace_samples(filename, layout, headers=False):
+    """Return the trace samples described by trace_data_layout, converting IBM floats to IEEE.
+    
+    Samples numpy can use as stored are memory-mapped, so only the pages in use are resident.
+    IBM floats have to be converted into a full float32 array anyway; where the platform has
+    preadv (not Windows) their raw bits are read straight into that array and converted in place,
+    otherwise they are converted from the mapped file.
+    
+    With headers=True, returns (samples, header_records) where header_records are the mapped
+    trace headers (as TRACE_HEADER_DTYPE records), or None when the file was read with preads.
+    """
+    header_records = None
+    if layout['format'] == 1 and hasattr(os, 'preadv'):
+        data = np.empty((layout['n_traces'], layout['n_samples']), dtype=np.float32)
+        ibm_to_ieee(pread_trace_samples(filename, layout, data), out=data)
+    else:
+        records = map_trace_samples(filename, layout)
+        data = records['samples']
+        header_records = records['header']
+        if layout['format'] == 1:
+            data = ibm_to_ieee(data)
+    if headers:
+        return data, header_records
+    return data
+
+# Bump when the contents of the metadata cache change
+METADATA_CACHE_VERSION = 4
+
+# Size the cached metadata files may take together before the least recently used are removed
+METADATA_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+@lru_cache(maxsize=1)
+def user_cache_dir():
+    """Return the per-user directory for the viewer's caches, creating it on first use"""
+    path = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    if not path:
+        path = os.path.join(Path.home(), '.cache', 'segy_viewer')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def _cache_path(filename, suffix):
+    """Path in user_cache_dir for a cache of filename, keyed by its absolute path, modification time and size"""
+    st = os.stat(filename)
+    key = f"{METADATA_CACHE_VERSION}\0{os.path.abspath(filename)}\0{st.st_mtime_ns}\0{st.st_size}"
+    return os.path.join(user_cache_dir(), hashlib.sha256(key.encode('utf-8')).hexdigest() + suffix)
+
+def _prune_cache(suffix, max_bytes, reserve=0):
+    """Remove the least recently used cache files ending in suffix until they fit in max_bytes - reserve"""
+    entries = []
+    with os.scandir(user_cache_dir()) as it:
+        for entry in it:
+            if entry.name.endswith(suffix) and entry.is_file():
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+    total = reserve
+    for _, size, path in sorted(entries, reverse=True):
+        total += size
+        if total > max_bytes:
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Still mapped by an open file (Windows) or already removed
+
+def _json_default(value):
+    """Convert the numpy values in file metadata for json.dump"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot store {type(value).__name__} in the metadata cache")
+
+def read_metadata_cache(filename):
+    """Load the metadata cached for an unchanged SEGY file, or None if there is none"""
+    try:
+        path = _cache_path(filename, '.json')
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        os.utime(path)  # Mark as recently used
+        
+        # Restore the numpy arrays and BinField keys that JSON stores as lists and ints
+        file_info = cache['file_info']
+        file_info['twt'] = np.asarray(file_info['twt'])
+        stats = file_info.get('stats')
+        if stats:
+            stats['pct_levels'] = np.asarray(stats['pct_levels'])
+            stats['pct_values'] = np.asarray(stats['pct_values'])
+        cache['bin_headers'] = {segyio.BinField(key): value for key, value in cache['bin_headers']}
+        return cache
+    except Exception:
+        return None
+
+def write_metadata_cache(filename, metadata):
+    """Cache file metadata in the per-user cache directory so the next open can skip re-parsing it.
+    
+    Only plain data is stored (JSON), never anything that is executed when it is read back.
+    """
+    try:
+        path = _cache_path(filename, '.json')
+        metadata = dict(metadata, bin_headers=[[int(key), value] for key, value in metadata['bin_headers'].items()])
+        # Write a temporary file and rename it so a partial write is never read
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, default=_json_default)
+        os.replace(path + '.tmp', path)
+        _prune_cache('.json', METADATA_CACHE_MAX_BYTES)
+    except Exception as e:
+        print(f"Warning: Could not write metadata cache: {e}")
+
+# Size the cached decoded samples may take together before the least recently used are removed
+SAMPLE_CACHE_MAX_BYTES = 4 * 1024 ** 3
+
+def write_sample_cache(filename, data, interrupted=lambda: False, chunk=4096):
+    """Cache decoded trace samples in the per-user cache directory as a .npy file; returns True on success.
+    
+    Samples larger than SAMPLE_CACHE_MAX_BYTES are not cached, and the least recently used
+    entries are removed to make room. The samples are copied in blocks of chunk traces and the
+    write is abandoned, leaving no file, as soon as interrupted() returns True.
+    """
+    if data.nbytes > SAMPLE_CACHE_MAX_BYTES:
+        return False
+    try:
+        path = _cache_path(filename, '.npy')
+        _prune_cache('.npy', SAMPLE_CACHE_MAX_BYTES, reserve=data.nbytes)
+        # Write a temporary file and rename it so a partial write is never mapped
+        complete = False
+        out = np.lib.format.open_memmap(path + '.tmp', mode='w+', dtype=np.float32, shape=data.shape)
+        try:
+            for i in range(0, data.shape[0], chunk):
+                if interrupted():
+                    break
+                out[i:i + chunk] = data[i:i + chunk]
+            else:
+                out.flush()
+                complete = True
+        finally:
+            del out  # Unmap before the file is renamed or removed
+        if complete:
+            os.replace(path + '.tmp', path)
+        else:
+            os.remove(path + '.tmp')
+        return complete
+    except Exception as e:
+        print(f"Warning: Could not write sample cache: {e}")
+        return False
+
+def read_sample_cache(filename, layout):
+    """Memory-map the samples saved by write_sample_cache, or None if they are missing or do not fit the layout"""
+    try:
+        path = _cache_path(filename, '.npy')
+        data = np.load(path, mmap_mode='r')
+        os.utime(path)  # Mark as recently used
+    except Exception:
+        return None
+    if data.shape != (layout['n_traces'], layout['n_samples']) or data.dtype != np.float32:
+        return None
+    return data
+
+def _strided_sample(data, max_samples):
+    """Return about max_samples values of a (traces, samples) array as a flat copy.
+    
+    The stride is taken along the samples of every trace first, and only spills over to
+    skipping traces when it exceeds the trace length, so files with few long traces keep
+    all of their traces.
+    """
+    step = max(1, data.size // max_samples)
+    sample_step = min(step, max(1, data.shape[-1]))
+    trace_step = max(1, step // sample_step)
+    return np.ravel(data[::trace_step, ::sample_step])
+
+def estimate_percentile(data, percentile, max_samples=10_000_000):
+    """Estimate a percentile of the data without sorting or copying the whole array.
+    
+    Arrays larger than max_samples are subsampled with _strided_sample, and the value is
+    found with a linear-time partition, interpolated the same way as np.percentile.
+    """
+    flat = _strided_sample(data, max_samples)
+    pos = percentile / 100.0 * (flat.size - 1)
+    lo = int(pos)
+    hi = min(lo + 1, flat.size - 1)
+    part = np.partition(flat, [lo, hi])
+    return float(part[lo]) + (float(part[hi]) - float(part[lo])) * (pos - lo)
+
+# Percentiles cached per file: every value the clip spinbox can take plus the finer upper tail
+STATS_PERCENTILES = np.union1d(np.arange(50, 101), [99.5, 99.9])
+
+def compute_data_stats(data, chunk=4096, max_samples=10_000_000):
+    """Compute the amplitude statistics the plot needs once per file.
+    
+    Mean, std, min and max come from one pass over blocks of chunk traces, merged with
+    Chan's parallel variance update, so no temporary the size of the whole array is made.
+    The percentiles come from the same strided subsample that estimate_percentile uses,
+    except the 100th, which is the exact maximum from the pass.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    data_min = np.inf
+    data_max = -np.inf
+    for i in range(0, data.shape[0], chunk):
+        block = np.asarray(data[i:i + chunk], dtype=np.float64)
+        n = block.size
+        if n == 0:
+            continue
+        block_mean = block.mean()
+        block_m2 = np.square(block - block_mean).sum()
+        delta = block_mean - mean
+        total = count + n
+        mean += delta * n / total
+        m2 += block_m2 + delta * delta * count * n / total
+        count = total
+        data_min = min(data_min, block.min())
+        data_max = max(data_max, block.max())
+    
+    pct_values = np.percentile(_strided_sample(data, max_samples), STATS_PERCENTILES)
+    if count:
+        # The subsample can miss the true peak, so pin the 100th percentile to the exact maximum
+        pct_values[-1] = data_max
+    return {
+        'mean': float(mean),
+        'std': float(np.sqrt(m2 / count)) if count else 0.0,
+        'min': float(data_min),
+        'max': float(data_max),
+        'pct_levels': STATS_PERCENTILES,
+        'pct_values': pct_values,
+    }
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _clip_into(src, dst, lo, hi):
+        """Clip src into dst in one parallel pass over the traces"""
+        for i in prange(src.shape[0]):
+            for j in range(src.shape[1]):
+                v = src[i, j]
+                if v < lo:
+                    v = lo
+                elif v > hi:
+                    v = hi
+                dst[i, j] = v
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ibm_to_ieee_into(src, dst):
+        """Convert IBM float bit patterns in src to IEEE floats in dst, in parallel over traces"""
+        for i in prange(src.shape[0]):
+            for j in range(src.shape[1]):
+                x = src[i, j]
+                fraction = x & 0x00FFFFFF
+                if fraction == 0:
+                    dst[i, j] = 0.0
+                else:
+                    sign = -1.0 if x >> 31 else 1.0
+                    exponent = np.int32((x >> 24) & 0x7F) - 64
+                    dst[i, j] = sign * fraction * 16.0 ** exponent / 16777216.0
+
+def compute_color_limits(data, clip_enabled, clip_percentile, std_dev_enabled, std_dev_value, stats=None):
+    """Return (vm, vmin, vmax) for displaying the data without making a clipped copy"""
+    if std_dev_enabled:
+        # Clipping to mean ± (std_dev_value * std) is monotonic, so it can be applied
+        # to the color limits instead of to every sample
+        mean = stats['mean'] if stats else np.mean(data)
+        std = stats['std'] if stats else np.std(data)
+        lower_limit = mean - (std_dev_value * std)
+        upper_limit = mean + (std_dev_value * std)
+    
+    if clip_enabled:
+        if stats:
+            # Look the percentile up in the cached table instead of scanning the data
+            vm = float(np.interp(clip_percentile, stats['pct_levels'], stats['pct_values']))
+        else:
+            vm = estimate_percentile(data, clip_percentile)
+        if std_dev_enabled:
+            vm = min(max(vm, lower_limit), upper_limit)
+        vm0 = 0
+        vm1 = vm
+    else:
+        # No clipping - use full data range
+        vm0 = stats['min'] if stats else data.min()
+        vm1 = stats['max'] if stats else data.max()
+        if std_dev_enabled:
+            vm0 = max(vm0, lower_limit)
+            vm1 = min(vm1, upper_limit)
+        vm = vm1  # Set vm for return value
+    return vm, vm0, vm1
+
+def apply_std_dev_clipping(data, std_dev_value, stats=None, out=None):
+    """Clip the data to mean ± std_dev_value * std into out (allocated if None) and return it.
+    
+    A new output array is native float32 whatever the sample format, so the clipped copy never
+    takes more than 4 bytes per sample and later passes over it need no byte swapping.
+    """
+    # Calculate mean and standard deviation (reusing the per-file stats when available)
+    mean = stats['mean'] if stats else np.mean(data)
+    std = stats['std'] if stats else np.std(data)
+    
+    # Calculate clipping limits: mean ± (std_dev_value * std)
+    lower_limit = mean - (std_dev_value * std)
+    upper_limit = mean + (std_dev_value * std)
+    
+    if out is None:
+        out = np.empty(data.shape, dtype=np.float32)
+    if njit is not None and data.ndim == 2 and data.dtype.isnative:
+        _clip_into(data, out, lower_limit, upper_limit)
+    else:
+        np.clip(data, lower_limit, upper_limit, out=out)
+    return out
+
+def downsample_for_display(data, max_traces, max_samples):
+    """Reduce (n_traces, n_samples) data to at most about max_traces x max_samples cells.
+    
+    Each block keeps its maximum so amplitude peaks survive, and the array is trimmed
+    to a whole number of blocks first (less than one displayed pixel along each axis).
+    """
+    n_traces, n_samples = data.shape
+    sx = max(1, n_traces // max(1, max_traces))
+    sy = max(1, n_samples // max(1, max_samples))
+    if sx == 1 and sy == 1:
+        return data
+    n_traces, n_samples = n_traces - n_traces % sx, n_samples - n_samples % sy
+    blocks = data[:n_traces, :n_samples].reshape(n_traces // sx, sx, n_samples // sy, sy)
+    return blocks.max(axis=(1, 3))
+
+# Colormaps offered in the plot controls
+COLORMAP_NAMES = ('BuPu', 'RdBu', 'seismic', 'gray', 'viridis', 'plasma')
+
+@lru_cache(maxsize=None)
+def colormap_lut(name):
+    """Return the named matplotlib colormap as a read-only (256, 4) uint8 RGBA lookup table"""
+    lut = plt.get_cmap(name)(np.arange(256), bytes=True)
+    lut.flags.writeable = False  # Shared by every caller through the cache
+    return lut
+
+def quantize_to_rgba(data, vmin, vmax, lut, chunk=4096):
+    """Color (n_traces, n_samples) data through an 8-bit lookup table into uint8 RGBA pixels.
+    
+    Values are binned like matplotlib's 256-color colormaps (clipped to [vmin, vmax]), so
+    imshow receives finished pixels and skips its float normalize/colormap pipeline. The
+    pixels come out C-contiguous as (n_samples, n_traces, 4), the orientation imshow draws,
+    so the transpose happens block by block here instead of as a full copy inside imshow.
+    """
+    scale = lut.shape[0] / max(vmax - vmin, 1e-12)
+    rgba = np.empty((data.shape[1], data.shape[0], 4), dtype=np.uint8)
+    for i in range(0, data.shape[0], chunk):
+        index = np.clip((data[i:i + chunk] - vmin) * scale, 0, lut.shape[0] - 1).astype(np.uint8)
+        rgba[:, i:i + chunk] = lut[index.T]
+    return rgba
+
+def amplitude_colorbar(fig, ax, colormap, vmin, vmax):
+    """Add the amplitude colorbar for an image drawn from quantize_to_rgba pixels"""
+    mappable = ScalarMappable(norm=Normalize(vmin=vmin, vmax=vmax), cmap=colormap)
+    return fig.colorbar(mappable, ax=ax, label='Amplitude')
+
 class SegyConfig:
     """Configuration management for SEGY GUI settings"""
     
     def __init__(self, config_file='segy_config.json'):
         self.config_file = config_file
         self.config = self.load_config()
+        self._dirty = False
+        # Coalesce bursts of changes (e.g. spinbox ticks) into a single write
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.flush)
     
     def load_config(self):
         """Load configuration from file or create default"""
@@ -66,6 +568,7 @@ class SegyConfig:
             'last_save_directory': '',
             'last_colormap': 'BuPu',
             'last_clip_percentile': 99,
+            'plot_backend': 'matplotlib',
             'window_geometry': None
         }
         
@@ -86,28 +589,44 @@ class SegyConfig:
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
+            # Write a temporary file and rename it over the config so a crash cannot truncate it
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'w') as f:
                 json.dump(self.config, f, indent=2)
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
         except Exception as e:
             print(f"Warning: Could not save config file: {e}")
     
+    def flush(self):
+        """Write any pending configuration changes now"""
+        self._save_timer.stop()
+        if self._dirty:
+            self.save_config()
+    
     def get(self, key, default=None):
         """Get configuration value"""
         return self.config.get(key, default)
     
     def set(self, key, value):
         """Set configuration value"""
+        # Every replot re-saves its settings; only a real change needs a write
+        if key in self.config and self.config[key] == value:
+            return
         self.config[key] = value
-        self.save_config()
+        self._dirty = True
+        self._save_timer.start()
     
     def update_last_open_directory(self, directory):
         """Update last open directory"""
-        if directory and os.path.isdir(directory):
+        # The directory usually repeats from the last dialog; skip the filesystem check then
+        if directory and directory != self.config.get('last_open_directory') and os.path.isdir(directory):
             self.set('last_open_directory', directory)
     
     def update_last_save_directory(self, directory):
         """Update last save directory"""
-        if directory and os.path.isdir(directory):
+        # The directory usually repeats from the last dialog; skip the filesystem check then
+        if directory and directory != self.config.get('last_save_directory') and os.path.isdir(directory):
             self.set('last_save_directory', directory)
     
     def update_colormap(self, colormap):
@@ -119,20 +638,184 @@ class SegyConfig:
         self.set('last_clip_percentile', percentile)
 
 
+def trace_header_layout(filename, segyfile):
+    """Describe where the trace headers of an open SEGY file sit on disk, or None if unknown"""
+    sample_size = SEGY_SAMPLE_SIZES.get(int(segyfile.bin[segyio.BinField.Format]))
+    if sample_size is None:
+        return None
+    layout = {
+        'offset': 3600 + 3200 * segyfile.ext_headers,
+        'trace_size': 240 + segyfile.samples.size * sample_size,
+        'n_traces': segyfile.tracecount,
+    }
+    if layout['offset'] + layout['n_traces'] * layout['trace_size'] > os.path.getsize(filename):
+        return None
+    return layout
+
+
+class HeaderStore:
+    """Trace headers of a SEGY file, read from disk only when they are first needed"""
+    
+    def __init__(self, filename, n_traces, layout=None, view=None):
+        self.filename = filename
+        self.n_traces = n_traces
+        self.layout = layout  # From trace_header_layout; None reads through segyio instead
+        self.index = pd.RangeIndex(1, n_traces + 1)
+        self._columns = {}  # Cached header columns by field name
+        self._frame = None
+        # Header records, mapped and kept open once a single trace is looked up, or given
+        # already read by read_trace_samples(..., headers=True)
+        self._view = view
+    
+    def _open(self):
+        return segyio.open(self.filename, ignore_geometry=True, strict=False)
+    
+    def _header_view(self):
+        """Map every trace header as one strided structured array over the file"""
+        if self._view is not None:
+            return self._view
+        trace_dtype = np.dtype({'names': ['header'], 'formats': [TRACE_HEADER_DTYPE],
+                                'offsets': [0], 'itemsize': self.layout['trace_size']})
+        traces = np.memmap(self.filename, dtype=trace_dtype, mode='r',
+                           offset=self.layout['offset'], shape=(self.n_traces,))
+        self._view = traces['header']
+        return self._view
+    
+    def _read_columns(self, fields):
+        """Read the given header fields into preallocated int32 columns and cache them"""
+        fields = [name for name in fields if name not in self._columns]
+        if not fields:
+            return
+        if self.layout is not None:
+            view = self._header_view()
+            if len(fields) > 1:
+                # Copy the whole header block in one sequential read, then slice fields in memory
+                view = np.array(view)
+            for name in fields:
+                self._columns[name] = view[name].astype(np.int32)
+            return
+        headers = segyio.tracefield.keys
+        with self._open() as f:
+            for name in fields:
+                column = np.empty(self.n_traces, dtype=np.int32)
+                column[:] = f.attributes(headers[name])[:]
+                self._columns[name] = column
+    
+    def __getitem__(self, name):
+        """Return one header field for every trace"""
+        self._read_columns([name])
+        return self._columns[name]
+    
+    def trace(self, trace_number):
+        """Return the header of one trace (numbered from 1) as a Series"""
+        pos = trace_number - 1
+        if self._frame is not None:
+            # Read the row by position from the cached columns rather than through .loc
+            names = self._frame.columns
+            return pd.Series([self._columns[name][pos] for name in names], index=names,
+                             name=trace_number)
+        headers = segyio.tracefield.keys
+        if self.layout is not None:
+            # Convert the whole structured record to native ints in one pass
+            record = self._header_view()[pos]
+            return pd.Series(record.tolist(), index=TRACE_HEADER_DTYPE.names, name=trace_number)
+        with self._open() as f:
+            values = f.header[pos][list(headers.values())]
+        return pd.Series({name: values[byte] for name, byte in headers.items()}, name=trace_number)
+    
+    def to_dataframe(self):
+        """Return every header field as a DataFrame indexed by trace number"""
+        if self._frame is None:
+            headers = segyio.tracefield.keys
+            self._read_columns(headers)
+            self._frame = pd.DataFrame({name: self._columns[name] for name in headers},
+                                       index=self.index, copy=False)
+        return self._frame
+
+
+# Text header card separator and newline-to-space table, built once
+_TEXT_HDR_SPLIT = re.compile(r'C ')
+_NEWLINE_TO_SPACE = str.maketrans('\n', ' ')
+
+def parse_text_header(segyfile):
+    """Format segy text header into a readable, clean dict"""
+    try:
+        raw_header = segyio.tools.wrap(segyfile.text[0])
+        text_header = [x.translate(_NEWLINE_TO_SPACE) for x in _TEXT_HDR_SPLIT.split(raw_header)[1:]]
+        
+        # Check if we have any text header content
+        if not text_header:
+            return {"C01": "No text header found or unsupported format"}
+        
+        # Remove last 2 characters from the last item if it exists
+        if text_header[-1]:
+            text_header[-1] = text_header[-1][:-2]
+        
+        return {f"C{i:02d}": item for i, item in enumerate(text_header, 1)}
+    except Exception as e:
+        # Return a fallback header if parsing fails
+        return {"C01": f"Text header parsing failed: {str(e)}"}
+
+
 class SegyLoaderThread(QThread):
     """Thread for loading SEGY files to prevent GUI freezing"""
     progress = pyqtSignal(int)
-    finished = pyqtSignal(object, object, object, object, object)  # data, headers, text_headers, bin_headers, file_info
+    loaded = pyqtSignal()  # Results are read from the attributes below, not sent with the signal
     error = pyqtSignal(str)
     
     def __init__(self, filename):
         super().__init__()
         self.filename = filename
+        self.data = None
+        self.trace_headers = None
+        self.text_headers = None
+        self.bin_headers = None
+        self.file_info = None
+    
+    def _emit_loaded(self, data, trace_headers, text_headers, bin_headers, file_info):
+        """Store the loaded file on the thread and notify the GUI"""
+        self.data = data
+        self.trace_headers = trace_headers
+        self.text_headers = text_headers
+        self.bin_headers = bin_headers
+        self.file_info = file_info
+        self.loaded.emit()
+    
+    def _write_sample_cache(self, data):
+        """Cache decoded IBM samples for the next open, once the GUI already has the data"""
+        # IBM floats cost a full conversion pass; the copy is abandoned if the application closes
+        write_sample_cache(self.filename, data, self.isInterruptionRequested)
     
     def run(self):
         try:
             self.progress.emit(10)
             
+            # Reuse the metadata saved by an earlier open if the file has not changed since
+            cache = read_metadata_cache(self.filename)
+            if cache is not None:
+                self.progress.emit(50)
+                data = None
+                layout = cache['layout']
+                ibm = layout is not None and layout['format'] == 1
+                if ibm:
+                    # Decoded IBM samples cached by an earlier open are mapped instead of converted again
+                    data = read_sample_cache(self.filename, layout)
+                cache_samples = ibm and data is None
+                if data is None and layout is not None:
+                    data = read_trace_samples(self.filename, layout)
+                if data is None:
+                    with segyio.open(self.filename, ignore_geometry=True, strict=False) as f:
+                        data = f.trace.raw[:]
+                
+                file_info = dict(cache['file_info'], filename=os.path.basename(self.filename))
+                trace_headers = HeaderStore(self.filename, file_info['n_traces'], cache['header_layout'])
+                
+                self.progress.emit(100)
+                self._emit_loaded(data, trace_headers, cache['text_headers'], cache['bin_headers'], file_info)
+                if cache_samples:
+                    self._write_sample_cache(data)
+                return
+            
             with segyio.open(self.filename, ignore_geometry=True, strict=False) as f:
                 self.progress.emit(30)
                 
@@ -144,15 +827,26 @@ class SegyLoaderThread(QThread):
                 
                 self.progress.emit(50)
                 
-                # Load data (this might be memory intensive for large files)
-                data = f.trace.raw[:]
+                # Map the samples straight from disk (IBM floats are converted in bulk); fall back
+                # to segyio for formats numpy cannot view directly (this might be memory intensive)
+                layout = trace_data_layout(self.filename, f)
+                data = read_trace_samples(self.filename, layout) if layout is not None else None
+                if data is None:
+                    data = f.trace.raw[:]
                 
                 self.progress.emit(70)
                 
-                # Load headers
-                bin_headers = f.bin
+                # Load headers; trace headers are read lazily when a field is first requested
+                # (the binary header is copied into a plain dict so it outlives the file)
+                bin_headers = dict(f.bin)
                 text_headers = self.parse_text_header(f)
-                trace_headers = self.parse_trace_headers(f, n_traces)
+                header_layout = trace_header_layout(self.filename, f)
+                trace_headers = HeaderStore(self.filename, n_traces, header_layout)
+                
+                self.progress.emit(80)
+                
+                # Amplitude statistics are fixed per file, so compute them once here
+                stats = compute_data_stats(data)
                 
                 self.progress.emit(90)
                 
@@ -162,11 +856,23 @@ class SegyLoaderThread(QThread):
                     'n_traces': n_traces,
                     'n_samples': n_samples,
                     'sample_rate': sample_rate,
-                    'twt': twt
+                    'twt': twt,
+                    'stats': stats
                 }
                 
+                # Save what was parsed so the next open of this file can skip it
+                write_metadata_cache(self.filename, {
+                    'file_info': file_info,
+                    'layout': layout,
+                    'header_layout': header_layout,
+                    'text_headers': text_headers,
+                    'bin_headers': bin_headers,
+                })
+                
                 self.progress.emit(100)
-                self.finished.emit(data, trace_headers, text_headers, bin_headers, file_info)
+                self._emit_loaded(data, trace_headers, text_headers, bin_headers, file_info)
+                if layout is not None and layout['format'] == 1:
+                    self._write_sample_cache(data)
                 
         except Exception as e:
             error_msg = str(e)
@@ -194,39 +900,33 @@ Original error: {error_msg}"""
                 error_msg = f"SEGY file format issue:\n\n{error_msg}\n\nThe file may not conform to strict SEGY standards but could still be readable."
             self.error.emit(error_msg)
     
-    def parse_trace_headers(self, segyfile, n_traces):
-        """Parse the segy file trace headers into a pandas dataframe."""
-        headers = segyio.tracefield.keys
-        df = pd.DataFrame(index=range(1, n_traces + 1), columns=headers.keys())
-        for k, v in headers.items():
-            df[k] = segyfile.attributes(v)[:]
-        return df
-    
     def parse_text_header(self, segyfile):
         """Format segy text header into a readable, clean dict"""
+        return parse_text_header(segyfile)
+
+
+class SaveWorkerSignals(QObject):
+    """Signals a SaveWorker uses to report back to the GUI thread"""
+    finished = pyqtSignal(object)  # Return value of the save function
+    error = pyqtSignal(str)
+
+
+class SaveWorker(QRunnable):
+    """Run a function on a thread pool so long exports and data scans do not block the GUI"""
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = SaveWorkerSignals()
+    
+    def run(self):
         try:
-            raw_header = segyio.tools.wrap(segyfile.text[0])
-            cut_header = re.split(r'C ', raw_header)[1::]
-            text_header = [x.replace('\n', ' ') for x in cut_header]
-            
-            # Check if we have any text header content
-            if not text_header:
-                return {"C01": "No text header found or unsupported format"}
-            
-            # Remove last 2 characters from the last item if it exists
-            if text_header[-1]:
-                text_header[-1] = text_header[-1][:-2]
-            
-            clean_header = {}
-            i = 1
-            for item in text_header:
-                key = "C" + str(i).rjust(2, '0')
-                i += 1
-                clean_header[key] = item
-            return clean_header
+            result = self.fn(*self.args)
         except Exception as e:
-            # Return a fallback header if parsing fails
-            return {"C01": f"Text header parsing failed: {str(e)}"}
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
 
 
 class SegyPlotWidget(FigureCanvas):
@@ -243,59 +943,80 @@ class SegyPlotWidget(FigureCanvas):
         self.selected_trace_line = None  # Store reference to selected trace line
         self.trace_headers = None  # Store trace headers for lookup
         self.trace_callback = None  # Callback function for trace selection
+        self.image = None  # Store reference to the displayed (downsampled) image
+        self.display_shape = None  # Shape of the array currently handed to imshow
+        self.background = None  # Cached plot pixels for blitting the selected trace line
+        self.clip_buffer = None  # Scratch array reused by _apply_std_dev_clipping
+        self.extent_cache = {}  # (extent, y_label) per depth mode/velocity for the current file
+        self.extent_file_info = None  # File the extent cache belongs to
+        self.color_limit_cache = {}  # (vm, vmin, vmax) per clip/std-dev setting for the current data
+        self.color_limit_data = None  # Array the color limit cache belongs to
+        self.render_key = None  # (vmin, vmax, colormap, extent) of the image on screen
         
         # Connect mouse click event
         self.mpl_connect('button_press_event', self.on_click)
+        # Re-decimate the displayed image when the canvas changes size
+        self.mpl_connect('resize_event', self.on_resize)
+        # Re-capture the blit background whenever the full plot is redrawn (zoom, pan, resize)
+        self.mpl_connect('draw_event', self.on_draw)
+        
+        # Coalesce bursts of Qt resize events (e.g. dragging a splitter) into one re-render
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_resize)
         
     def plot_segy_data(self, data, file_info, trace_headers=None, clip_percentile=99, colormap='BuPu', depth_mode=False, velocity=1500.0, clip_enabled=True, std_dev_enabled=False, std_dev_value=2.0):
         """Plot SEGY data"""
+        # Settings changes for the file already on screen only need the existing image updated
+        same_data = self.image is not None and data is self.data and file_info is self.file_info
         self.data = data
         self.file_info = file_info
         self.trace_headers = trace_headers
         
+        # Calculate amplitude clipping (standard deviation limits are applied as color limits)
+        vm, vm0, vm1 = self._cached_color_limits(data, file_info, clip_enabled, clip_percentile,
+                                                 std_dev_enabled, std_dev_value)
+        
+        # Create extent for proper axis labeling
+        extent, y_label = self._compute_extent(depth_mode, velocity)
+        
+        # Settings that resolve to the picture already on screen (e.g. toggling std dev
+        # with limits wider than the data) need no redraw at all
+        render_key = (vm0, vm1, colormap, tuple(extent))
+        if same_data and render_key == self.render_key:
+            return vm, vm1
+        self.render_key = render_key
+        
+        if same_data:
+            # Update the color limits and colormap in place instead of rebuilding the figure
+            self.image.set_clim(vm0, vm1)
+            self.image.set_cmap(colormap)
+            if list(self.image.get_extent()) != extent:
+                # The vertical axis changed units (TWT/depth or velocity), so reset the view too
+                self.image.set_extent(extent)
+                self.ax.set_xlim(extent[0], extent[1])
+                self.ax.set_ylim(extent[2], extent[3])
+                self.ax.set_ylabel(y_label)
+                if self.toolbar is not None:
+                    self.toolbar.update()  # Drop zoom/pan history recorded in the old units
+            self.colorbar.update_normal(self.image)
+            self.draw_idle()
+            return vm, vm1
+        
         # Clear the entire figure to avoid colorbar issues
         self.fig.clear()
         self.ax = self.fig.add_subplot(111)
         self.colorbar = None
         self.selected_trace_line = None
+        self.background = None
         
-        # Apply standard deviation clipping if enabled
-        plot_data = data.copy()
-        if std_dev_enabled:
-            plot_data = self._apply_std_dev_clipping(plot_data, std_dev_value)
-        
-        # Calculate amplitude clipping
-        if clip_enabled:
-            vm = np.percentile(plot_data, clip_percentile)
-            vm0 = 0
-            vm1 = vm
-        else:
-            # No clipping - use full data range
-            vm0 = plot_data.min()
-            vm1 = plot_data.max()
-            vm = vm1  # Set vm for return value
-        
-        # Create extent for proper axis labeling
-        n_traces = file_info['n_traces']
-        twt = file_info['twt']
-        
-        # Convert TWT to depth if depth mode is enabled
-        if depth_mode:
-            # Convert TWT (ms) to depth (m): Depth = (TWT_ms / 1000) × Velocity_m/s / 2
-            depth = (twt / 1000.0) * velocity / 2.0
-            y_min = depth[-1]  # Last depth value (deepest)
-            y_max = depth[0]   # First depth value (shallowest)
-            y_label = 'Depth [m]'
-        else:
-            y_min = twt[-1]  # Last TWT value (deepest)
-            y_max = twt[0]   # First TWT value (shallowest)
-            y_label = 'TWT [ms]'
-        
-        extent = [1, n_traces, y_min, y_max]
-        
-        # Plot the data
-        im = self.ax.imshow(plot_data.T, cmap=colormap, vmin=vm0, vmax=vm1, 
-                           aspect='auto', extent=extent)
+        # Plot the data, reduced to roughly the axes pixel size (the full array is kept for saving)
+        display_data = self._display_data()
+        self.display_shape = display_data.shape
+        im = self.ax.imshow(display_data.T, cmap=colormap, vmin=vm0, vmax=vm1, 
+                           aspect='auto', extent=extent, interpolation='nearest')
+        self.image = im
         
         # Set labels and title
         self.ax.set_xlabel('CDP number')
@@ -308,25 +1029,92 @@ class SegyPlotWidget(FigureCanvas):
         # Reduce plot margins to maximize plot area
         self.fig.subplots_adjust(left=0.08, bottom=0.10, right=1.00, top=0.95)
         
-        # Refresh the canvas
-        self.draw()
+        # Refresh the canvas (Qt coalesces the paint)
+        self.draw_idle()
         
         return vm, vm1
     
-    def _apply_std_dev_clipping(self, data, std_dev_value):
+    def _compute_extent(self, depth_mode, velocity):
+        """Return the imshow extent and y-axis label for the current file"""
+        if self.extent_file_info is not self.file_info:
+            self.extent_file_info = self.file_info
+            self.extent_cache = {}
+        key = (True, velocity) if depth_mode else (False, None)
+        if key not in self.extent_cache:
+            n_traces = self.file_info['n_traces']
+            twt = self.file_info['twt']
+            y_min = float(twt[-1])  # Last TWT value (deepest)
+            y_max = float(twt[0])   # First TWT value (shallowest)
+            y_label = 'TWT [ms]'
+            # Convert TWT to depth if depth mode is enabled (only the end points are needed)
+            if depth_mode:
+                # Convert TWT (ms) to depth (m): Depth = (TWT_ms / 1000) × Velocity_m/s / 2
+                y_min = (y_min / 1000.0) * velocity / 2.0
+                y_max = (y_max / 1000.0) * velocity / 2.0
+                y_label = 'Depth [m]'
+            self.extent_cache[key] = ([1, n_traces, y_min, y_max], y_label)
+        extent, y_label = self.extent_cache[key]
+        return list(extent), y_label
+    
+    def resizeEvent(self, event):
+        """Defer the resize until the size has stopped changing for a moment"""
+        # Resizes sent while the base canvas is still being constructed go straight through
+        if not hasattr(self, '_resize_timer'):
+            super().resizeEvent(event)
+            return
+        self._resize_timer.start()
+    
+    def _apply_resize(self):
+        """Resize the figure to the widget's final size"""
+        super().resizeEvent(QResizeEvent(self.size(), self.size()))
+    
+    def _display_data(self):
+        """Return the data decimated to about twice the current axes size in pixels"""
+        ax_w, ax_h = self.ax.get_window_extent().size
+        return downsample_for_display(self.data, int(ax_w * 2), int(ax_h * 2))
+    
+    def on_resize(self, event):
+        """Update the displayed image to match the new canvas size"""
+        if self.data is None or self.image is None:
+            return
+        display_data = self._display_data()
+        if display_data.shape != self.display_shape:
+            self.display_shape = display_data.shape
+            self.image.set_data(display_data.T)
+    
+    def _cached_color_limits(self, data, file_info, clip_enabled, clip_percentile, std_dev_enabled, std_dev_value):
+        """Return _compute_color_limits for the data, reusing the result while only e.g. the colormap changes"""
+        if self.color_limit_data is not data:
+            self.color_limit_data = data
+            self.color_limit_cache = {}
+        key = (clip_enabled, clip_percentile, std_dev_enabled, std_dev_value)
+        if key not in self.color_limit_cache:
+            self.color_limit_cache[key] = self._compute_color_limits(
+                data, clip_enabled, clip_percentile, std_dev_enabled, std_dev_value, file_info.get('stats'))
+        return self.color_limit_cache[key]
+    
+    def color_limits_cached(self, data, clip_enabled, clip_percentile, std_dev_enabled, std_dev_value):
+        """Return True if the color limits for these settings are already cached for the data"""
+        return (self.color_limit_data is data and
+                (clip_enabled, clip_percentile, std_dev_enabled, std_dev_value) in self.color_limit_cache)
+    
+    def store_color_limits(self, data, clip_enabled, clip_percentile, std_dev_enabled, std_dev_value, limits):
+        """Cache color limits computed elsewhere (e.g. on a worker thread) for the data"""
+        if self.color_limit_data is not data:
+            self.color_limit_data = data
+            self.color_limit_cache = {}
+        self.color_limit_cache[(clip_enabled, clip_percentile, std_dev_enabled, std_dev_value)] = limits
+    
+    def _compute_color_limits(self, data, clip_enabled, clip_percentile, std_dev_enabled, std_dev_value, stats=None):
+        """Return (vm, vmin, vmax) for displaying the data without making a clipped copy"""
+        return compute_color_limits(data, clip_enabled, clip_percentile, std_dev_enabled, std_dev_value, stats)
+    
+    def _apply_std_dev_clipping(self, data, std_dev_value, stats=None):
         """Apply standard deviation clipping to the data"""
-        # Calculate mean and standard deviation
-        mean = np.mean(data)
-        std = np.std(data)
-        
-        # Calculate clipping limits: mean ± (std_dev_value * std)
-        lower_limit = mean - (std_dev_value * std)
-        upper_limit = mean + (std_dev_value * std)
-        
-        # Clip the data to these limits
-        clipped_data = np.clip(data, lower_limit, upper_limit)
-        
-        return clipped_data
+        # Clip into the scratch buffer, reallocating it only when the data shape changes
+        if self.clip_buffer is None or self.clip_buffer.shape != data.shape:
+            self.clip_buffer = np.empty(data.shape, dtype=np.float32)
+        return apply_std_dev_clipping(data, std_dev_value, stats, out=self.clip_buffer)
     
     def on_click(self, event):
         """Handle mouse click events on the plot - middle button for trace selection"""
@@ -358,20 +1146,34 @@ class SegyPlotWidget(FigureCanvas):
         if self.trace_callback:
             self.trace_callback(trace_number)
     
+    def on_draw(self, event):
+        """Cache the freshly drawn plot and draw the animated trace line on top of it"""
+        # savefig draws through a temporary canvas; only cache draws made on this widget
+        if event.canvas is not self:
+            return
+        self.background = self.copy_from_bbox(self.ax.bbox)
+        if self.selected_trace_line:
+            self.ax.draw_artist(self.selected_trace_line)
+    
     def update_selected_trace(self, trace_number):
         """Update the visual indicator for the selected trace"""
-        # Remove existing line if it exists
-        if self.selected_trace_line:
-            self.selected_trace_line.remove()
-            self.selected_trace_line = None
+        # Create the vertical line once, then only move it
+        if self.selected_trace_line is None:
+            self.selected_trace_line = self.ax.axvline(x=trace_number, color='red', 
+                                                      linewidth=2, alpha=0.8, linestyle='--',
+                                                      animated=True)
+        else:
+            self.selected_trace_line.set_xdata([trace_number, trace_number])
         
-        # Add new vertical line at the selected trace
-        twt = self.file_info['twt']
-        self.selected_trace_line = self.ax.axvline(x=trace_number, color='red', 
-                                                  linewidth=2, alpha=0.8, linestyle='--')
+        # Nothing cached yet - a full draw captures the background and draws the line
+        if self.background is None:
+            self.draw()
+            return
         
-        # Refresh the canvas
-        self.draw()
+        # Blit only the line over the cached plot instead of re-rendering the image
+        self.restore_region(self.background)
+        self.ax.draw_artist(self.selected_trace_line)
+        self.blit(self.ax.bbox)
     
     def set_trace_callback(self, callback):
         """Set the callback function to be called when a trace is selected"""
@@ -382,196 +1184,1514 @@ class SegyPlotWidget(FigureCanvas):
         if self.data is not None:
             if full_resolution:
                 # Full resolution export - match the interactive plot exactly
-                # Get current plot settings from the GUI
-                from PyQt6.QtWidgets import QApplication
-                main_window = QApplication.instance().activeWindow()
-                
-                # Get current settings
-                clip_percentile = main_window.clip_spinbox.value()
-                colormap = main_window.colormap_combo.currentText()
-                depth_mode = main_window.depth_mode_checkbox.isChecked()
-                velocity = main_window.velocity_spinbox.value()
-                clip_enabled = main_window.clip_checkbox.isChecked()
-                std_dev_enabled = main_window.std_dev_checkbox.isChecked()
-                std_dev_value = main_window.std_dev_spinbox.value()
-                
-                # Apply standard deviation clipping if enabled
-                plot_data = self.data.copy()
-                if std_dev_enabled:
-                    plot_data = self._apply_std_dev_clipping(plot_data, std_dev_value)
-                
-                # Calculate amplitude clipping (same as interactive plot)
-                if clip_enabled:
-                    vm = np.percentile(plot_data, clip_percentile)
-                    vm0 = 0
-                    vm1 = vm
-                else:
-                    # No clipping - use full data range
-                    vm0 = plot_data.min()
-                    vm1 = plot_data.max()
-                
-                # Create extent for proper axis labeling (same as interactive plot)
-                n_traces = self.file_info['n_traces']
-                twt = self.file_info['twt']
-                
-                # Convert TWT to depth if depth mode is enabled
-                if depth_mode:
-                    # Convert TWT (ms) to depth (m): Depth = (TWT_ms / 1000) × Velocity_m/s / 2
-                    depth = (twt / 1000.0) * velocity / 2.0
-                    y_min = depth[-1]  # Last depth value (deepest)
-                    y_max = depth[0]   # First depth value (shallowest)
-                    y_label = 'Depth [m]'
-                else:
-                    y_min = twt[-1]  # Last TWT value (deepest)
-                    y_max = twt[0]   # First TWT value (shallowest)
-                    y_label = 'TWT [ms]'
-                
-                extent = [1, n_traces, y_min, y_max]
-                
-                # Calculate figure size based on data dimensions
-                data_shape = self.data.shape
-                fig_width = max(12, data_shape[1] * 0.01)  # Scale width by number of traces
-                fig_height = max(8, data_shape[0] * 0.002)  # Scale height by number of samples
-                
-                # Create a new figure for full resolution export
-                import matplotlib.pyplot as plt
-                fig, ax = plt.subplots(figsize=(fig_width, fig_height), dpi=300)
-                
-                # Plot the full data with same settings as interactive plot
-                im = ax.imshow(plot_data.T, cmap=colormap, vmin=vm0, vmax=vm1, 
-                              aspect='auto', extent=extent)
-                
-                # Add labels and title (same as interactive plot)
-                ax.set_xlabel('CDP number')
-                ax.set_ylabel(y_label)
-                ax.set_title(f'{self.file_info["filename"]} (Full Resolution)')
-                
-                # Add colorbar (same as interactive plot)
-                plt.colorbar(im, ax=ax, label='Amplitude')
-                
-                # Save with high quality settings
-                fig.savefig(filename, dpi=300, bbox_inches='tight', 
-                           facecolor='white', edgecolor='none')
-                plt.close(fig)  # Close the figure to free memory
+                fn, args = self.full_resolution_export(filename)
+                fn(*args)
             else:
                 # Normal export - use current display
-                self.fig.savefig(filename, dpi=300, bbox_inches='tight')
-
-
-class ClickableTextEdit(QTextEdit):
-    """Custom QTextEdit that handles clicks on field names"""
+                # The animated trace line is skipped by savefig unless it is made static for the save
+                if self.selected_trace_line:
+                    self.selected_trace_line.set_animated(False)
+                try:
+                    self.fig.savefig(filename, dpi=300, bbox_inches='tight')
+                finally:
+                    if self.selected_trace_line:
+                        self.selected_trace_line.set_animated(True)
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.parent_gui = parent
+    def full_resolution_export(self, filename):
+        """Return (fn, args) that write the current data at full resolution to filename.
+        
+        The settings are read from the GUI here; fn only uses its arguments and an
+        offscreen Agg figure, so it may be run on a worker thread.
+        """
+        # Get current plot settings from the GUI
+        main_window = QApplication.instance().activeWindow()
+        colormap = main_window.colormap_combo.currentText()
+        depth_mode = main_window.depth_mode_checkbox.isChecked()
+        velocity = main_window.velocity_spinbox.value()
+        limit_args = (main_window.clip_checkbox.isChecked(), main_window.clip_spinbox.value(),
+                      main_window.std_dev_checkbox.isChecked(), main_window.std_dev_spinbox.value())
+        
+        # Create extent for proper axis labeling (same as interactive plot)
+        extent, y_label = self._compute_extent(depth_mode, velocity)
+        return self._write_full_resolution_plot, (filename, self.data, self.file_info, extent,
+                                                  y_label, colormap, limit_args)
     
-    def mousePressEvent(self, event):
-        """Handle mouse press events to detect clicks on field names"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            # Get the cursor position and check if it's over a link
-            cursor = self.cursorForPosition(event.pos())
-            cursor.select(cursor.SelectionType.WordUnderCursor)
-            selected_text = cursor.selectedText()
+    def _write_full_resolution_plot(self, filename, data, file_info, extent, y_label, colormap, limit_args):
+        """Render data to filename on an offscreen figure scaled to the data dimensions"""
+        # Calculate amplitude clipping (same as interactive plot)
+        vm, vm0, vm1 = self._compute_color_limits(data, *limit_args, file_info.get('stats'))
+        
+        # Calculate figure size based on data dimensions
+        n_rows, n_cols = data.shape
+        fig_width = max(12, n_cols * 0.01)  # Scale width by number of traces
+        fig_height = max(8, n_rows * 0.002)  # Scale height by number of samples
+        
+        # Create a new figure for full resolution export, rendered by Agg directly
+        # instead of through the interactive Qt backend. The tight layout is applied while
+        # drawing, so saving needs no bbox_inches='tight' pre-render of the whole figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=(fig_width, fig_height), dpi=300, layout='tight')
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        
+        # Plot the full data with same settings as interactive plot, colored to 8-bit pixels up front
+        rgba = quantize_to_rgba(data, vm0, vm1, colormap_lut(colormap))
+        ax.imshow(rgba, aspect='auto', extent=extent)
+        
+        # Add labels and title (same as interactive plot)
+        ax.set_xlabel('CDP number')
+        ax.set_ylabel(y_label)
+        ax.set_title(f'{file_info["filename"]} (Full Resolution)')
+        
+        # Add colorbar (same as interactive plot)
+        amplitude_colorbar(fig, ax, colormap, vm0, vm1)
+        
+        # Save with high quality settings (the figure is not registered with pyplot,
+        # so it is freed once it goes out of scope)
+        fig.savefig(filename, dpi=300, facecolor='white', edgecolor='none')
+        return filename
+
+
+if pg is not None:
+    class SegyPlotWidgetPG(pg.ImageView):
+        """pyqtgraph view of SEGY data for fast interactive pan and zoom"""
+        
+        def __init__(self, parent=None):
+            super().__init__(parent, view=pg.PlotItem())
+            self.ui.roiBtn.hide()
+            self.ui.menuBtn.hide()
+            self.view.invertY(True)  # Shallowest samples at the top, as in the matplotlib plot
+            self.data = None
+            self.file_info = None
+            self.trace_headers = None
+            self.trace_callback = None
+            self.plot_args = None  # Arguments of the last plot, replayed for saving
+            self.render_key = None  # (vmin, vmax, colormap, depth mode, velocity) of the image shown
+            
+            # Dashed vertical line marking the selected trace
+            self.selected_trace_line = pg.InfiniteLine(
+                angle=90, movable=False,
+                pen=pg.mkPen('r', width=2, style=Qt.PenStyle.DashLine))
+            self.selected_trace_line.hide()
+            self.view.addItem(self.selected_trace_line)
+            
+            # Saving and the color-limit helpers use an offscreen matplotlib widget
+            self.mpl_widget = SegyPlotWidget()
+            
+            # Middle-click selects a trace, as in the matplotlib view
+            self.view.scene().sigMouseClicked.connect(self.on_click)
+        
+        def plot_segy_data(self, data, file_info, trace_headers=None, clip_percentile=99, colormap='BuPu', depth_mode=False, velocity=1500.0, clip_enabled=True, std_dev_enabled=False, std_dev_value=2.0):
+            """Plot SEGY data"""
+            same_data = data is self.data and file_info is self.file_info
+            self.data = data
+            self.file_info = file_info
+            self.trace_headers = trace_headers
+            self.plot_args = (data, file_info, trace_headers, clip_percentile, colormap, depth_mode,
+                              velocity, clip_enabled, std_dev_enabled, std_dev_value)
+            
+            vm, vm0, vm1 = self._cached_color_limits(data, file_info, clip_enabled, clip_percentile,
+                                                     std_dev_enabled, std_dev_value)
+            
+            # Settings that resolve to the image already shown need no new setImage
+            render_key = (vm0, vm1, colormap, depth_mode, velocity if depth_mode else None)
+            if same_data and render_key == self.render_key:
+                return vm, vm1
+            self.render_key = render_key
+            
+            # Same axis extent as the matplotlib plot
+            n_traces = file_info['n_traces']
+            twt = file_info['twt']
+            if depth_mode:
+                # Convert TWT (ms) to depth (m): Depth = (TWT_ms / 1000) × Velocity_m/s / 2
+                y = (twt / 1000.0) * velocity / 2.0
+                y_label = 'Depth [m]'
+            else:
+                y = twt
+                y_label = 'TWT [ms]'
+            n_samples = data.shape[1]
             
-            # Check if the selected text is a field name
-            clickable_fields = ['JobID', 'LineNumber', 'ReelNumber', 'Traces', 'AuxTraces', 
-                              'Interval', 'IntervalOriginal', 'Samples', 'SamplesOriginal', 
-                              'Format', 'EnsembleFold', 'SortingCode', 'VerticalSum', 
-                              'SweepFrequencyStart', 'SweepFrequencyEnd', 'SweepLength', 
-                              'Sweep', 'SweepChannel', 'SweepTaperStart', 'SweepTaperEnd', 
-                              'Taper', 'CorrelatedTraces', 'BinaryGainRecovery', 
-                              'AmplitudeRecovery', 'MeasurementSystem', 'ImpulseSignalPolarity', 
-                              'VibratoryPolarity', 'ExtAuxTraces', 'ExtSamples', 
-                              'ExtSamplesOriginal', 'ExtEnsembleFold', 'SEGYRevision', 
-                              'SEGYRevisionMinor', 'TraceFlag', 'ExtendedHeaders',
-                              'MaxAdditionalTraceHeaders', 'TimeBasis', 'AdditionalTraceHeaderBytes',
-                              'ByteOffset', 'AdditionalTraceHeaderSamples']
+            # pyqtgraph's default axis order is (x, y), which matches the (traces, samples) data
+            self.setImage(data, levels=(vm0, vm1), autoLevels=False, autoRange=False,
+                          pos=(1, y[0]), scale=(max(n_traces - 1, 1) / n_traces, (y[-1] - y[0]) / n_samples))
             
-            # Trace header fields
-            trace_header_fields = ['TRACE_SEQUENCE_LINE', 'TRACE_SEQUENCE_FILE', 'FieldRecord', 
-                                 'TraceNumber', 'EnergySourcePoint', 'CDP', 'CDP_TRACE', 
-                                 'TraceIdentificationCode', 'NSummedTraces', 'NStackedTraces', 
-                                 'DataUse', 'offset', 'ReceiverGroupElevation', 'SourceSurfaceElevation', 
-                                 'SourceDepth', 'ReceiverDatumElevation', 'SourceDatumElevation', 
-                                 'SourceWaterDepth', 'GroupWaterDepth', 'ElevationScalar', 
-                                 'SourceGroupScalar', 'SourceX', 'SourceY', 'GroupX', 'GroupY', 
-                                 'CoordinateUnits', 'WeatheringVelocity', 'SubWeatheringVelocity', 
-                                 'SourceUpholeTime', 'GroupUpholeTime', 'SourceStaticCorrection', 
-                                 'GroupStaticCorrection', 'TotalStaticApplied', 'LagTimeA', 'LagTimeB', 
-                                 'DelayRecordingTime', 'MuteTimeStart', 'MuteTimeEND', 
-                                 'TRACE_SAMPLE_COUNT', 'TRACE_SAMPLE_INTERVAL', 'GainType', 
-                                 'InstrumentGainConstant', 'InstrumentInitialGain', 'Correlated', 
-                                 'SweepFrequencyStart', 'SweepFrequencyEnd', 'SweepLength', 
-                                 'SweepType', 'SweepTraceTaperLengthStart', 'SweepTraceTaperLengthEnd', 
-                                 'TaperType', 'AliasFilterFrequency', 'AliasFilterSlope', 
-                                 'NotchFilterFrequency', 'NotchFilterSlope', 'LowCutFrequency', 
-                                 'HighCutFrequency', 'LowCutSlope', 'HighCutSlope', 'YearDataRecorded', 
-                                 'DayOfYear', 'HourOfDay', 'MinuteOfHour', 'SecondOfMinute', 
-                                 'TimeBaseCode', 'TraceWeightingFactor', 'GeophoneGroupNumberRoll1', 
-                                 'GeophoneGroupNumberFirstTraceOrigField', 'GeophoneGroupNumberLastTraceOrigField', 
-                                 'GapSize', 'OverTravel', 'CDP_X', 'CDP_Y', 'INLINE_3D', 'CROSSLINE_3D', 
-                                 'ShotPoint', 'ShotPointScalar', 'TraceValueMeasurementUnit']
+            # Build the colormap from the cached lookup table of the matplotlib one of the same name
+            self.setColorMap(pg.ColorMap(np.linspace(0.0, 1.0, 256), colormap_lut(colormap)))
             
-            all_clickable_fields = clickable_fields + trace_header_fields
+            self.view.setLabel('bottom', 'CDP number')
+            self.view.setLabel('left', y_label)
+            self.view.setTitle(f'{file_info["filename"]}')
+            self.selected_trace_line.hide()
+            self.view.autoRange()
             
-            if selected_text in all_clickable_fields and self.parent_gui:
-                if selected_text in trace_header_fields:
-                    self.parent_gui.show_trace_field_description(selected_text)
-                else:
-                    self.parent_gui.show_field_description(selected_text)
-                return
+            return vm, vm1
         
-        super().mousePressEvent(event)
-
-
-class SegyGui(QMainWindow):
-    """Main GUI window for SEGY file viewer"""
-    
-    def __init__(self):
-        super().__init__()
-        self.config = SegyConfig()
-        self.current_data = None
-        self.current_headers = None
-        self.current_text_headers = None
-        self.current_bin_headers = None
-        self.current_file_info = None
-        self.current_trace_number = 1  # Track current selected trace
-        self.show_byte_locations = False  # Track byte location display state
-        self.depth_mode = False  # Track if depth mode is enabled
-        self.velocity = 1500.0  # Default velocity in m/s
-        self.init_ui()
+        def _compute_color_limits(self, *args, **kwargs):
+            """Return (vm, vmin, vmax) for displaying the data without making a clipped copy"""
+            return self.mpl_widget._compute_color_limits(*args, **kwargs)
         
-    def init_ui(self):
-        """Initialize the user interface"""
-        self.setWindowTitle(f'UNH/CCOM-JHC SEG-Y File Viewer v{__version__} - pjohnson@ccom.unh.edu')
-        self.setGeometry(100, 100, 1400, 900)
+        def _cached_color_limits(self, *args, **kwargs):
+            """Return the color limits, reusing the offscreen widget's cache"""
+            return self.mpl_widget._cached_color_limits(*args, **kwargs)
         
-        # Create central widget and main layout
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QVBoxLayout(central_widget)
+        def color_limits_cached(self, *args):
+            """Return True if the offscreen widget has the color limits cached"""
+            return self.mpl_widget.color_limits_cached(*args)
         
-        # Create controls panel
-        controls_panel = self.create_controls_panel()
-        main_layout.addWidget(controls_panel)
+        def store_color_limits(self, *args):
+            """Cache color limits computed elsewhere in the offscreen widget"""
+            self.mpl_widget.store_color_limits(*args)
         
-        # Create splitter for main content
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        main_layout.addWidget(splitter)
+        def _apply_std_dev_clipping(self, *args, **kwargs):
+            """Apply standard deviation clipping to the data"""
+            return self.mpl_widget._apply_std_dev_clipping(*args, **kwargs)
         
-        # Create plot widget container with toolbar
-        plot_container = QWidget()
-        plot_layout = QVBoxLayout(plot_container)
-        plot_layout.setContentsMargins(0, 0, 0, 0)
+        def on_click(self, event):
+            """Handle mouse click events on the plot - middle button for trace selection"""
+            if event.button() != Qt.MouseButton.MiddleButton or self.data is None:
+                return
+            
+            # Convert the click to data coordinates and then to a trace number (CDP number)
+            pos = self.view.vb.mapSceneToView(event.scenePos())
+            trace_number = int(round(pos.x()))
+            
+            # Validate trace number
+            if trace_number < 1 or trace_number > self.file_info['n_traces']:
+                return
+            
+            # Update visual feedback
+            self.update_selected_trace(trace_number)
+            
+            # Call the callback function if it exists
+            if self.trace_callback:
+                self.trace_callback(trace_number)
+        
+        def update_selected_trace(self, trace_number):
+            """Update the visual indicator for the selected trace"""
+            self.selected_trace_line.setValue(trace_number)
+            self.selected_trace_line.show()
+        
+        def set_trace_callback(self, callback):
+            """Set the callback function to be called when a trace is selected"""
+            self.trace_callback = callback
+        
+        def save_plot(self, filename, full_resolution=False):
+            """Save the current plot to file through the matplotlib widget"""
+            if self.plot_args is None:
+                return
+            self.mpl_widget.plot_segy_data(*self.plot_args)
+            if self.selected_trace_line.isVisible():
+                self.mpl_widget.update_selected_trace(int(self.selected_trace_line.value()))
+            self.mpl_widget.save_plot(filename, full_resolution=full_resolution)
+        
+        def full_resolution_export(self, filename):
+            """Return (fn, args) that write the full resolution plot through the matplotlib widget"""
+            self.mpl_widget.plot_segy_data(*self.plot_args)
+            return self.mpl_widget.full_resolution_export(filename)
+
+
+# Binary header fields drawn as clickable (underlined) names in the Headers panel
+_CLICKABLE_BIN_FIELDS = frozenset(['JobID', 'LineNumber', 'ReelNumber', 'Traces', 'AuxTraces', 
+                                   'Interval', 'IntervalOriginal', 'Samples', 'SamplesOriginal', 
+                                   'Format', 'EnsembleFold', 'SortingCode', 'VerticalSum', 
+                                   'SweepFrequencyStart', 'SweepFrequencyEnd', 'SweepLength', 
+                                   'Sweep', 'SweepChannel', 'SweepTaperStart', 'SweepTaperEnd', 
+                                   'Taper', 'CorrelatedTraces', 'BinaryGainRecovery', 
+                                   'AmplitudeRecovery', 'MeasurementSystem', 'ImpulseSignalPolarity', 
+                                   'VibratoryPolarity', 'ExtAuxTraces', 'ExtSamples', 
+                                   'ExtSamplesOriginal', 'ExtEnsembleFold', 'SEGYRevision', 
+                                   'SEGYRevisionMinor', 'TraceFlag', 'ExtendedHeaders'])
+
+# Header field names that ClickableTextEdit turns into description lookups
+_BIN_FIELDS = _CLICKABLE_BIN_FIELDS | frozenset(['MaxAdditionalTraceHeaders', 'TimeBasis',
+                                                 'AdditionalTraceHeaderBytes', 'ByteOffset',
+                                                 'AdditionalTraceHeaderSamples'])
+
+_TRACE_FIELDS = frozenset(['TRACE_SEQUENCE_LINE', 'TRACE_SEQUENCE_FILE', 'FieldRecord', 
+                           'TraceNumber', 'EnergySourcePoint', 'CDP', 'CDP_TRACE', 
+                           'TraceIdentificationCode', 'NSummedTraces', 'NStackedTraces', 
+                           'DataUse', 'offset', 'ReceiverGroupElevation', 'SourceSurfaceElevation', 
+                           'SourceDepth', 'ReceiverDatumElevation', 'SourceDatumElevation', 
+                           'SourceWaterDepth', 'GroupWaterDepth', 'ElevationScalar', 
+                           'SourceGroupScalar', 'SourceX', 'SourceY', 'GroupX', 'GroupY', 
+                           'CoordinateUnits', 'WeatheringVelocity', 'SubWeatheringVelocity', 
+                           'SourceUpholeTime', 'GroupUpholeTime', 'SourceStaticCorrection', 
+                           'GroupStaticCorrection', 'TotalStaticApplied', 'LagTimeA', 'LagTimeB', 
+                           'DelayRecordingTime', 'MuteTimeStart', 'MuteTimeEND', 
+                           'TRACE_SAMPLE_COUNT', 'TRACE_SAMPLE_INTERVAL', 'GainType', 
+                           'InstrumentGainConstant', 'InstrumentInitialGain', 'Correlated', 
+                           'SweepFrequencyStart', 'SweepFrequencyEnd', 'SweepLength', 
+                           'SweepType', 'SweepTraceTaperLengthStart', 'SweepTraceTaperLengthEnd', 
+                           'TaperType', 'AliasFilterFrequency', 'AliasFilterSlope', 
+                           'NotchFilterFrequency', 'NotchFilterSlope', 'LowCutFrequency', 
+                           'HighCutFrequency', 'LowCutSlope', 'HighCutSlope', 'YearDataRecorded', 
+                           'DayOfYear', 'HourOfDay', 'MinuteOfHour', 'SecondOfMinute', 
+                           'TimeBaseCode', 'TraceWeightingFactor', 'GeophoneGroupNumberRoll1', 
+                           'GeophoneGroupNumberFirstTraceOrigField', 'GeophoneGroupNumberLastTraceOrigField', 
+                           'GapSize', 'OverTravel', 'CDP_X', 'CDP_Y', 'INLINE_3D', 'CROSSLINE_3D', 
+                           'ShotPoint', 'ShotPointScalar', 'TraceValueMeasurementUnit'])
+
+
+# Map segyio binary header field names to get_binary_header_decoder keys
+_BIN_FIELD_MAPPINGS = {
+    'JobID': 'JobIdentificationNumber',
+    'LineNumber': 'LineNumber',
+    'ReelNumber': 'ReelNumber',
+    'Traces': 'NumberOfDataTracesPerRecord',
+    'AuxTraces': 'NumberOfAuxiliaryTracesPerRecord',
+    'Interval': 'SampleIntervalInMicroseconds',
+    'IntervalOriginal': 'SampleIntervalInMicrosecondsOfOriginalFieldRecording',
+    'Samples': 'NumberOfSamplesPerDataTrace',
+    'SamplesOriginal': 'NumberOfSamplesPerDataTraceForOriginalFieldRecording',
+    'Format': 'DataSampleFormat',
+    'EnsembleFold': 'EnsembleFold',
+    'SortingCode': 'TraceSortingCode',
+    'VerticalSum': 'VerticalSumCode',
+    'SweepFrequencyStart': 'SweepFrequencyAtStart',
+    'SweepFrequencyEnd': 'SweepFrequencyAtEnd',
+    'SweepLength': 'SweepLengthInMilliseconds',
+    'Sweep': 'SweepTypeCode',
+    'SweepChannel': 'SweepChannelNumber',
+    'SweepTaperStart': 'SweepTraceTaperLengthAtStartInMilliseconds',
+    'SweepTaperEnd': 'SweepTraceTaperLengthAtEndInMilliseconds',
+    'Taper': 'TaperType',
+    'CorrelatedTraces': 'CorrelatedDataTraces',
+    'BinaryGainRecovery': 'BinaryGainRecovered',
+    'AmplitudeRecovery': 'AmplitudeRecoveryMethod',
+    'MeasurementSystem': 'MeasurementSystem',
+    'ImpulseSignalPolarity': 'ImpulseSignalPolarity',
+    'VibratoryPolarity': 'VibratoryPolarityCode',
+    'ExtAuxTraces': 'ExtendedNumberOfAuxiliaryTracesPerRecord',
+    'ExtSamples': 'ExtendedNumberOfSamplesPerDataTrace',
+    'ExtSamplesOriginal': 'ExtendedNumberOfSamplesPerDataTraceForOriginalFieldRecording',
+    'ExtEnsembleFold': 'ExtendedEnsembleFold',
+    'SEGYRevision': 'SEGYFormatRevisionNumber',
+    'SEGYRevisionMinor': 'SEGYFormatRevisionNumberMinor',
+    'TraceFlag': 'FixedLengthTraceFlag',
+    'ExtendedHeaders': 'NumberOfExtendedTextualFileHeaderRecords'
+}
+
+# The same mapping keyed by the segyio.BinField members themselves. BinField is a plain class
+# of int attributes rather than an iterable enum, and its instances hash and compare by that int
+_BIN_FIELD_ENUM_TO_DECODER_KEY = {segyio.BinField(value): _BIN_FIELD_MAPPINGS[name]
+                                  for name, value in vars(segyio.BinField).items()
+                                  if isinstance(value, int) and name in _BIN_FIELD_MAPPINGS}
+
+# Display name of every segyio.BinField member, so rendering never calls str() on the keys
+_BIN_FIELD_NAMES = {field: str(field) for field in
+                    (segyio.BinField(value) for value in vars(segyio.BinField).values()
+                     if isinstance(value, int))}
+
+# Byte location mappings for SEG-Y Rev 2.0 (from segy_binheader.xlsx)
+_BIN_BYTE_LOCATIONS = {
+    'JobID': '3201–3204: Job identification number.',
+    'LineNumber': '3205–3208: Line number. For 3-D poststack data, this will typically contain the in-line number.',
+    'ReelNumber': '3209–3212: Reel number.',
+    'Traces': '3213–3214: Number of data traces per ensemble. Mandatory for prestack data.',
+    'AuxTraces': '3215–3216: Number of auxiliary traces per ensemble. Mandatory for prestack data.',
+    'Interval': '3217–3218: Sample interval. Microseconds (µs) for time data, Hertz (Hz) for frequency data, meters (m) or feet (ft) for depth data.',
+    'IntervalOriginal': '3219–3220: Sample interval of original field recording. Microseconds (µs) for time data, Hertz (Hz) for frequency data, meters (m) or feet (ft) for depth data.',
+    'Samples': '3221–3222: Number of samples per data trace. Note: The sample interval and number of samples in the Binary File Header should be for the primary set of seismic data traces in the file.',
+    'SamplesOriginal': '3223–3224: Number of samples per data trace for original field recording.',
+    'Format': '3225–3226: Data sample format code. Mandatory for all data. These formats are described in Appendix E.',
+    'EnsembleFold': '3227–3228: Ensemble fold — The expected number of data traces per trace ensemble (e.g. the CMP fold).',
+    'SortingCode': '3229–3230: Trace sorting code (i.e. type of ensemble)',
+    'VerticalSum': '3231–3232: Vertical sum code: 1 = no sum, 2 = two sum, …, N = M–1 sum (M = 2 to 32,767)',
+    'SweepFrequencyStart': '3233–3234: Sweep frequency at start (Hz).',
+    'SweepFrequencyEnd': '3235–3236: Sweep frequency at end (Hz).',
+    'SweepLength': '3237–3238: Sweep length (ms).',
+    'Sweep': '3239–3240: Sweep type code: 1 = linear, 2 = parabolic, 3 = exponential, 4 = other',
+    'SweepChannel': '3241–3242: Trace number of sweep channel.',
+    'SweepTaperStart': '3243–3244: Sweep trace taper length in milliseconds at start if tapered (the taper starts at zero time and is effective for this length).',
+    'SweepTaperEnd': '3245–3246: Sweep trace taper length in milliseconds at end (the ending taper starts at sweep length minus the taper length at end).',
+    'Taper': '3247–3248: Taper type: 1 = linear, 2 = cosine squared, 3 = other',
+    'CorrelatedTraces': '3249–3250: Correlated data traces: 1 = no, 2 = yes',
+    'BinaryGainRecovery': '3251–3252: Binary gain recovered: 1 = yes, 2 = no',
+    'AmplitudeRecovery': '3253–3254: Amplitude recovery method: 1 = none, 2 = spherical divergence, 3 = AGC, 4 = other',
+    'MeasurementSystem': '3255–3256: Measurement system: 1 = Meters, 2 = Feet',
+    'ImpulseSignalPolarity': '3257–3258: Impulse signal polarity',
+    'VibratoryPolarity': '3259–3260: Vibratory polarity code',
+    'ExtAuxTraces': '3261–3264: Extended number of data traces per ensemble. If nonzero, this overrides the number of data traces per ensemble in bytes 3213–3214.',
+    'ExtSamples': '3265–3268: Extended number of auxiliary traces per ensemble. If nonzero, this overrides the number of auxiliary traces per ensemble in bytes 3215–3216.',
+    'ExtSamplesOriginal': '3269–3272: Extended number of samples per data trace. If nonzero, this overrides the number of samples per data trace in bytes 3221–3222.',
+    'ExtEnsembleFold': '3273–3280: Extended sample interval, IEEE double precision (64-bit). If nonzero, this overrides the sample interval in bytes 3217–3218 with the same units.',
+    'SEGYRevision': '3501: Major SEG-Y Format Revision Number. This is an 8-bit unsigned value. Thus for SEG-Y Revision 2.0, as defined in this document, this will be recorded as 0216.',
+    'SEGYRevisionMinor': '3502: Minor SEG-Y Format Revision Number. This is an 8-bit unsigned value with a radix point between the first and second bytes. Thus for SEG-Y Revision 2.0, as defined in this document, this will be recorded as 0016.',
+    'TraceFlag': '3503–3504: Fixed length trace flag. A value of one indicates that all traces in this SEG-Y file are guaranteed to have the same sample interval, number of trace header blocks and trace samples.',
+    'ExtendedHeaders': '3505–3506: Number of 3200-byte, Extended Textual File Header records following the Binary Header.',
+    # Additional SEG-Y Rev 2.0 fields
+    'MaxAdditionalTraceHeaders': '3507–3510: Maximum number of additional 240 byte trace headers. A value of zero indicates there are no additional 240 byte trace headers.',
+    'TimeBasis': '3511–3512: Time basis code: 1 = Local, 2 = GMT (Greenwich Mean Time), 3 = Other, 4 = UTC (Coordinated Universal Time), 5 = GPS (Global Positioning System Time)',
+    'AdditionalTraceHeaderBytes': '3513–3520: Number of traces in this file or stream. (64-bit unsigned integer value) If zero, all bytes in the file or stream are part of this SEG-Y dataset.',
+    'ByteOffset': '3521–3528: Byte offset of first trace relative to start of file or stream if known, otherwise zero. (64-bit unsigned integer value)',
+    'AdditionalTraceHeaderSamples': '3529–3532: Number of 3200-byte data trailer stanza records following the last trace (4 byte signed integer). A value of 0 indicates there are no trailer records.'
+}
+
+# Binary header field values with descriptions based on SEG-Y Rev 2.0
+_BINARY_HEADER_DECODER = {
+    # Data sample format code (bytes 3225-3226)
+    'DataSampleFormat': {
+        1: '4-byte IBM floating-point',
+        2: '4-byte, two\'s complement integer',
+        3: '2-byte, two\'s complement integer',
+        4: '4-byte fixed-point with gain (obsolete)',
+        5: '4-byte IEEE floating-point',
+        6: '8-byte IEEE floating-point',
+        7: '3-byte two\'s complement integer',
+        8: '1-byte, two\'s complement integer',
+        9: '8-byte, two\'s complement integer',
+        10: '4-byte, unsigned integer',
+        11: '2-byte, unsigned integer',
+        12: '8-byte, unsigned integer',
+        15: '3-byte, unsigned integer',
+        16: '1-byte, unsigned integer'
+    },
+    
+    # Trace sorting code (bytes 3229-3230)
+    'TraceSortingCode': {
+        -1: 'Other (should be explained in Extended Textual File Header)',
+        0: 'Unknown',
+        1: 'As recorded (no sorting)',
+        2: 'CDP ensemble',
+        3: 'Single fold continuous profile',
+        4: 'Horizontally stacked',
+        5: 'Common source point',
+        6: 'Common receiver point',
+        7: 'Common offset point',
+        8: 'Common mid-point',
+        9: 'Common conversion point'
+    },
+    
+    # Sweep type code (bytes 3239-3240)
+    'SweepTypeCode': {
+        1: 'Linear',
+        2: 'Parabolic',
+        3: 'Exponential',
+        4: 'Other'
+    },
+    
+    # Taper type (bytes 3247-3248)
+    'TaperType': {
+        1: 'Linear',
+        2: 'Cosine squared',
+        3: 'Other'
+    },
+    
+    # Correlated data traces (bytes 3249-3250)
+    'CorrelatedDataTraces': {
+        1: 'No',
+        2: 'Yes'
+    },
+    
+    # Binary gain recovered (bytes 3251-3252)
+    'BinaryGainRecovered': {
+        1: 'Yes',
+        2: 'No'
+    },
+    
+    # Amplitude recovery method (bytes 3253-3254)
+    'AmplitudeRecoveryMethod': {
+        1: 'None',
+        2: 'Spherical divergence',
+        3: 'AGC',
+        4: 'Other'
+    },
+    
+    # Measurement system (bytes 3255-3256)
+    'MeasurementSystem': {
+        1: 'Meters',
+        2: 'Feet'
+    },
+    
+    # Impulse signal polarity (bytes 3257-3258)
+    'ImpulseSignalPolarity': {
+        1: 'Increase in pressure or upward geophone case movement gives negative number on trace',
+        2: 'Increase in pressure or upward geophone case movement gives positive number on trace'
+    },
+    
+    # Vibratory polarity code (bytes 3259-3260)
+    'VibratoryPolarityCode': {
+        1: 'Seismic signal lags pilot signal by 337.5° to 22.5°',
+        2: 'Seismic signal lags pilot signal by 22.5° to 67.5°',
+        3: 'Seismic signal lags pilot signal by 67.5° to 112.5°',
+        4: 'Seismic signal lags pilot signal by 112.5° to 157.5°',
+        5: 'Seismic signal lags pilot signal by 157.5° to 202.5°',
+        6: 'Seismic signal lags pilot signal by 202.5° to 247.5°',
+        7: 'Seismic signal lags pilot signal by 247.5° to 292.5°',
+        8: 'Seismic signal lags pilot signal by 292.5° to 337.5°'
+    },
+    
+    # Time basis code (bytes 3511-3512)
+    'TimeBasisCode': {
+        1: 'Local',
+        2: 'GMT (Greenwich Mean Time)',
+        3: 'Other (should be explained in Extended Textual File Header)',
+        4: 'UTC (Coordinated Universal Time)',
+        5: 'GPS (Global Positioning System Time)'
+    },
+    
+    # Fixed length trace flag (bytes 3503-3504)
+    'FixedLengthTraceFlag': {
+        0: 'Variable length traces (traditional SEG-Y)',
+        1: 'Fixed length traces (all traces have same sample interval and number of samples)'
+    },
+    
+    # Additional binary header fields from SEG-Y Rev 2.0 specification
+    
+    # Vertical sum code (bytes 3231-3232)
+    'VerticalSumCode': {
+        1: 'No sum',
+        2: 'Two sum',
+        3: 'Three sum',
+        4: 'Four sum',
+        5: 'Five sum',
+        6: 'Six sum',
+        7: 'Seven sum',
+        8: 'Eight sum',
+        9: 'Nine sum',
+        10: 'Ten sum',
+        11: 'Eleven sum',
+        12: 'Twelve sum',
+        13: 'Thirteen sum',
+        14: 'Fourteen sum',
+        15: 'Fifteen sum',
+        16: 'Sixteen sum'
+    },
+    
+    # SEG-Y format revision number (bytes 3501-3502)
+    'SEGYFormatRevisionNumber': {
+        0: 'SEG-Y Rev 0',
+        1: 'SEG-Y Rev 1',
+        2: 'SEG-Y Rev 2'
+    }
+}
+
+# Freeze the decoder tables; they are shared by every lookup and by the memoized decoder
+_BINARY_HEADER_DECODER = MappingProxyType({key: MappingProxyType(values)
+                                           for key, values in _BINARY_HEADER_DECODER.items()})
+
+# "Possible Values" HTML for each decoder table, rendered once at import
+_POSSIBLE_VALUES_HTML = {
+    key: "<b>Possible Values:</b><br>" + "".join(f"• {value}: {desc}<br>" for value, desc in values.items())
+    for key, values in _BINARY_HEADER_DECODER.items()
+}
+
+# Description HTML layouts, filled in with str.format_map
+_BIN_FIELD_TEMPLATE = ("<b>{field}</b><br><br><b>Byte Location:</b> {byte}<br><br>"
+                       "<b>Current Value:</b> {value}<br><br>{possible}")
+_BIN_FIELD_NO_DECODER_TEMPLATE = ("<b>{field}</b><br><br><b>Byte Location:</b> {byte}<br><br>"
+                                  "No description available for this field.")
+
+@lru_cache(maxsize=256)
+def _render_bin_field_html(field_name, current_value):
+    """Build the description HTML for a binary header field showing current_value"""
+    decoder_key = _BIN_FIELD_MAPPINGS.get(field_name)
+    byte_info = _BIN_BYTE_LOCATIONS.get(field_name, 'Byte location not specified')
+    if decoder_key:
+        # Free-form numbers (no decoder table) still show their current value
+        return _BIN_FIELD_TEMPLATE.format_map({
+            'field': field_name,
+            'byte': byte_info,
+            'value': current_value if current_value is not None else 'N/A',
+            'possible': _POSSIBLE_VALUES_HTML.get(decoder_key, "<b>Possible Values:</b><br>"),
+        })
+    # Even if no decoder, show byte location info
+    return _BIN_FIELD_NO_DECODER_TEMPLATE.format_map({'field': field_name, 'byte': byte_info})
+
+@lru_cache(maxsize=512)
+def _decode_binary_header_value(field_name, value):
+    """Decode a binary header field value to its description, or None if it has none"""
+    decoder = _BINARY_HEADER_DECODER  # Built once at import
+    
+    # BinField keys (as in the loaded binary header) are looked up directly, without str()
+    if isinstance(field_name, str):
+        decoder_key = _BIN_FIELD_MAPPINGS.get(field_name)
+    else:
+        decoder_key = _BIN_FIELD_ENUM_TO_DECODER_KEY.get(field_name)
+    
+    if decoder_key and decoder_key in decoder:
+        if value in decoder[decoder_key]:
+            result = decoder[decoder_key][value]
+            return result
+        else:
+            return None  # Value not found in decoder, don't show "Unknown value"
+    else:
+        return None  # No decoder available for this field
+
+def decode_binary_headers(bin_headers):
+    """Return (field name, value, description or None) for every binary header field in one pass"""
+    # Bind the tables once for the whole loop
+    decoder = _BINARY_HEADER_DECODER
+    by_name = _BIN_FIELD_MAPPINGS
+    by_enum = _BIN_FIELD_ENUM_TO_DECODER_KEY
+    names = _BIN_FIELD_NAMES
+    decoded = []
+    for key, value in bin_headers.items():
+        if isinstance(key, str):
+            name, decoder_key = key, by_name.get(key)
+        else:
+            name, decoder_key = names.get(key) or str(key), by_enum.get(key)
+        values = decoder.get(decoder_key)
+        decoded.append((name, value, values.get(value) if values is not None else None))
+    return decoded
+
+# Trace header fields from SEG-Y Rev 2.0 as (first byte, last byte, description), kept in the
+# trace_field_docs module and only imported the first time a trace field is inspected
+@lru_cache(maxsize=1)
+def _trace_field_docs():
+    """Return the trace header field byte ranges and descriptions"""
+    # A plain import, so PyInstaller bundles the table and a missing module raises
+    from trace_field_docs import TRACE_FIELD_DOCS
+    return TRACE_FIELD_DOCS
+
+def _trace_byte_location(field_name):
+    """Format the byte range and description of a trace header field for the description panel"""
+    doc = _trace_field_docs().get(field_name)
+    if doc is None:
+        return 'Byte location not specified'
+    start, end, text = doc
+    return f'{start}–{end}: {text}'
+
+def _normalize_field_name(name):
+    """Fold case and underscores so spellings like SOURCE_X and SourceX share one key"""
+    return name.lower().replace('_', '')
+
+@lru_cache(maxsize=1)
+def _normalized_trace_byte_ranges():
+    """Return the byte range text of every canonical trace header field, keyed by normalized name"""
+    ranges = {_normalize_field_name(name): f'{start}-{end}'
+              for name, (start, end, _) in _trace_field_docs().items()}
+    for name, byte_range in _TRACE_UNDOCUMENTED_RANGES.items():
+        ranges.setdefault(_normalize_field_name(name), byte_range)
+    return ranges
+
+@lru_cache(maxsize=None)
+def _trace_byte_range(field_name):
+    """Return the 'start-end' byte range of a trace header field under any known spelling, or None"""
+    # Memoized per name, so each header column is normalized once rather than on every render
+    canonical = _TRACE_FIELD_ALIASES.get(field_name, field_name)
+    return _normalized_trace_byte_ranges().get(_normalize_field_name(canonical))
+
+@lru_cache(maxsize=1)
+def _trace_byte_ranges():
+    """Return a read-only table of byte range text ('start-end') for every known trace header field name"""
+    names = [*_trace_field_docs(), *_TRACE_UNDOCUMENTED_RANGES, *_TRACE_FIELD_ALIASES]
+    return MappingProxyType({name: _trace_byte_range(name) for name in names})
+
+
+# Trace header field description HTML layout, filled in with str.format_map
+_TRACE_FIELD_TEMPLATE = ("<b>{field}</b><br><br><b>Byte Location:</b> {byte}<br><br>"
+                         "<b>Current Value:</b> {value}<br><br>"
+                         "This is a trace header field from the SEG-Y Rev 2.0 specification.")
+
+# Alternative trace header field names, mapped to the canonical name whose byte range is
+# stored once (in trace_field_docs.py or _TRACE_UNDOCUMENTED_RANGES). Spellings that only
+# differ in case or underscores need no entry; lookups go through _normalize_field_name
+_TRACE_FIELD_ALIASES = {
+    # Bytes 1-4: Trace sequence number within line
+    'TRACE_SEQUENCE_NUMBER_LINE': 'TRACE_SEQUENCE_LINE',
+    
+    # Bytes 5-8: Trace sequence number within reel/file
+    'TRACE_SEQUENCE_NUMBER_REEL': 'TRACE_SEQUENCE_FILE',
+    'TRACE_SEQUENCE_NUMBER_FILE': 'TRACE_SEQUENCE_FILE',
+    
+    # Bytes 9-12: Original field record number
+    'ORIGINAL_FIELD_RECORD': 'FieldRecord',
+    
+    # Bytes 13-16: Trace number within original field record
+    'TRACE_NUMBER_WITHIN_ORIGINAL_FIELD_RECORD': 'TraceNumber',
+    
+    # Bytes 17-20: Energy source point number
+    'ENERGY_SOURCE_POINT_NUMBER': 'EnergySourcePoint',
+    
+    # Bytes 21-24: CDP ensemble number
+    'CDPEnsemble': 'CDP',
+    'CDP_ENSEMBLE': 'CDP',
+    'CDP_ENSEMBLE_NUMBER': 'CDP',
+    
+    # Bytes 25-26: Trace number within CDP ensemble
+    'TraceInEnsemble': 'CDP_TRACE',
+    'TRACE_IN_ENSEMBLE': 'CDP_TRACE',
+    'TRACE_NUMBER_WITHIN_CDP_ENSEMBLE': 'CDP_TRACE',
+    
+    # Bytes 27-28: Trace identification code
+    'TRACE_ID_CODE': 'TraceIdentificationCode',
+    
+    # Bytes 29-30: Number of vertically summed traces
+    'NumberOfVerticallySummedTraces': 'NSummedTraces',
+    'NUMBER_OF_VERTICALLY_SUMMED_TRACES': 'NSummedTraces',
+    'VERTICALLY_SUMMED_TRACES': 'NSummedTraces',
+    
+    # Bytes 31-32: Number of horizontally stacked traces
+    'NumberOfHorizontallyStackedTraces': 'NStackedTraces',
+    'NUMBER_OF_HORIZONTALLY_STACKED_TRACES': 'NStackedTraces',
+    'HORIZONTALLY_STACKED_TRACES': 'NStackedTraces',
+    
+    # Bytes 33-34: Data use
+    'DATA_USE_CODE': 'DataUse',
+    
+    # Bytes 35-40: Distance from center of source point to center of receiver group
+    'DistanceFromCenterOfSourcePoint': 'offset',
+    'DISTANCE_FROM_CENTER_OF_SOURCE_POINT': 'offset',
+    'DISTANCE_CENTER_SOURCE_TO_RECEIVER': 'offset',
+    
+    # Bytes 41-44: Receiver group elevation
+    'GROUP_ELEVATION': 'ReceiverGroupElevation',
+    
+    # Bytes 45-48: Surface elevation at source
+    'SurfaceElevationAtSource': 'SourceSurfaceElevation',
+    'SURFACE_ELEVATION_AT_SOURCE': 'SourceSurfaceElevation',
+    
+    # Bytes 49-52: Source depth below surface
+    'SourceDepthBelowSurface': 'SourceDepth',
+    'SOURCE_DEPTH_BELOW_SURFACE': 'SourceDepth',
+    
+    # Bytes 53-56: Datum elevation at receiver group
+    'DatumElevationAtReceiverGroup': 'ReceiverDatumElevation',
+    'DATUM_ELEVATION_AT_RECEIVER_GROUP': 'ReceiverDatumElevation',
+    
+    # Bytes 57-60: Datum elevation at source
+    'DatumElevationAtSource': 'SourceDatumElevation',
+    'DATUM_ELEVATION_AT_SOURCE': 'SourceDatumElevation',
+    
+    # Bytes 61-64: Water depth at source
+    'WaterDepthAtSource': 'SourceWaterDepth',
+    'WATER_DEPTH_AT_SOURCE': 'SourceWaterDepth',
+    
+    # Bytes 65-68: Water depth at group
+    'WaterDepthAtGroup': 'GroupWaterDepth',
+    'WATER_DEPTH_AT_GROUP': 'GroupWaterDepth',
+    
+    # Bytes 69-70: Scalar for elevations and depths
+    'ScalarForElevationsAndDepths': 'ElevationScalar',
+    'SCALAR_FOR_ELEVATIONS_AND_DEPTHS': 'ElevationScalar',
+    'ELEVATION_DEPTH_SCALAR': 'ElevationScalar',
+    
+    # Bytes 71-72: Scalar for coordinates
+    'COORDINATE_SCALAR': 'ScalarForCoordinates',
+    
+    # Bytes 73-76: Source coordinate X
+    'SourceCoordinateX': 'SourceX',
+    'SOURCE_COORDINATE_X': 'SourceX',
+    
+    # Bytes 77-80: Source coordinate Y
+    'SourceCoordinateY': 'SourceY',
+    'SOURCE_COORDINATE_Y': 'SourceY',
+    
+    # Bytes 81-84: Group coordinate X
+    'GroupCoordinateX': 'GroupX',
+    'GROUP_COORDINATE_X': 'GroupX',
+    
+    # Bytes 85-88: Group coordinate Y
+    'GroupCoordinateY': 'GroupY',
+    'GROUP_COORDINATE_Y': 'GroupY',
+    
+    # Bytes 89-90: Coordinate units
+    'COORD_UNITS': 'CoordinateUnits',
+    
+    # Bytes 91-92: Weathering velocity
+    'WEATHERING_VEL': 'WeatheringVelocity',
+    
+    # Bytes 93-94: Sub-weathering velocity
+    'SUB_WEATHERING_VEL': 'SubWeatheringVelocity',
+    
+    # Bytes 95-96: Uphole time at source
+    'SOURCE_UPHOLE': 'SourceUpholeTime',
+    
+    # Bytes 97-98: Uphole time at group
+    'GROUP_UPHOLE': 'GroupUpholeTime',
+    
+    # Bytes 99-100: Source static correction
+    'SOURCE_STATIC': 'SourceStaticCorrection',
+    
+    # Bytes 101-102: Group static correction
+    'GROUP_STATIC': 'GroupStaticCorrection',
+    
+    # Bytes 103-104: Total static applied
+    'TOTAL_STATIC': 'TotalStaticApplied',
+    
+    # Bytes 105-106: Lag time A
+    'LAG_A': 'LagTimeA',
+    
+    # Bytes 107-108: Lag time B
+    'LAG_B': 'LagTimeB',
+    
+    # Bytes 109-110: Delay recording time
+    'DELAY_TIME': 'DelayRecordingTime',
+    
+    # Bytes 111-112: Mute time start
+    'MUTE_START': 'MuteTimeStart',
+    
+    # Bytes 113-114: Mute time end
+    'MUTE_END': 'MuteTimeEND',
+    
+    # Bytes 115-116: Number of samples in this trace
+    'NumberOfSamples': 'TRACE_SAMPLE_COUNT',
+    'NUMBER_OF_SAMPLES': 'TRACE_SAMPLE_COUNT',
+    'SAMPLES': 'TRACE_SAMPLE_COUNT',
+    
+    # Bytes 117-118: Sample interval in microseconds
+    'SampleInterval': 'TRACE_SAMPLE_INTERVAL',
+    'SAMPLE_INTERVAL': 'TRACE_SAMPLE_INTERVAL',
+    'SAMPLE_RATE': 'TRACE_SAMPLE_INTERVAL',
+    
+    # Bytes 119-120: Gain type of field instruments
+    'INSTRUMENT_GAIN_TYPE': 'GainType',
+    
+    # Bytes 121-122: Instrument gain constant
+    'GAIN_CONSTANT': 'InstrumentGainConstant',
+    
+    # Bytes 123-124: Instrument early or initial gain
+    'INITIAL_GAIN': 'InstrumentInitialGain',
+    
+    # Bytes 125-126: Correlated
+    'CORRELATION_FLAG': 'Correlated',
+    
+    # Bytes 127-128: Sweep frequency at start
+    'SWEEP_START_FREQ': 'SweepFrequencyStart',
+    
+    # Bytes 129-130: Sweep frequency at end
+    'SWEEP_END_FREQ': 'SweepFrequencyEnd',
+    
+    # Bytes 131-132: Sweep length in milliseconds
+    'SWEEP_DURATION': 'SweepLength',
+    
+    # Bytes 133-134: Sweep type
+    'SWEEP_TYPE_CODE': 'SweepType',
+    
+    # Bytes 135-136: Trace number of sweep channel
+    'SWEEP_CHANNEL_TRACE': 'TraceNumberOfSweepChannel',
+    
+    # Bytes 137-138: Sweep trace taper length at start
+    'SWEEP_TAPER_START': 'SweepTraceTaperLengthStart',
+    
+    # Bytes 139-140: Sweep trace taper length at end
+    'SWEEP_TAPER_END': 'SweepTraceTaperLengthEnd',
+    
+    # Bytes 141-142: Taper type
+    'TAPER_TYPE_CODE': 'TaperType',
+    
+    # Bytes 143-144: Alias filter frequency
+    'ALIAS_FREQ': 'AliasFilterFrequency',
+    
+    # Bytes 145-146: Alias filter slope
+    'ALIAS_SLOPE': 'AliasFilterSlope',
+    
+    # Bytes 147-148: Notch filter frequency
+    'NOTCH_FREQ': 'NotchFilterFrequency',
+    
+    # Bytes 149-150: Notch filter slope
+    'NOTCH_SLOPE': 'NotchFilterSlope',
+    
+    # Bytes 151-152: Low-cut frequency
+    'LOW_CUT_FREQ': 'LowCutFrequency',
+    
+    # Bytes 153-154: High-cut frequency
+    'HIGH_CUT_FREQ': 'HighCutFrequency',
+    
+    # Bytes 155-156: Low-cut slope
+    'LOW_CUT_SLOPE_DB': 'LowCutSlope',
+    
+    # Bytes 157-158: High-cut slope
+    'HIGH_CUT_SLOPE_DB': 'HighCutSlope',
+    
+    # Bytes 159-160: Year data recorded
+    'RECORDING_YEAR': 'YearDataRecorded',
+    
+    # Bytes 161-162: Day of year
+    'JULIAN_DAY': 'DayOfYear',
+    
+    # Bytes 163-164: Hour of day
+    'RECORDING_HOUR': 'HourOfDay',
+    
+    # Bytes 165-166: Minute of hour
+    'RECORDING_MINUTE': 'MinuteOfHour',
+    
+    # Bytes 167-168: Second of minute
+    'RECORDING_SECOND': 'SecondOfMinute',
+    
+    # Bytes 169-170: Time basis code
+    'TimeBasisCode': 'TimeBaseCode',
+    'TIME_BASIS_CODE': 'TimeBaseCode',
+    'TIME_BASIS': 'TimeBaseCode',
+    
+    # Bytes 171-172: Trace weighting factor
+    'WEIGHTING_FACTOR': 'TraceWeightingFactor',
+    
+    # Bytes 173-174: Geophone group number of roll switch position one
+    'GEOPHONE_ROLL1': 'GeophoneGroupNumberRoll1',
+    
+    # Bytes 175-176: Geophone group number of trace one within original field record
+    'GEOPHONE_FIRST_TRACE': 'GeophoneGroupNumberFirstTraceOrigField',
+    
+    # Bytes 177-178: Geophone group number of last trace within original field record
+    'GEOPHONE_LAST_TRACE': 'GeophoneGroupNumberLastTraceOrigField',
+    
+    # Bytes 179-180: Gap size
+    'GAP': 'GapSize',
+    
+    # Bytes 181-182: Over travel associated with taper
+    'OVER_TRAVEL_TAPER': 'OverTravel',
+    
+    # Bytes 183-184: CDP X coordinate
+    'CDP_X_COORDINATE': 'CDP_X',
+    
+    # Bytes 185-188: CDP Y coordinate
+    'CDP_Y_COORDINATE': 'CDP_Y',
+    
+    # Bytes 189-192: Inline number
+    'InlineNumber': 'INLINE_3D',
+    'INLINE_NUMBER': 'INLINE_3D',
+    'INLINE': 'INLINE_3D',
+    
+    # Bytes 193-196: Crossline number
+    'CrosslineNumber': 'CROSSLINE_3D',
+    'CROSSLINE_NUMBER': 'CROSSLINE_3D',
+    'CROSSLINE': 'CROSSLINE_3D',
+    
+    # Bytes 197-200: Shotpoint number
+    'ShotpointNumber': 'ShotPoint',
+    'SHOTPOINT_NUMBER': 'ShotPoint',
+    
+    # Bytes 201-202: Shotpoint scalar
+    'SHOTPOINT_SCALE': 'ShotPointScalar',
+    
+    # Bytes 203-204: Trace value measurement unit
+    'TRACE_UNIT': 'TraceValueMeasurementUnit',
+    
+    # Bytes 205-208: Transduction constant mantissa
+    'TRANSDUCTION_MANTISSA': 'TransductionConstantMantissa',
+    
+    # Bytes 209-210: Transduction constant exponent
+    'TRANSDUCTION_EXPONENT': 'TransductionConstantExponent',
+    'TransductionConstantPower': 'TransductionConstantExponent',
+    
+    # Bytes 211-212: Transduction units
+    'TRANSDUCTION_UNIT': 'TransductionUnits',
+    'TransductionUnit': 'TransductionUnits',
+    
+    # Bytes 213-214: Trace identifier
+    'TRACE_ID': 'TraceIdentifier',
+    
+    # Bytes 215-216: Scalar for elevations
+    'ELEVATION_SCALAR': 'ScalarForElevations',
+    'ScalarTraceHeader': 'ScalarForElevations',
+    
+    # Bytes 217-220: Source group scalar
+    'SOURCE_GROUP_SCALE': 'SourceGroupScalar',
+    
+    # Bytes 221-222: Source group scalar units
+    'SOURCE_GROUP_UNITS': 'SourceGroupScalarUnits',
+    
+    # Bytes 223-226: Group scalar
+    'GROUP_SCALE': 'GroupScalar',
+    
+    # Bytes 227-228: Group scalar units
+    'GROUP_UNITS': 'GroupScalarUnits',
+    
+    # Bytes 229-232: Source coordinate X (extended)
+    'SOURCE_X_EXT': 'SourceCoordinateXExtended',
+    
+    # Bytes 233-236: Source coordinate Y (extended)
+    'SOURCE_Y_EXT': 'SourceCoordinateYExtended',
+    
+    # Bytes 237-240: Group coordinate X (extended)
+    'GROUP_X_EXT': 'GroupCoordinateXExtended'
+}
+
+# Byte ranges of trace header fields that have no entry in trace_field_docs.py
+_TRACE_UNDOCUMENTED_RANGES = {
+    # Bytes 71-72: Scalar for coordinates
+    'ScalarForCoordinates': '71-72',
+    
+    # Bytes 135-136: Trace number of sweep channel
+    'TraceNumberOfSweepChannel': '135-136',
+    
+    # Bytes 205-208: Transduction constant mantissa
+    'TransductionConstantMantissa': '205-208',
+    
+    # Bytes 209-210: Transduction constant exponent
+    'TransductionConstantExponent': '209-210',
+    
+    # Bytes 211-212: Transduction units
+    'TransductionUnits': '211-212',
+    
+    # Bytes 213-214: Trace identifier
+    'TraceIdentifier': '213-214',
+    
+    # Bytes 215-216: Scalar for elevations
+    'ScalarForElevations': '215-216',
+    
+    # Bytes 221-222: Source group scalar units
+    'SourceGroupScalarUnits': '221-222',
+    
+    # Bytes 223-226: Group scalar
+    'GroupScalar': '223-226',
+    
+    # Bytes 227-228: Group scalar units
+    'GroupScalarUnits': '227-228',
+    
+    # Bytes 229-232: Source coordinate X (extended)
+    'SourceCoordinateXExtended': '229-232',
+    
+    # Bytes 233-236: Source coordinate Y (extended)
+    'SourceCoordinateYExtended': '233-236',
+    
+    # Bytes 237-240: Group coordinate X (extended)
+    'GroupCoordinateXExtended': '237-240',
+    
+    # Additional fields that may appear in segyio but are not in standard 240-byte header
+    # These are likely extended or custom fields
+    'SourceType': 'Extended',
+    'SourceEnergyDirectionMantissa': 'Extended',
+    'SourceEnergyDirectionExponent': 'Extended',
+    'SourceMeasurementMantissa': 'Extended',
+    'SourceMeasurementExponent': 'Extended',
+    'SourceMeasurementUnit': 'Extended',
+    'UnassignedInt1': 'Extended',
+    'UnassignedInt2': 'Extended'
+}
+
+# Shared fragments of the Headers HTML: clickable field name opener and section rule
+_SPAN_OPEN = "<span style='text-decoration: underline; cursor: pointer;'>"
+_RULE_BR = "=" * 50 + "<br>"
+
+@lru_cache(maxsize=8)
+def _trace_row_separators(fields, show_byte_locations):
+    """Return the Trace Info text between each field name and its value, in order"""
+    if not show_byte_locations:
+        return (": ",) * len(fields)
+    separators = []
+    for field in fields:
+        # Aliases resolve to their canonical field, whose byte range is stored once;
+        # fields not in the mapping show an unknown byte location
+        byte_range = _trace_byte_range(field)
+        separators.append(f" (bytes {'?' if byte_range is None else byte_range}): ")
+    return tuple(separators)
+
+# Number of rendered Trace Info pages kept for quick back/forward navigation
+TRACE_INFO_CACHE_SIZE = 256
+
+# Compact sizing for the control rows, applied once per group box instead of per widget
+_COMPACT_CONTROLS_QSS = (
+    "QLabel, QSpinBox, QDoubleSpinBox, QComboBox, QPushButton, QLineEdit, QCheckBox { max-height: 30px; }"
+    " #velocity_spinbox { max-width: 80px; }"
+    " #clip_spinbox { max-width: 60px; }"
+    " #std_dev_spinbox { max-width: 60px; }"
+    " #colormap_combo { max-width: 100px; }"
+    " #trace_back_button { max-width: 60px; }"
+    " #trace_number_input { max-width: 80px; }"
+    " #trace_forward_button { max-width: 70px; }"
+    " #trace_go_button { max-width: 40px; }"
+)
+
+class ClickableTextEdit(QTextEdit):
+    """Custom QTextEdit that handles clicks on field names"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parent_gui = parent
+    
+    def mousePressEvent(self, event):
+        """Handle mouse press events to detect clicks on field names"""
+        if event.button() == Qt.MouseButton.LeftButton:
+            # Get the cursor position and check if it's over a link
+            cursor = self.cursorForPosition(event.pos())
+            cursor.select(cursor.SelectionType.WordUnderCursor)
+            # Intern the word so the field table lookups below hit on identity, like the
+            # (compiler-interned) literal keys of those tables
+            selected_text = sys.intern(cursor.selectedText())
+            
+            # Check if the selected text is a field name
+            if self.parent_gui:
+                if selected_text in _TRACE_FIELDS:
+                    self.parent_gui.show_trace_field_description(selected_text)
+                    return
+                elif selected_text in _BIN_FIELDS:
+                    self.parent_gui.show_field_description(selected_text)
+                    return
+        
+        super().mousePressEvent(event)
+    
+    def showEvent(self, event):
+        """Render a trace selected while the panel was hidden"""
+        super().showEvent(event)
+        if self.parent_gui:
+            self.parent_gui.show_pending_trace_info()
+
+
+def format_trace_datetime(trace_data):
+    """Format date/time string from trace header data"""
+    try:
+        year = trace_data.get('YearDataRecorded', None)
+        day = trace_data.get('DayOfYear', None)
+        hour = trace_data.get('HourOfDay', None)
+        minute = trace_data.get('MinuteOfHour', None)
+        second = trace_data.get('SecondOfMinute', None)
+        
+        # Check if we have valid date/time data
+        if year is None or pd.isna(year) or day is None or pd.isna(day):
+            return None
+        
+        # Handle 2-digit years (assume 1900-2099 range)
+        if year < 100:
+            if year < 50:
+                year = 2000 + year
+            else:
+                year = 1900 + year
+        
+        # Format as YYYY-DOY HH:MM:SS
+        if hour is not None and not pd.isna(hour) and minute is not None and not pd.isna(minute):
+            if second is not None and not pd.isna(second):
+                return f"{int(year)}-{int(day):03d} {int(hour):02d}:{int(minute):02d}:{int(second):02d}"
+            else:
+                return f"{int(year)}-{int(day):03d} {int(hour):02d}:{int(minute):02d}:00"
+        else:
+            return f"{int(year)}-{int(day):03d}"
+    except:
+        return None
+
+def apply_coordinate_scalar(coords, scalar):
+    """Scale coordinates by SourceGroupScalar: multiply if positive, divide if negative, keep if zero"""
+    # The scalar is nearly always the same for every trace; scale by it directly then
+    if len(scalar) and (scalar == scalar[0]).all():
+        s = int(scalar[0])
+        if s > 0:
+            return coords * s
+        if s < 0:
+            return coords / -s
+        return coords.astype(np.float64)
+    return np.where(scalar > 0, coords * scalar,
+                    np.where(scalar < 0, coords / np.maximum(np.abs(scalar), 1), coords))
+
+def format_datetimes_from_headers(headers):
+    """Format the date/time of every trace in a header DataFrame like format_trace_datetime"""
+    # Handle 2-digit years (assume 1900-2099 range)
+    year = headers['YearDataRecorded'].to_numpy(dtype=np.int64)
+    year = np.where(year < 100, np.where(year < 50, year + 2000, year + 1900), year)
+    times = np.column_stack([year] + [headers[name].to_numpy(dtype=np.int64) for name in
+                                      ('DayOfYear', 'HourOfDay', 'MinuteOfHour', 'SecondOfMinute')])
+    # Many consecutive traces share a timestamp, so format each distinct one only once
+    unique_times, inverse = np.unique(times, axis=0, return_inverse=True)
+    # Format as YYYY-DOY HH:MM:SS
+    formatted = np.array([f"{y}-{d:03d} {h:02d}:{m:02d}:{sec:02d}"
+                          for y, d, h, m, sec in unique_times.tolist()], dtype=object)
+    return formatted[inverse.reshape(-1)].tolist()
+
+@lru_cache(maxsize=1)
+def geospatial_modules():
+    """Import the shapefile libraries on first use and return (geopandas, fiona, LineString).
+    
+    geopandas is preferred; when it is missing, fiona is returned in its place and geopandas is None
+    (fiona is None whenever geopandas is available). Raises ImportError if neither can be imported.
+    """
+    try:
+        from shapely.geometry import LineString
+        try:
+            import geopandas
+            return geopandas, None, LineString
+        except ImportError:
+            # Fallback to fiona and shapely if geopandas not available
+            import fiona
+            return None, fiona, LineString
+    except ImportError:
+        raise ImportError("Required geospatial libraries not found. Please install geopandas or fiona+shapely")
+
+@lru_cache(maxsize=1)
+def _shapefile_engine():
+    """Return 'pyogrio' when it is installed, else None for the geopandas default engine"""
+    # Only probe for the package; geopandas imports it itself when writing
+    return 'pyogrio' if importlib.util.find_spec('pyogrio') is not None else None
+
+def write_shapefile(gdf, path):
+    """Write a GeoDataFrame, through pyogrio's bulk columnar writer when available"""
+    # fiona (the default engine before geopandas 1.0) builds every feature in Python
+    engine = _shapefile_engine()
+    if engine is None:
+        gdf.to_file(path)
+    else:
+        gdf.to_file(path, engine=engine)
+
+# Batch files exported at once, each in its own worker process
+BATCH_MAX_WORKERS = 3
+
+def process_batch_file(filename, output_dir, settings):
+    """Export the plot, shapefiles and header info of one SEGY file for batch processing.
+    
+    Runs in a worker process, so it only uses its arguments. Returns (base_name, points, line)
+    with the shapefile GeoDataFrames that were written (None where none was), or None if the
+    file could not be loaded. settings holds the keyword arguments of _save_plot_for_file.
+    """
+    exporter = SegyBatchExporter()
+    data, trace_headers, text_headers, bin_headers, file_info = exporter._load_segy_file_data(filename)
+    if data is None or file_info is None:
+        return None
+    
+    base_name = Path(file_info['filename']).stem
+    
+    # Save plot
+    plot_path = os.path.join(output_dir, f"{base_name}_plot.png")
+    exporter._save_plot_for_file(data, file_info, plot_path, **settings)
+    
+    # Save shapefile
+    shapefile_base = os.path.join(output_dir, f"{base_name}_source_points")
+    point_path, line_path, points, line = exporter._save_shapefile_for_file(trace_headers, shapefile_base)
+    
+    # Save header info
+    txt_path = os.path.join(output_dir, f"{base_name}.txt")
+    exporter._save_header_info_for_file(file_info, text_headers, bin_headers, txt_path)
+    
+    return base_name, points if point_path else None, line if line_path else None
+
+
+class SegyBatchExporter:
+    """Per-file steps of batch processing, kept free of Qt so they can run in worker processes"""
+    
+    def _load_segy_file_data(self, filename):
+        """Load SEGY file data without updating GUI"""
+        try:
+            with segyio.open(filename, ignore_geometry=True, strict=False) as f:
+                # Get basic attributes
+                n_traces = f.tracecount
+                sample_rate = segyio.tools.dt(f) / 1000
+                n_samples = f.samples.size
+                twt = f.samples
+                
+                # Load data, mapped straight from disk like the interactive loader (IBM floats
+                # are converted in bulk); fall back to segyio for formats numpy cannot view
+                # The trace headers come out of the same mapping of the trace section (IBM files
+                # read with preads map their headers separately)
+                layout = trace_data_layout(filename, f)
+                header_view = None
+                if layout is not None:
+                    data, header_view = read_trace_samples(filename, layout, headers=True)
+                else:
+                    data = f.trace.raw[:]
+                
+                # Load headers
+                bin_headers = f.bin
+                text_headers = self._parse_text_header(f)
+                trace_headers = self._parse_trace_headers(f, filename, n_traces, header_view)
+                
+                # File information
+                file_info = {
+                    'filename': os.path.basename(filename),
+                    'n_traces': n_traces,
+                    'n_samples': n_samples,
+                    'sample_rate': sample_rate,
+                    'twt': twt
+                }
+                
+                return data, trace_headers, text_headers, bin_headers, file_info
+        except Exception:
+            return None, None, None, None, None
+    
+    def _parse_text_header(self, segyfile):
+        """Parse text header (same as the SegyLoaderThread method)"""
+        return parse_text_header(segyfile)
+    
+    def _parse_trace_headers(self, segyfile, filename, n_traces, header_view=None):
+        """Parse every trace header into a DataFrame indexed by trace number"""
+        # One read of the header block through TRACE_HEADER_DTYPE instead of a segyio pass per
+        # field (HeaderStore falls back to segyio when the layout cannot be mapped); header_view
+        # holds the records when they were already read along with the samples
+        layout = trace_header_layout(filename, segyfile)
+        return HeaderStore(filename, n_traces, layout, header_view).to_dataframe()
+    
+    def _save_plot_for_file(self, data, file_info, filename, colormap, clip_percentile, full_resolution, depth_mode=False, velocity=1500.0, clip_enabled=True, std_dev_enabled=False, std_dev_value=2.0):
+        """Save plot for a specific file"""
+        # Amplitude statistics from a single chunked pass over the data
+        stats = file_info.get('stats') or compute_data_stats(data)
+        
+        # Apply standard deviation clipping if enabled
+        plot_data = data
+        if std_dev_enabled:
+            plot_data = apply_std_dev_clipping(data, std_dev_value, stats)
+        
+        # Calculate amplitude clipping (clipping is monotonic, so the limits of the raw
+        # data match those of the clipped data)
+        vm, vm0, vm1 = compute_color_limits(data, clip_enabled, clip_percentile,
+                                            std_dev_enabled, std_dev_value, stats)
+        
+        # Create extent
+        n_traces = file_info['n_traces']
+        twt = file_info['twt']
+        
+        # Convert TWT to depth if depth mode is enabled
+        if depth_mode:
+            # Convert TWT (ms) to depth (m): Depth = (TWT_ms / 1000) × Velocity_m/s / 2
+            depth = (twt / 1000.0) * velocity / 2.0
+            y_min = depth[-1]  # Last depth value (deepest)
+            y_max = depth[0]   # First depth value (shallowest)
+            y_label = 'Depth [m]'
+        else:
+            y_min = twt[-1]  # Last TWT value (deepest)
+            y_max = twt[0]   # First TWT value (shallowest)
+            y_label = 'TWT [ms]'
+        
+        extent = [1, n_traces, y_min, y_max]
+        
+        if full_resolution:
+            # Calculate figure size based on data dimensions
+            data_shape = data.shape
+            figsize = (max(12, data_shape[1] * 0.01), max(8, data_shape[0] * 0.002))
+        else:
+            figsize = (12, 6)
+        # Render with Agg directly: pyplot would pull in the Qt backend, which worker
+        # processes cannot use. The tight layout is applied while drawing, so the figure
+        # is rendered once rather than again for bbox_inches='tight'
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=figsize, dpi=300, layout='tight')
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        
+        # Plot the data, colored to 8-bit pixels up front
+        rgba = quantize_to_rgba(plot_data, vm0, vm1, colormap_lut(colormap))
+        ax.imshow(rgba, aspect='auto', extent=extent)
+        
+        # Add labels and title
+        ax.set_xlabel('CDP number')
+        ax.set_ylabel(y_label)
+        title = f'{file_info["filename"]}'
+        if full_resolution:
+            title += ' (Full Resolution)'
+        ax.set_title(title)
+        
+        # Add colorbar
+        amplitude_colorbar(fig, ax, colormap, vm0, vm1)
+        
+        # Save
+        fig.savefig(filename, dpi=300, facecolor='white', edgecolor='none')
+    
+    def _save_shapefile_for_file(self, trace_headers, shapefile_base_path):
+        """Save shapefile for a specific file, returns (point_path, line_path, points, line).
+        
+        points and line are the GeoDataFrames that were written (None where a file was not),
+        so the batch can combine them without reading the shapefiles back.
+        """
+        try:
+            gpd, fiona, LineString = geospatial_modules()
+        except ImportError:
+            return None, None, None, None
+        
+        # Extract coordinates as whole columns (the parsed frame always has the source fields)
+        source_x = trace_headers['SourceX'].to_numpy(dtype=np.float64)
+        source_y = trace_headers['SourceY'].to_numpy(dtype=np.float64)
+        
+        # Skip traces whose coordinates are essentially zero (uninitialized)
+        valid = (np.abs(source_x) >= 1e-6) | (np.abs(source_y) >= 1e-6)
+        if not valid.any():
+            return None, None, None, None
+        headers = trace_headers[valid]
+        
+        # Get coordinate units from first valid trace
+        coord_units = int(headers['CoordinateUnits'].iloc[0])
+        
+        # Apply SourceGroupScalar to coordinates (scalar = 0 means scalar = 1)
+        source_group_scalar = headers['SourceGroupScalar'].to_numpy(dtype=np.int64)
+        x_coords = apply_coordinate_scalar(source_x[valid], source_group_scalar)
+        y_coords = apply_coordinate_scalar(source_y[valid], source_group_scalar)
+        
+        # Convert coordinates based on units; only seconds of arc need converting (to degrees),
+        # lengths and degrees are used as they are (DMS is treated as decimal degrees for now)
+        if coord_units == 2:
+            x_coords /= 3600.0
+            y_coords /= 3600.0
+        
+        # (n, 2) coordinate array, handed to shapely without building a list of tuples
+        line_coords = np.column_stack((x_coords, y_coords))
+        
+        # Build the attribute table column by column
+        cdp_data = {
+            'CDP_NUM': headers['CDP'].to_numpy(dtype=np.int64),
+            'TRACE_NUM': headers.index.to_numpy(dtype=np.int64),
+            'TRACE_SEQ': headers['TRACE_SEQUENCE_LINE'].to_numpy(dtype=np.int64),
+            'SOURCE_X': x_coords,
+            'SOURCE_Y': y_coords,
+            'COORD_UNIT': np.full(len(headers), coord_units, dtype=np.int64),
+            'SCALAR': source_group_scalar,
+            'OFFSET': headers['offset'].to_numpy(dtype=np.float64),
+            'ELEVATION': headers['SourceSurfaceElevation'].to_numpy(dtype=np.float64),
+            'DATETIME': format_datetimes_from_headers(headers),
+        }
+        
+        point_path = None
+        line_path = None
+        gdf_points = None
+        gdf_line = None
+        
+        # Create point shapefile
+        try:
+            gdf_points = gpd.GeoDataFrame(cdp_data, geometry=gpd.points_from_xy(x_coords, y_coords))
+            if coord_units in [2, 3, 4]:
+                gdf_points.crs = "EPSG:4326"
+            else:
+                gdf_points.crs = None
+            
+            point_path = f"{shapefile_base_path}_points.shp"
+            write_shapefile(gdf_points, point_path)
+        except:
+            point_path = gdf_points = None
+        
+        # Create line shapefile
+        if len(line_coords) > 1:
+            try:
+                line_geometry = LineString(line_coords)
+                
+                # Get start and end date/time from first and last traces
+                first_trace_num = trace_headers.index[0]
+                last_trace_num = trace_headers.index[-1]
+                first_trace_data = trace_headers.loc[first_trace_num]
+                last_trace_data = trace_headers.loc[last_trace_num]
+                
+                start_datetime = format_trace_datetime(first_trace_data)
+                end_datetime = format_trace_datetime(last_trace_data)
+                
+                # Create line GeoDataFrame with date/time fields
+                line_attrs = {'geometry': line_geometry}
+                if start_datetime:
+                    line_attrs['START_DT'] = start_datetime
+                else:
+                    line_attrs['START_DT'] = ''
+                if end_datetime:
+                    line_attrs['END_DT'] = end_datetime
+                else:
+                    line_attrs['END_DT'] = ''
+                
+                gdf_line = gpd.GeoDataFrame([line_attrs])
+                if coord_units in [2, 3, 4]:
+                    gdf_line.crs = "EPSG:4326"
+                else:
+                    gdf_line.crs = None
+                
+                line_path = f"{shapefile_base_path}_line.shp"
+                write_shapefile(gdf_line, line_path)
+            except:
+                line_path = gdf_line = None
+        
+        return point_path, line_path, gdf_points, gdf_line
+    
+    def _save_header_info_for_file(self, file_info, text_headers, bin_headers, filename):
+        """Save header information for a specific file"""
+        # Collect the lines and join them once at the end
+        parts = [
+            "FILE INFORMATION\n",
+            f"{'='*50}\n",
+            f"Filename: {file_info['filename']}\n",
+            f"Number of Traces: {file_info['n_traces']:,}\n",
+            f"Number of Samples: {file_info['n_samples']:,}\n",
+            f"Sample Rate: {file_info['sample_rate']:.2f} ms\n",
+            f"Time Window: {file_info['twt'][0]:.1f} - {file_info['twt'][-1]:.1f} ms\n\n",
+        ]
+        
+        # Binary headers
+        parts.append("BINARY HEADERS\n")
+        parts.append(f"{'='*50}\n")
+        for field_name, value, description in decode_binary_headers(bin_headers):
+            if description:
+                parts.append(f"{field_name}: {value} ({description})\n")
+            else:
+                parts.append(f"{field_name}: {value}\n")
+        parts.append("\n")
+        
+        # Text headers
+        parts.append("TEXT HEADERS\n")
+        parts.append(f"{'='*50}\n")
+        parts.extend(f"{key}: {value}\n" for key, value in text_headers.items())
+        parts.append("\n")
+        
+        # Write to file
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("".join(parts))
+
+
+class SegyGui(QMainWindow):
+    """Main GUI window for SEGY file viewer"""
+    
+    def __init__(self):
+        super().__init__()
+        self.config = SegyConfig()
+        self.current_data = None
+        self.current_headers = None
+        self.current_text_headers = None
+        self.current_bin_headers = None
+        self.current_bin_headers_by_name = {}  # Binary header values keyed by field name string
+        self.current_file_info = None
+        self.current_n_traces = 0  # Trace count of the loaded file (0 when nothing is loaded)
+        self.current_data_max = None  # Maximum amplitude of the loaded data, once known
+        self.current_file_stem = ''  # Loaded file name without its extension, for save names
+        self.current_trace_headers = {}  # Header values of the selected trace keyed by field name
+        self.field_description_key = None  # (kind, field, value) shown in the Field Description panel
+        self.trace_info_cache = OrderedDict()  # (trace, show_byte_locations) -> (title, rows, headers), LRU order
+        
+        # Character formats for the Trace Info panel: clickable field names are underlined
+        self.plain_format = QTextCharFormat()
+        self.link_format = QTextCharFormat()
+        self.link_format.setFontUnderline(True)
+        self.current_trace_number = 1  # Track current selected trace
+        self.pending_trace_number = None  # Trace selected while the Trace Info panel was hidden
+        self.show_byte_locations = False  # Track byte location display state
+        self.depth_mode = False  # Track if depth mode is enabled
+        self.velocity = 1500.0  # Default velocity in m/s
+        self._ui_batch_depth = 0  # Nesting depth of _batched_ui blocks
+        self.loader_thread = None  # Thread loading the file being opened, if any
+        self.superseded_loaders = set()  # Replaced loader threads kept alive until they exit
+        
+        # Coalesce bursts of plot setting changes (spinbox steps, typing) into one replot
+        self.replot_timer = QTimer(self)
+        self.replot_timer.setSingleShot(True)
+        self.replot_timer.setInterval(150)
+        self.replot_timer.timeout.connect(self.update_plot)
+        
+        # Shapefile and header info saves run here, leaving cores free for the GUI and loader
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 2))
+        self.save_workers = set()  # Keep running workers (and their signals) alive
+        
+        # Full-data scans for the color limits of files without cached stats run on this pool
+        self.plot_pool = QThreadPool(self)
+        self.plot_pool.setMaxThreadCount(1)
+        self.plot_generation = 0  # Bumped per update_plot; stale background results are not drawn
+        
+        self.init_ui()
+        
+    def init_ui(self):
+        """Initialize the user interface"""
+        self.setWindowTitle(f'UNH/CCOM-JHC SEG-Y File Viewer v{__version__} - pjohnson@ccom.unh.edu')
+        self.setGeometry(100, 100, 1400, 900)
+        
+        # Create central widget and main layout
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        
+        # Create controls panel
+        controls_panel = self.create_controls_panel()
+        main_layout.addWidget(controls_panel)
+        
+        # Create splitter for main content
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        main_layout.addWidget(splitter)
         
-        # Create plot widget
-        self.plot_widget = SegyPlotWidget()
-        self.plot_widget.set_trace_callback(self.on_trace_selected)
-        plot_layout.addWidget(self.plot_widget)
+        # Create plot widget container with toolbar
+        plot_container = QWidget()
+        plot_layout = QVBoxLayout(plot_container)
+        plot_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create navigation toolbar for zoom and pan
-        self.plot_toolbar = NavigationToolbar(self.plot_widget, self)
-        plot_layout.addWidget(self.plot_toolbar)
+        # Create plot widget (the pyqtgraph view has its own mouse zoom and pan)
+        if self.config.get('plot_backend') == 'pyqtgraph' and pg is not None:
+            self.plot_widget = SegyPlotWidgetPG()
+            self.plot_widget.set_trace_callback(self.on_trace_selected)
+            plot_layout.addWidget(self.plot_widget)
+            self.plot_toolbar = None
+        else:
+            self.plot_widget = SegyPlotWidget()
+            self.plot_widget.set_trace_callback(self.on_trace_selected)
+            plot_layout.addWidget(self.plot_widget)
+            
+            # Create navigation toolbar for zoom and pan
+            self.plot_toolbar = NavigationToolbar(self.plot_widget, self)
+            plot_layout.addWidget(self.plot_toolbar)
         
         splitter.addWidget(plot_container)
         
@@ -596,19 +2716,18 @@ class SegyGui(QMainWindow):
         """Create the controls panel with file selection and plot options"""
         group = QGroupBox("File Control")
         group.setMaximumHeight(80)  # Limit the height of the controls panel
+        group.setStyleSheet(_COMPACT_CONTROLS_QSS)  # Make the buttons and labels compact
         layout = QHBoxLayout(group)
         layout.setContentsMargins(10, 5, 10, 5)  # Reduce margins for more compact layout
         
         # File selection
         self.file_button = QPushButton("Open SEGY File")
         self.file_button.clicked.connect(self.open_file)
-        self.file_button.setMaximumHeight(30)  # Make button more compact
         layout.addWidget(self.file_button)
         
         # File info label
         self.file_label = QLabel("No file selected")
         self.file_label.setStyleSheet("color: gray; font-style: italic;")
-        self.file_label.setMaximumHeight(30)  # Make label more compact
         layout.addWidget(self.file_label)
         
         layout.addStretch()
@@ -617,34 +2736,29 @@ class SegyGui(QMainWindow):
         self.save_button = QPushButton("Save Plot")
         self.save_button.clicked.connect(self.save_plot)
         self.save_button.setEnabled(False)
-        self.save_button.setMaximumHeight(30)
         layout.addWidget(self.save_button)
         
         # Full resolution checkbox
         self.full_res_checkbox = QCheckBox("Full Res")
         self.full_res_checkbox.setChecked(True)  # On by default
         self.full_res_checkbox.setEnabled(False)  # Disabled until file is loaded
-        self.full_res_checkbox.setMaximumHeight(30)
         layout.addWidget(self.full_res_checkbox)
         
         # Save info button
         self.save_info_button = QPushButton("Save Info")
         self.save_info_button.clicked.connect(self.save_header_info)
         self.save_info_button.setEnabled(False)
-        self.save_info_button.setMaximumHeight(30)
         layout.addWidget(self.save_info_button)
         
         # Save shapefile button
         self.save_shapefile_button = QPushButton("Save Shapefile")
         self.save_shapefile_button.clicked.connect(self.save_shapefile)
         self.save_shapefile_button.setEnabled(False)
-        self.save_shapefile_button.setMaximumHeight(30)
         layout.addWidget(self.save_shapefile_button)
         
         # Batch process button
         self.batch_process_button = QPushButton("Batch Process")
         self.batch_process_button.clicked.connect(self.batch_process)
-        self.batch_process_button.setMaximumHeight(30)  # Make button more compact
         layout.addWidget(self.batch_process_button)
         
         return group
@@ -657,6 +2771,7 @@ class SegyGui(QMainWindow):
         
         # Plot Control panel
         plot_control_group = QGroupBox("Plot Control")
+        plot_control_group.setStyleSheet(_COMPACT_CONTROLS_QSS)
         plot_control_layout = QVBoxLayout(plot_control_group)
         
         # First row: Depth and Velocity
@@ -664,21 +2779,18 @@ class SegyGui(QMainWindow):
         
         # Depth mode toggle (enabled from start for batch processing)
         self.depth_mode_checkbox = QCheckBox("Depth")
-        self.depth_mode_checkbox.setMaximumHeight(30)
         self.depth_mode_checkbox.setChecked(False)
         self.depth_mode_checkbox.stateChanged.connect(self.on_depth_mode_changed)
         row1_layout.addWidget(self.depth_mode_checkbox)
         
         # Velocity parameter (enabled from start for batch processing)
         velocity_label = QLabel("Velocity (m/s):")
-        velocity_label.setMaximumHeight(30)
         row1_layout.addWidget(velocity_label)
         
         self.velocity_spinbox = QSpinBox()
         self.velocity_spinbox.setRange(1000, 5000)
         self.velocity_spinbox.setValue(1500)
-        self.velocity_spinbox.setMaximumHeight(30)
-        self.velocity_spinbox.setMaximumWidth(80)
+        self.velocity_spinbox.setObjectName("velocity_spinbox")
         self.velocity_spinbox.valueChanged.connect(self.on_velocity_changed)
         row1_layout.addWidget(self.velocity_spinbox)
         
@@ -690,34 +2802,29 @@ class SegyGui(QMainWindow):
         
         # Clip checkbox
         self.clip_checkbox = QCheckBox("Clip")
-        self.clip_checkbox.setMaximumHeight(30)
         self.clip_checkbox.setChecked(True)  # On by default
         self.clip_checkbox.stateChanged.connect(self.on_clip_enabled_changed)
         row2_layout.addWidget(self.clip_checkbox)
         
         # Clip % parameter
         clip_label = QLabel("%:")
-        clip_label.setMaximumHeight(30)
         row2_layout.addWidget(clip_label)
         
         self.clip_spinbox = QSpinBox()
         self.clip_spinbox.setRange(50, 100)
         self.clip_spinbox.setValue(self.config.get('last_clip_percentile', 99))
-        self.clip_spinbox.setMaximumHeight(30)
-        self.clip_spinbox.setMaximumWidth(60)
+        self.clip_spinbox.setObjectName("clip_spinbox")
         # Connect clip percentile change to automatic plot update
         self.clip_spinbox.valueChanged.connect(self.on_clip_percentile_changed)
         row2_layout.addWidget(self.clip_spinbox)
         
         # Standard Deviation checkbox and parameter
         self.std_dev_checkbox = QCheckBox("Standard Deviation")
-        self.std_dev_checkbox.setMaximumHeight(30)
         self.std_dev_checkbox.setChecked(False)  # Off by default
         self.std_dev_checkbox.stateChanged.connect(self.on_std_dev_enabled_changed)
         row2_layout.addWidget(self.std_dev_checkbox)
         
         std_dev_label = QLabel("Value:")
-        std_dev_label.setMaximumHeight(30)
         row2_layout.addWidget(std_dev_label)
         
         self.std_dev_spinbox = QDoubleSpinBox()
@@ -725,8 +2832,7 @@ class SegyGui(QMainWindow):
         self.std_dev_spinbox.setValue(2.0)
         self.std_dev_spinbox.setSingleStep(0.1)
         self.std_dev_spinbox.setDecimals(1)
-        self.std_dev_spinbox.setMaximumHeight(30)
-        self.std_dev_spinbox.setMaximumWidth(60)
+        self.std_dev_spinbox.setObjectName("std_dev_spinbox")
         self.std_dev_spinbox.valueChanged.connect(self.on_std_dev_changed)
         row2_layout.addWidget(self.std_dev_spinbox)
         
@@ -738,13 +2844,11 @@ class SegyGui(QMainWindow):
         
         # Colormap parameter
         colormap_label = QLabel("Colormap:")
-        colormap_label.setMaximumHeight(30)
         row3_layout.addWidget(colormap_label)
         
         self.colormap_combo = QComboBox()
-        self.colormap_combo.addItems(['BuPu', 'RdBu', 'seismic', 'gray', 'viridis', 'plasma'])
-        self.colormap_combo.setMaximumHeight(30)
-        self.colormap_combo.setMaximumWidth(100)
+        self.colormap_combo.addItems(COLORMAP_NAMES)
+        self.colormap_combo.setObjectName("colormap_combo")
         # Set the saved colormap
         saved_colormap = self.config.get('last_colormap', 'BuPu')
         index = self.colormap_combo.findText(saved_colormap)
@@ -756,7 +2860,6 @@ class SegyGui(QMainWindow):
         
         # Update plot button
         self.update_button = QPushButton("Update Plot")
-        self.update_button.setMaximumHeight(30)
         self.update_button.clicked.connect(self.update_plot)
         self.update_button.setEnabled(False)  # Disabled until file is loaded
         row3_layout.addWidget(self.update_button)
@@ -779,13 +2882,13 @@ class SegyGui(QMainWindow):
         
         # Trace Info panel (merged Trace Selection and Trace Information)
         trace_info_group = QGroupBox("Trace Info")
+        trace_info_group.setStyleSheet(_COMPACT_CONTROLS_QSS)
         trace_info_layout = QVBoxLayout(trace_info_group)
         
         # Trace Selection controls (top section)
         # Instruction text
         instruction_label = QLabel("Middle Button click on plot to select trace")
-        instruction_label.setStyleSheet("color: gray; font-style: italic; font-size: 9pt;")
-        instruction_label.setMaximumHeight(20)
+        instruction_label.setStyleSheet("color: gray; font-style: italic; font-size: 9pt; max-height: 20px;")
         trace_info_layout.addWidget(instruction_label)
         
         # Controls layout
@@ -793,43 +2896,37 @@ class SegyGui(QMainWindow):
         
         # Back button
         self.trace_back_button = QPushButton("◀ Back")
-        self.trace_back_button.setMaximumHeight(30)
-        self.trace_back_button.setMaximumWidth(60)
+        self.trace_back_button.setObjectName("trace_back_button")
         self.trace_back_button.clicked.connect(self.trace_back)
         self.trace_back_button.setEnabled(False)
         controls_layout.addWidget(self.trace_back_button)
         
         # Trace number input
         trace_label = QLabel("CDP:")
-        trace_label.setMaximumHeight(30)
         controls_layout.addWidget(trace_label)
         
         self.trace_number_input = QLineEdit()
-        self.trace_number_input.setMaximumHeight(30)
-        self.trace_number_input.setMaximumWidth(80)
+        self.trace_number_input.setObjectName("trace_number_input")
         self.trace_number_input.setPlaceholderText("1")
         self.trace_number_input.returnPressed.connect(self.on_trace_number_entered)
         controls_layout.addWidget(self.trace_number_input)
         
         # Forward button
         self.trace_forward_button = QPushButton("Forward ▶")
-        self.trace_forward_button.setMaximumHeight(30)
-        self.trace_forward_button.setMaximumWidth(70)
+        self.trace_forward_button.setObjectName("trace_forward_button")
         self.trace_forward_button.clicked.connect(self.trace_forward)
         self.trace_forward_button.setEnabled(False)
         controls_layout.addWidget(self.trace_forward_button)
         
         # Go button
         self.trace_go_button = QPushButton("Go")
-        self.trace_go_button.setMaximumHeight(30)
-        self.trace_go_button.setMaximumWidth(40)
+        self.trace_go_button.setObjectName("trace_go_button")
         self.trace_go_button.clicked.connect(self.on_trace_number_entered)
         self.trace_go_button.setEnabled(False)
         controls_layout.addWidget(self.trace_go_button)
         
         # Byte location checkbox
         self.byte_loc_checkbox = QCheckBox("Byte Loc")
-        self.byte_loc_checkbox.setMaximumHeight(30)
         self.byte_loc_checkbox.setChecked(False)  # Off by default
         self.byte_loc_checkbox.stateChanged.connect(self.on_byte_loc_changed)
         controls_layout.addWidget(self.byte_loc_checkbox)
@@ -877,39 +2974,92 @@ class SegyGui(QMainWindow):
         self.file_label.setText(f"Loading: {os.path.basename(filename)}...")
         self.file_button.setEnabled(False)
         
+        # Results of a load that is still running are no longer wanted
+        self._disconnect_loader_thread()
+        
         # Create and start loading thread
         self.loader_thread = SegyLoaderThread(filename)
         self.loader_thread.progress.connect(self.update_progress)
-        self.loader_thread.finished.connect(self.on_file_loaded)
-        self.loader_thread.error.connect(self.on_load_error)
+        self.loader_thread.loaded.connect(self.on_file_loaded, Qt.ConnectionType.QueuedConnection)
+        self.loader_thread.error.connect(self.on_load_error, Qt.ConnectionType.QueuedConnection)
         self.loader_thread.start()
         
         # Show progress bar
         self.progress_bar = QProgressBar()
         self.statusBar().addWidget(self.progress_bar)
     
+    def _disconnect_loader_thread(self):
+        """Detach the current loader thread so only one thread at a time can deliver results"""
+        loader = self.loader_thread
+        if loader is None:
+            return
+        for signal in (loader.progress, loader.loaded, loader.error):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # Nothing was connected
+        if loader.isRunning():
+            # Destroying a running QThread aborts the process, so hold it until it exits
+            self.superseded_loaders.add(loader)
+            loader.finished.connect(lambda: self.superseded_loaders.discard(loader))
+        self.loader_thread = None
+    
     def update_progress(self, value):
         """Update progress bar"""
         if hasattr(self, 'progress_bar'):
             self.progress_bar.setValue(value)
     
-    def on_file_loaded(self, data, trace_headers, text_headers, bin_headers, file_info):
+    def on_file_loaded(self):
         """Handle successful file loading"""
+        # Hold repaints until the headers, plot and trace display have all been updated
+        with self._batched_ui():
+            self._show_loaded_file()
+    
+    @contextmanager
+    def _batched_ui(self):
+        """Suspend window repaints for the block, repainting once when the outermost block exits"""
+        if self._ui_batch_depth == 0:
+            self.setUpdatesEnabled(False)
+        self._ui_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._ui_batch_depth -= 1
+            if self._ui_batch_depth == 0:
+                self.setUpdatesEnabled(True)
+                self.update()
+    
+    def _show_loaded_file(self):
+        """Take the loader thread's results and update every display for the new file"""
+        # Take the results from the loader thread so it no longer holds the data
+        loader = self.loader_thread
+        data, trace_headers, text_headers, bin_headers, file_info = (
+            loader.data, loader.trace_headers, loader.text_headers, loader.bin_headers, loader.file_info)
+        loader.data = loader.trace_headers = loader.text_headers = None
+        loader.bin_headers = loader.file_info = None
+        
+        # The loaded data is shared as-is by the plot, saves and batch exports; freeze it so
+        # nothing can modify it in place (consumers that need changes work on copies or views)
+        data.flags.writeable = False
         self.current_data = data
         self.current_headers = trace_headers
         self.current_text_headers = text_headers
         self.current_bin_headers = bin_headers
+        self.current_bin_headers_by_name = {_BIN_FIELD_NAMES.get(key) or str(key): value
+                                            for key, value in bin_headers.items()}
         self.current_file_info = file_info
+        self.current_n_traces = file_info['n_traces']
+        stats = file_info.get('stats')
+        self.current_data_max = stats['max'] if stats else None
+        self.current_file_stem = Path(file_info['filename']).stem
+        self.trace_info_cache.clear()
         
         # Update UI
         self.file_label.setText(f"Loaded: {file_info['filename']}")
-        self.file_button.setEnabled(True)
-        self.update_button.setEnabled(True)
-        self.save_button.setEnabled(True)
-        self.full_res_checkbox.setEnabled(True)
         # depth_mode_checkbox and velocity_spinbox are always enabled (for batch processing)
-        self.save_info_button.setEnabled(True)
-        self.save_shapefile_button.setEnabled(True)
+        self._set_enabled_batch((self.file_button, self.update_button, self.save_button,
+                                 self.full_res_checkbox, self.save_info_button,
+                                 self.save_shapefile_button), True)
         
         # Remove progress bar
         if hasattr(self, 'progress_bar'):
@@ -930,10 +3080,15 @@ class SegyGui(QMainWindow):
     
     def enable_trace_selection(self):
         """Enable trace selection controls when file is loaded"""
-        self.trace_back_button.setEnabled(True)
-        self.trace_forward_button.setEnabled(True)
-        self.trace_go_button.setEnabled(True)
-        self.trace_number_input.setEnabled(True)
+        self._set_enabled_batch((self.trace_back_button, self.trace_forward_button,
+                                 self.trace_go_button, self.trace_number_input), True)
+    
+    def _set_enabled_batch(self, widgets, enabled):
+        """Enable or disable several widgets with their signals blocked while they change"""
+        for widget in widgets:
+            widget.blockSignals(True)
+            widget.setEnabled(enabled)
+            widget.blockSignals(False)
     
     def trace_back(self):
         """Navigate to the previous trace"""
@@ -942,7 +3097,7 @@ class SegyGui(QMainWindow):
     
     def trace_forward(self):
         """Navigate to the next trace"""
-        if self.current_file_info and self.current_trace_number < self.current_file_info['n_traces']:
+        if self.current_trace_number < self.current_n_traces:
             self.select_trace(self.current_trace_number + 1)
     
     def on_trace_number_entered(self):
@@ -956,11 +3111,8 @@ class SegyGui(QMainWindow):
     
     def select_trace(self, trace_number):
         """Select a specific trace and update all displays"""
-        if not self.current_file_info:
-            return
-        
-        # Validate trace number
-        if trace_number < 1 or trace_number > self.current_file_info['n_traces']:
+        # Validate trace number (always fails when no file is loaded)
+        if trace_number < 1 or trace_number > self.current_n_traces:
             return
         
         self.current_trace_number = trace_number
@@ -968,9 +3120,13 @@ class SegyGui(QMainWindow):
         # Update the input field
         self.trace_number_input.setText(str(trace_number))
         
-        # Update navigation buttons
-        self.trace_back_button.setEnabled(trace_number > 1)
-        self.trace_forward_button.setEnabled(trace_number < self.current_file_info['n_traces'])
+        # Update navigation buttons, only touching the ones whose state changes
+        back_enabled = trace_number > 1
+        if self.trace_back_button.isEnabled() != back_enabled:
+            self.trace_back_button.setEnabled(back_enabled)
+        forward_enabled = trace_number < self.current_n_traces
+        if self.trace_forward_button.isEnabled() != forward_enabled:
+            self.trace_forward_button.setEnabled(forward_enabled)
         
         # Update visual feedback on plot
         if hasattr(self, 'plot_widget') and self.plot_widget:
@@ -995,1039 +3151,56 @@ class SegyGui(QMainWindow):
     
     def show_field_description(self, field_name):
         """Show description for a binary header field"""
-        decoder = self.get_binary_header_decoder()
-        
-        # Map segyio field names to decoder keys
-        field_mappings = {
-            'JobID': 'JobIdentificationNumber',
-            'LineNumber': 'LineNumber',
-            'ReelNumber': 'ReelNumber',
-            'Traces': 'NumberOfDataTracesPerRecord',
-            'AuxTraces': 'NumberOfAuxiliaryTracesPerRecord',
-            'Interval': 'SampleIntervalInMicroseconds',
-            'IntervalOriginal': 'SampleIntervalInMicrosecondsOfOriginalFieldRecording',
-            'Samples': 'NumberOfSamplesPerDataTrace',
-            'SamplesOriginal': 'NumberOfSamplesPerDataTraceForOriginalFieldRecording',
-            'Format': 'DataSampleFormat',
-            'EnsembleFold': 'EnsembleFold',
-            'SortingCode': 'TraceSortingCode',
-            'VerticalSum': 'VerticalSumCode',
-            'SweepFrequencyStart': 'SweepFrequencyAtStart',
-            'SweepFrequencyEnd': 'SweepFrequencyAtEnd',
-            'SweepLength': 'SweepLengthInMilliseconds',
-            'Sweep': 'SweepTypeCode',
-            'SweepChannel': 'SweepChannelNumber',
-            'SweepTaperStart': 'SweepTraceTaperLengthAtStartInMilliseconds',
-            'SweepTaperEnd': 'SweepTraceTaperLengthAtEndInMilliseconds',
-            'Taper': 'TaperType',
-            'CorrelatedTraces': 'CorrelatedDataTraces',
-            'BinaryGainRecovery': 'BinaryGainRecovered',
-            'AmplitudeRecovery': 'AmplitudeRecoveryMethod',
-            'MeasurementSystem': 'MeasurementSystem',
-            'ImpulseSignalPolarity': 'ImpulseSignalPolarity',
-            'VibratoryPolarity': 'VibratoryPolarityCode',
-            'ExtAuxTraces': 'ExtendedNumberOfAuxiliaryTracesPerRecord',
-            'ExtSamples': 'ExtendedNumberOfSamplesPerDataTrace',
-            'ExtSamplesOriginal': 'ExtendedNumberOfSamplesPerDataTraceForOriginalFieldRecording',
-            'ExtEnsembleFold': 'ExtendedEnsembleFold',
-            'SEGYRevision': 'SEGYFormatRevisionNumber',
-            'SEGYRevisionMinor': 'SEGYFormatRevisionNumberMinor',
-            'TraceFlag': 'FixedLengthTraceFlag',
-            'ExtendedHeaders': 'NumberOfExtendedTextualFileHeaderRecords'
-        }
-        
-        # Byte location mappings for SEG-Y Rev 2.0 (from segy_binheader.xlsx)
-        byte_locations = {
-            'JobID': '3201–3204: Job identification number.',
-            'LineNumber': '3205–3208: Line number. For 3-D poststack data, this will typically contain the in-line number.',
-            'ReelNumber': '3209–3212: Reel number.',
-            'Traces': '3213–3214: Number of data traces per ensemble. Mandatory for prestack data.',
-            'AuxTraces': '3215–3216: Number of auxiliary traces per ensemble. Mandatory for prestack data.',
-            'Interval': '3217–3218: Sample interval. Microseconds (µs) for time data, Hertz (Hz) for frequency data, meters (m) or feet (ft) for depth data.',
-            'IntervalOriginal': '3219–3220: Sample interval of original field recording. Microseconds (µs) for time data, Hertz (Hz) for frequency data, meters (m) or feet (ft) for depth data.',
-            'Samples': '3221–3222: Number of samples per data trace. Note: The sample interval and number of samples in the Binary File Header should be for the primary set of seismic data traces in the file.',
-            'SamplesOriginal': '3223–3224: Number of samples per data trace for original field recording.',
-            'Format': '3225–3226: Data sample format code. Mandatory for all data. These formats are described in Appendix E.',
-            'EnsembleFold': '3227–3228: Ensemble fold — The expected number of data traces per trace ensemble (e.g. the CMP fold).',
-            'SortingCode': '3229–3230: Trace sorting code (i.e. type of ensemble)',
-            'VerticalSum': '3231–3232: Vertical sum code: 1 = no sum, 2 = two sum, …, N = M–1 sum (M = 2 to 32,767)',
-            'SweepFrequencyStart': '3233–3234: Sweep frequency at start (Hz).',
-            'SweepFrequencyEnd': '3235–3236: Sweep frequency at end (Hz).',
-            'SweepLength': '3237–3238: Sweep length (ms).',
-            'Sweep': '3239–3240: Sweep type code: 1 = linear, 2 = parabolic, 3 = exponential, 4 = other',
-            'SweepChannel': '3241–3242: Trace number of sweep channel.',
-            'SweepTaperStart': '3243–3244: Sweep trace taper length in milliseconds at start if tapered (the taper starts at zero time and is effective for this length).',
-            'SweepTaperEnd': '3245–3246: Sweep trace taper length in milliseconds at end (the ending taper starts at sweep length minus the taper length at end).',
-            'Taper': '3247–3248: Taper type: 1 = linear, 2 = cosine squared, 3 = other',
-            'CorrelatedTraces': '3249–3250: Correlated data traces: 1 = no, 2 = yes',
-            'BinaryGainRecovery': '3251–3252: Binary gain recovered: 1 = yes, 2 = no',
-            'AmplitudeRecovery': '3253–3254: Amplitude recovery method: 1 = none, 2 = spherical divergence, 3 = AGC, 4 = other',
-            'MeasurementSystem': '3255–3256: Measurement system: 1 = Meters, 2 = Feet',
-            'ImpulseSignalPolarity': '3257–3258: Impulse signal polarity',
-            'VibratoryPolarity': '3259–3260: Vibratory polarity code',
-            'ExtAuxTraces': '3261–3264: Extended number of data traces per ensemble. If nonzero, this overrides the number of data traces per ensemble in bytes 3213–3214.',
-            'ExtSamples': '3265–3268: Extended number of auxiliary traces per ensemble. If nonzero, this overrides the number of auxiliary traces per ensemble in bytes 3215–3216.',
-            'ExtSamplesOriginal': '3269–3272: Extended number of samples per data trace. If nonzero, this overrides the number of samples per data trace in bytes 3221–3222.',
-            'ExtEnsembleFold': '3273–3280: Extended sample interval, IEEE double precision (64-bit). If nonzero, this overrides the sample interval in bytes 3217–3218 with the same units.',
-            'SEGYRevision': '3501: Major SEG-Y Format Revision Number. This is an 8-bit unsigned value. Thus for SEG-Y Revision 2.0, as defined in this document, this will be recorded as 0216.',
-            'SEGYRevisionMinor': '3502: Minor SEG-Y Format Revision Number. This is an 8-bit unsigned value with a radix point between the first and second bytes. Thus for SEG-Y Revision 2.0, as defined in this document, this will be recorded as 0016.',
-            'TraceFlag': '3503–3504: Fixed length trace flag. A value of one indicates that all traces in this SEG-Y file are guaranteed to have the same sample interval, number of trace header blocks and trace samples.',
-            'ExtendedHeaders': '3505–3506: Number of 3200-byte, Extended Textual File Header records following the Binary Header.',
-            # Additional SEG-Y Rev 2.0 fields
-            'MaxAdditionalTraceHeaders': '3507–3510: Maximum number of additional 240 byte trace headers. A value of zero indicates there are no additional 240 byte trace headers.',
-            'TimeBasis': '3511–3512: Time basis code: 1 = Local, 2 = GMT (Greenwich Mean Time), 3 = Other, 4 = UTC (Coordinated Universal Time), 5 = GPS (Global Positioning System Time)',
-            'AdditionalTraceHeaderBytes': '3513–3520: Number of traces in this file or stream. (64-bit unsigned integer value) If zero, all bytes in the file or stream are part of this SEG-Y dataset.',
-            'ByteOffset': '3521–3528: Byte offset of first trace relative to start of file or stream if known, otherwise zero. (64-bit unsigned integer value)',
-            'AdditionalTraceHeaderSamples': '3529–3532: Number of 3200-byte data trailer stanza records following the last trace (4 byte signed integer). A value of 0 indicates there are no trailer records.'
-        }
+        # Get the current value for this field
+        current_value = self.current_bin_headers_by_name.get(field_name)
         
-        decoder_key = field_mappings.get(field_name)
-        if decoder_key and decoder_key in decoder:
-            # Get the current value for this field
-            current_value = None
-            if hasattr(self, 'current_bin_headers') and self.current_bin_headers:
-                for key, value in self.current_bin_headers.items():
-                    if str(key) == field_name:
-                        current_value = value
-                        break
-            
-            # Build description text
-            description_text = f"<b>{field_name}</b><br><br>"
-            
-            # Add byte location information
-            byte_info = byte_locations.get(field_name, 'Byte location not specified')
-            description_text += f"<b>Byte Location:</b> {byte_info}<br><br>"
-            
-            description_text += f"<b>Current Value:</b> {current_value if current_value is not None else 'N/A'}<br><br>"
-            description_text += "<b>Possible Values:</b><br>"
-            
-            for value, desc in decoder[decoder_key].items():
-                description_text += f"• {value}: {desc}<br>"
-            
-            self.field_description_text.setHtml(description_text)
-        else:
-            # Even if no decoder, show byte location info
-            byte_info = byte_locations.get(field_name, 'Byte location not specified')
-            description_text = f"<b>{field_name}</b><br><br>"
-            description_text += f"<b>Byte Location:</b> {byte_info}<br><br>"
-            description_text += "No description available for this field."
-            self.field_description_text.setHtml(description_text)
+        if not self._field_description_needed(('binary', field_name, current_value)):
+            return
+        self._set_field_description_html(_render_bin_field_html(field_name, current_value))
     
     def show_trace_field_description(self, field_name):
         """Show description for a trace header field"""
-        # Trace header byte location mappings from SEG-Y Rev 2.0
-        trace_byte_locations = {
-            'TRACE_SEQUENCE_LINE': '1–4: Trace sequence number within line — Numbers continue to increase if the same line continues across multiple SEG-Y files.',
-            'TRACE_SEQUENCE_FILE': '5–8: Trace sequence number within SEG-Y file — Each file starts with trace sequence one.',
-            'FieldRecord': '9–12: Original field record number.',
-            'TraceNumber': '13–16: Trace number within the original field record. If supplying multi-cable data with identical channel numbers on each cable, either supply the cable ID number in bytes 153–156 of SEG-Y Trace Header Extension 1 or enter (cable–1)*nchan_per_cable+channel_no here.',
-            'EnergySourcePoint': '17–20: Energy source point number — Used when more than one record occurs at the same effective surface location. It is recommended that the new entry defined in Trace Header bytes 197–202 be used for shotpoint number.',
-            'CDP': '21–24: Ensemble number (i.e. CDP, CMP, CRP, etc.)',
-            'CDP_TRACE': '25–28: Trace number within the ensemble — Each ensemble starts with trace number one.',
-            'TraceIdentificationCode': '29–30: Trace identification code: –1 = Other, 0 = Unknown, 1 = Time domain seismic data, 2 = Dead, 3 = Dummy, 4 = Time break, 5 = Uphole, 6 = Sweep, 7 = Timing, 8 = Waterbreak, 9 = Near-field gun signature, 10 = Far-field gun signature, 11 = Seismic pressure sensor, 12 = Multicomponent seismic sensor – Vertical component, 13 = Multicomponent seismic sensor – Cross-line component, 14 = Multicomponent seismic sensor – In-line component, 15 = Rotated multicomponent seismic sensor – Vertical component, 16 = Rotated multicomponent seismic sensor – Transverse component, 17 = Rotated multicomponent seismic sensor – Radial component, 18 = Vibrator reaction mass, 19 = Vibrator baseplate, 20 = Vibrator estimated ground force, 21 = Vibrator reference, 22 = Time-velocity pairs, 23 = Time-depth pairs, 24 = Depth-velocity pairs, 25 = Depth domain seismic data, 26 = Gravity potential, 27 = Electric field – Vertical component, 28 = Electric field – Cross-line component, 29 = Electric field – In-line component, 30 = Rotated electric field – Vertical component, 31 = Rotated electric field – Transverse component, 32 = Rotated electric field – Radial component, 33 = Magnetic field – Vertical component, 34 = Magnetic field – Cross-line component, 35 = Magnetic field – In-line component, 36 = Rotated magnetic field – Vertical component, 37 = Rotated magnetic field – Transverse component, 38 = Rotated magnetic field – Radial component, 39 = Rotational sensor – Pitch, 40 = Rotational sensor – Roll, 41 = Rotational sensor – Yaw, 42 … 255 = Reserved, 256 … N = optional use, (maximum N = 16,383) N+16,384 = Interpolated, i.e. not original, seismic trace.',
-            'NSummedTraces': '31–32: Number of vertically summed traces yielding this trace. (1 is one trace, 2 is two summed traces, etc.)',
-            'NStackedTraces': '33–34: Number of horizontally stacked traces yielding this trace. (1 is one trace, 2 is two stacked traces, etc.)',
-            'DataUse': '35–36: Data use: 1 = Production, 2 = Test',
-            'offset': '37–40: Distance from center of the source point to the center of the receiver group (negative if opposite to direction in which line is shot).',
-            'ReceiverGroupElevation': '41–44: Elevation of receiver group. This is, of course, normally equal to or lower than the surface elevation at the group location. The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.',
-            'SourceSurfaceElevation': '45–48: Surface elevation at source location. The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.',
-            'SourceDepth': '49–52: Source depth below surface. The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.',
-            'ReceiverDatumElevation': '53–56: Seismic Datum elevation at receiver group. (If different from the survey vertical datum, Seismic Datum should be defined through a vertical CRS in an extended textual stanza.) The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.',
-            'SourceDatumElevation': '57–60: Seismic Datum elevation at source. (As above) The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.',
-            'SourceWaterDepth': '61–64: Water column height at source location (at time of source event). The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.',
-            'GroupWaterDepth': '65– 68: Water column height at receiver group location (at time of recording of first source event into that receiver). The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.',
-            'ElevationScalar': '69–70: Scalar to be applied to all elevations and depths specified in Standard Trace Header bytes 41–68 to give the real value. Scalar = 1, ±10, ±100, ±1000, or ±10,000. If positive, scalar is used as a multiplier; if negative, scalar is used as a divisor. A value of zero is assumed to be a scalar value of 1.',
-            'SourceGroupScalar': '71–72: Scalar to be applied to all coordinates specified in Standard Trace Header bytes 73–88 and to bytes Trace Header 181–188 to give the real value. Scalar = 1, ±10, ±100, ±1000, or ±10,000. If positive, scalar is used as a multiplier; if negative, scalar is used as divisor. A value of zero is assumed to be a scalar value of 1.',
-            'SourceX': '73–76: Source coordinate – X. The coordinate reference system should be identified through an Extended Textual Header (see Appendix D-1). If the coordinate units are in seconds of arc, decimal degrees or DMS, the X values represent longitude and the Y values latitude. A positive value designates east of Greenwich Meridian or north of the equator and a negative value designates south or west.',
-            'SourceY': '77–80: Source coordinate – Y. The coordinate reference system should be identified through an Extended Textual Header (see Appendix D-1). If the coordinate units are in seconds of arc, decimal degrees or DMS, the X values represent longitude and the Y values latitude. A positive value designates east of Greenwich Meridian or north of the equator and a negative value designates south or west.',
-            'GroupX': '81–84: Group coordinate – X. The coordinate reference system should be identified through an Extended Textual Header (see Appendix D-1). If the coordinate units are in seconds of arc, decimal degrees or DMS, the X values represent longitude and the Y values latitude. A positive value designates east of Greenwich Meridian or north of the equator and a negative value designates south or west.',
-            'GroupY': '85–88: Group coordinate – Y. The coordinate reference system should be identified through an Extended Textual Header (see Appendix D-1). If the coordinate units are in seconds of arc, decimal degrees or DMS, the X values represent longitude and the Y values latitude. A positive value designates east of Greenwich Meridian or north of the equator and a negative value designates south or west.',
-            'CoordinateUnits': '89–90: Coordinate units: 1 = Length (meters or feet as specified in Binary File Header bytes 3255-3256 and in Extended Textual Header if Location Data are included in the file), 2 = Seconds of arc (deprecated), 3 = Decimal degrees (preferred degree representation), 4 = Degrees, minutes, seconds (DMS). Note: To encode ±DDDMMSS set bytes 73–88 = ±DDD*104 + MM*102 + SS with bytes 71–72 set to 1; To encode ±DDDMMSS.ss set bytes 73–88 = ±DDD*106 + MM*104 + SS*102 + ss with bytes 71–72 set to –100.',
-            'WeatheringVelocity': '91–92: Weathering velocity. (ft/s or m/s as specified in Binary File Header bytes 3255– 3256)',
-            'SubWeatheringVelocity': '93–94: Subweathering velocity. (ft/s or m/s as specified in Binary File Header bytes 3255–3256)',
-            'SourceUpholeTime': '95–96: Uphole time at source in milliseconds. Time in milliseconds as scaled by the scalar specified in Standard Trace Header bytes 215-216.',
-            'GroupUpholeTime': '97–98: Uphole time at group in milliseconds. Time in milliseconds as scaled by the scalar specified in Standard Trace Header bytes 215-216.',
-            'SourceStaticCorrection': '99–100: Source static correction in milliseconds. Time in milliseconds as scaled by the scalar specified in Standard Trace Header bytes 215-216.',
-            'GroupStaticCorrection': '101–102: Group static correction in milliseconds. Time in milliseconds as scaled by the scalar specified in Standard Trace Header bytes 215-216.',
-            'TotalStaticApplied': '103–104: Total static applied in milliseconds. (Zero if no static has been applied,) Time in milliseconds as scaled by the scalar specified in Standard Trace Header bytes 215-216.',
-            'LagTimeA': '105–106: Lag time A — Time in milliseconds between end of 240-byte trace identification header and time break. The value is positive if time break occurs after the end of header; negative if time break occurs before the end of header. Time break is defined as the initiation pulse that may be recorded on an auxiliary trace or as otherwise specified by the recording system.',
-            'LagTimeB': '107–108: Lag Time B — Time in milliseconds between time break and the initiation time of the energy source. May be positive or negative.',
-            'DelayRecordingTime': '109–110: Delay recording time — Time in milliseconds between initiation time of energy source and the time when recording of data samples begins. In SEG-Y rev 0 this entry was intended for deep-water work if data recording did not start at zero time. The entry can be negative to accommodate negative start times (i.e. data recorded before time zero, presumably as a result of static application to the data trace). If a non-zero value (negative or positive) is recorded in this entry, a comment to that effect should appear in the Textual File Header.',
-            'MuteTimeStart': '111–112: Mute time — Start time in milliseconds.',
-            'MuteTimeEND': '113–114: Mute time — End time in milliseconds.',
-            'TRACE_SAMPLE_COUNT': '115–116: Number of samples in this trace. The number of bytes in a trace record must be consistent with the number of samples written in the Binary File Header and/or the SEG-defined Trace Header(s). This is important for all recording media; but it is particularly crucial for the correct processing of SEG-Y data in disk files (see Appendix A). If the fixed length trace flag in bytes 3503–3504 of the Binary File Header is set, the number of samples in every trace in the SEG-Y file is assumed to be the same as the value recorded in the Binary File Header and this field is ignored. If the fixed length trace flag is not set, the number of samples may vary from trace to trace.',
-            'TRACE_SAMPLE_INTERVAL': '117–118: Sample interval for this trace. Microseconds (µs) for time data, Hertz (Hz) for frequency data, meters (m) or feet (ft) for depth data. If the fixed length trace flag in bytes 3503–3504 of the Binary File Header is set, the sample interval in every trace in the SEG-Y file is assumed to be the same as the value recorded in the Binary File Header and this field is ignored. If the fixed length trace flag is not set, the sample interval may vary from trace to trace.',
-            'GainType': '119–120: Gain type of field instruments: 1 = fixed, 2 = binary, 3 = floating point, 4 … N = optional use',
-            'InstrumentGainConstant': '121–122: Instrument gain constant (dB).',
-            'InstrumentInitialGain': '123–124: Instrument early or initial gain (dB).',
-            'Correlated': '125–126: Correlated: 1 = no, 2 = yes',
-            'SweepFrequencyStart': '127–128: Sweep frequency at start (Hz).',
-            'SweepFrequencyEnd': '129–130: Sweep frequency at end (Hz).',
-            'SweepLength': '131–132: Sweep length in milliseconds.',
-            'SweepType': '133–134: Sweep type: 1 = linear, 2 = parabolic, 3 = exponential, 4 = other',
-            'SweepTraceTaperLengthStart': '135–136: Sweep trace taper length at start in milliseconds.',
-            'SweepTraceTaperLengthEnd': '137–138: Sweep trace taper length at end in milliseconds.',
-            'TaperType': '139–140: Taper type: 1 = linear, 2 = cos2, 3 = other',
-            'AliasFilterFrequency': '141–142: Alias filter frequency (Hz), if used.',
-            'AliasFilterSlope': '143–144: Alias filter slope (dB/octave).',
-            'NotchFilterFrequency': '145–146: Notch filter frequency (Hz), if used.',
-            'NotchFilterSlope': '147–148: Notch filter slope (dB/octave).',
-            'LowCutFrequency': '149–150: Low-cut frequency (Hz), if used.',
-            'HighCutFrequency': '151–152: High-cut frequency (Hz), if used.',
-            'LowCutSlope': '153–154: Low-cut slope (dB/octave)',
-            'HighCutSlope': '155–156: High-cut slope (dB/octave)',
-            'YearDataRecorded': '157–158: Year data recorded — The 1975 standard was unclear as to whether this should be recorded as a 2-digit or a 4-digit year and both have been used. For SEG-Y revisions beyond rev 0, the year should be recorded as the complete 4-digit Gregorian calendar year, e.g., the year 2001 should be recorded as 2001 (07D116).',
-            'DayOfYear': '159–160: Day of year (Range 1–366 for GMT, UTC, and GPS time basis).',
-            'HourOfDay': '161–162: Hour of day (24 hour clock).',
-            'MinuteOfHour': '163–164: Minute of hour.',
-            'SecondOfMinute': '165–166: Second of minute.',
-            'TimeBaseCode': '167–168: Time basis code. If nonzero, overrides Binary File Header bytes 3511–3512. 1 = Local, 2 = GMT (Greenwich Mean Time), 3 = Other, should be explained in a user defined stanza in the Extended Textual File Header, 4 = UTC (Coordinated Universal Time), 5 = GPS (Global Positioning System Time)',
-            'TraceWeightingFactor': '169–170: Trace weighting factor — Defined as 2–N units (volts unless bytes 203–204 specify a different unit) for the least significant bit. (N = 0, 1, …, 32767)',
-            'GeophoneGroupNumberRoll1': '171–172: Geophone group number of roll switch position one.',
-            'GeophoneGroupNumberFirstTraceOrigField': '173–174: Geophone group number of trace number one within original field record.',
-            'GeophoneGroupNumberLastTraceOrigField': '175–176: Geophone group number of last trace within original field record.',
-            'GapSize': '177–178: Gap size (total number of groups dropped).',
-            'OverTravel': '179–180: Over travel associated with taper at beginning or end of line: 1 = down (or behind), 2 = up (or ahead)',
-            'CDP_X': '181–184: X coordinate of ensemble (CDP) position of this trace (scalar in Standard Trace Header bytes 71–72 applies). The coordinate reference system should be identified through an Extended Textual Header (see Appendices D-1 or D-3).',
-            'CDP_Y': '185–188: Y coordinate of ensemble (CDP) position of this trace (scalar in Standard Trace Header bytes 71–72 applies). The coordinate reference system should be identified through an Extended Textual Header (see Appendices D-1 or D-3).',
-            'INLINE_3D': '189–192: For 3-D poststack data, this field should be used for the in-line number. If one in-line per SEG-Y file is being recorded, this value should be the same for all traces in the file and the same value will be recorded in bytes 3205–3208 of the Binary File Header.',
-            'CROSSLINE_3D': '193–196: For 3-D poststack data, this field should be used for the cross-line number. This will typically be the same value as the ensemble (CDP) number in Standard Trace Header bytes 21–24, but this does not have to be the case.',
-            'ShotPoint': '197–200: Shotpoint number — This is probably only applicable to 2-D poststack data. Note that it is assumed that the shotpoint number refers to the source location nearest to the ensemble (CDP) location for a particular trace. If this is not the case, there should be a comment in the Textual File Header explaining what the shotpoint number actually refers to.',
-            'ShotPointScalar': '201–202: Scalar to be applied to the shotpoint number in Standard Trace Header bytes 197–200 to give the real value. If positive, scalar is used as a multiplier; if negative as a divisor; if zero the shotpoint number is not scaled (i.e. it is an integer. A typical value will be –10, allowing shotpoint numbers with one decimal digit to the right of the decimal point).',
-            'TraceValueMeasurementUnit': '203–204: Trace value measurement unit: –1 = Other (should be described in Data Sample Measurement Units Stanza), 0 = Unknown, 1 = Pascal (Pa), 2 = Volts (v), 3 = Millivolts (mV), 4 = Amperes (A), 5 = Meters (m), 6 = Meters per second (m/s), 7 = Meters per second squared (m/s2), 8 = Newton (N), 9 = Watt (W), 10-255 = reserved for future use, 256 … N = optional use. (maximum N = 32,767)'
-        }
-        
         # Get the current value for this field
-        current_value = None
-        if hasattr(self, 'current_trace_headers') and self.current_trace_headers:
-            for key, value in self.current_trace_headers.items():
-                if str(key) == field_name:
-                    current_value = value
-                    break
+        current_value = self.current_trace_headers.get(field_name)
         
-        # Build description text
-        description_text = f"<b>{field_name}</b><br><br>"
-        
-        # Add byte location information
-        byte_info = trace_byte_locations.get(field_name, 'Byte location not specified')
-        description_text += f"<b>Byte Location:</b> {byte_info}<br><br>"
-        
-        description_text += f"<b>Current Value:</b> {current_value if current_value is not None else 'N/A'}<br><br>"
-        description_text += "This is a trace header field from the SEG-Y Rev 2.0 specification."
+        if not self._field_description_needed(('trace', field_name, current_value)):
+            return
         
-        self.field_description_text.setHtml(description_text)
+        # Fill in the description template with the byte location and current value
+        self._set_field_description_html(_TRACE_FIELD_TEMPLATE.format_map({
+            'field': field_name,
+            'byte': _trace_byte_location(field_name),
+            'value': current_value if current_value is not None else 'N/A',
+        }))
+    
+    def _field_description_needed(self, key):
+        """Return whether the Field Description panel must be re-rendered for key, recording it if so"""
+        # Nothing to draw into while the panel is hidden, and nothing to change if it already shows key
+        if not self.field_description_text.isVisible() or key == self.field_description_key:
+            return False
+        self.field_description_key = key
+        return True
+    
+    def _set_field_description_html(self, html):
+        """Replace the Field Description contents in place, reusing the panel's document"""
+        cursor = QTextCursor(self.field_description_text.document())
+        cursor.beginEditBlock()  # One layout pass for the remove and the insert
+        cursor.select(QTextCursor.SelectionType.Document)
+        cursor.removeSelectedText()
+        cursor.insertHtml(html)
+        cursor.endEditBlock()
     
     def get_binary_header_decoder(self):
         """Get decoder for binary header field values with descriptions based on SEG-Y Rev 2.0"""
-        decoder = {
-            # Data sample format code (bytes 3225-3226)
-            'DataSampleFormat': {
-                1: '4-byte IBM floating-point',
-                2: '4-byte, two\'s complement integer',
-                3: '2-byte, two\'s complement integer',
-                4: '4-byte fixed-point with gain (obsolete)',
-                5: '4-byte IEEE floating-point',
-                6: '8-byte IEEE floating-point',
-                7: '3-byte two\'s complement integer',
-                8: '1-byte, two\'s complement integer',
-                9: '8-byte, two\'s complement integer',
-                10: '4-byte, unsigned integer',
-                11: '2-byte, unsigned integer',
-                12: '8-byte, unsigned integer',
-                15: '3-byte, unsigned integer',
-                16: '1-byte, unsigned integer'
-            },
-            
-            # Trace sorting code (bytes 3229-3230)
-            'TraceSortingCode': {
-                -1: 'Other (should be explained in Extended Textual File Header)',
-                0: 'Unknown',
-                1: 'As recorded (no sorting)',
-                2: 'CDP ensemble',
-                3: 'Single fold continuous profile',
-                4: 'Horizontally stacked',
-                5: 'Common source point',
-                6: 'Common receiver point',
-                7: 'Common offset point',
-                8: 'Common mid-point',
-                9: 'Common conversion point'
-            },
-            
-            # Sweep type code (bytes 3239-3240)
-            'SweepTypeCode': {
-                1: 'Linear',
-                2: 'Parabolic',
-                3: 'Exponential',
-                4: 'Other'
-            },
-            
-            # Taper type (bytes 3247-3248)
-            'TaperType': {
-                1: 'Linear',
-                2: 'Cosine squared',
-                3: 'Other'
-            },
-            
-            # Correlated data traces (bytes 3249-3250)
-            'CorrelatedDataTraces': {
-                1: 'No',
-                2: 'Yes'
-            },
-            
-            # Binary gain recovered (bytes 3251-3252)
-            'BinaryGainRecovered': {
-                1: 'Yes',
-                2: 'No'
-            },
-            
-            # Amplitude recovery method (bytes 3253-3254)
-            'AmplitudeRecoveryMethod': {
-                1: 'None',
-                2: 'Spherical divergence',
-                3: 'AGC',
-                4: 'Other'
-            },
-            
-            # Measurement system (bytes 3255-3256)
-            'MeasurementSystem': {
-                1: 'Meters',
-                2: 'Feet'
-            },
-            
-            # Impulse signal polarity (bytes 3257-3258)
-            'ImpulseSignalPolarity': {
-                1: 'Increase in pressure or upward geophone case movement gives negative number on trace',
-                2: 'Increase in pressure or upward geophone case movement gives positive number on trace'
-            },
-            
-            # Vibratory polarity code (bytes 3259-3260)
-            'VibratoryPolarityCode': {
-                1: 'Seismic signal lags pilot signal by 337.5° to 22.5°',
-                2: 'Seismic signal lags pilot signal by 22.5° to 67.5°',
-                3: 'Seismic signal lags pilot signal by 67.5° to 112.5°',
-                4: 'Seismic signal lags pilot signal by 112.5° to 157.5°',
-                5: 'Seismic signal lags pilot signal by 157.5° to 202.5°',
-                6: 'Seismic signal lags pilot signal by 202.5° to 247.5°',
-                7: 'Seismic signal lags pilot signal by 247.5° to 292.5°',
-                8: 'Seismic signal lags pilot signal by 292.5° to 337.5°'
-            },
-            
-            # Time basis code (bytes 3511-3512)
-            'TimeBasisCode': {
-                1: 'Local',
-                2: 'GMT (Greenwich Mean Time)',
-                3: 'Other (should be explained in Extended Textual File Header)',
-                4: 'UTC (Coordinated Universal Time)',
-                5: 'GPS (Global Positioning System Time)'
-            },
-            
-            # Fixed length trace flag (bytes 3503-3504)
-            'FixedLengthTraceFlag': {
-                0: 'Variable length traces (traditional SEG-Y)',
-                1: 'Fixed length traces (all traces have same sample interval and number of samples)'
-            },
-            
-            # Additional binary header fields from SEG-Y Rev 2.0 specification
-            
-            # Job identification number (bytes 3201-3204)
-            'JobIdentificationNumber': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Line number (bytes 3205-3208)
-            'LineNumber': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Reel number (bytes 3209-3212)
-            'ReelNumber': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Number of data traces per record (bytes 3213-3214)
-            'NumberOfDataTracesPerRecord': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Number of auxiliary traces per record (bytes 3215-3216)
-            'NumberOfAuxiliaryTracesPerRecord': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Sample interval in microseconds (bytes 3217-3218)
-            'SampleIntervalInMicroseconds': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Sample interval in microseconds of original field recording (bytes 3219-3220)
-            'SampleIntervalInMicrosecondsOfOriginalFieldRecording': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Number of samples per data trace (bytes 3221-3222)
-            'NumberOfSamplesPerDataTrace': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Number of samples per data trace for original field recording (bytes 3223-3224)
-            'NumberOfSamplesPerDataTraceForOriginalFieldRecording': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Ensemble fold (bytes 3227-3228)
-            'EnsembleFold': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Vertical sum code (bytes 3231-3232)
-            'VerticalSumCode': {
-                1: 'No sum',
-                2: 'Two sum',
-                3: 'Three sum',
-                4: 'Four sum',
-                5: 'Five sum',
-                6: 'Six sum',
-                7: 'Seven sum',
-                8: 'Eight sum',
-                9: 'Nine sum',
-                10: 'Ten sum',
-                11: 'Eleven sum',
-                12: 'Twelve sum',
-                13: 'Thirteen sum',
-                14: 'Fourteen sum',
-                15: 'Fifteen sum',
-                16: 'Sixteen sum'
-            },
-            
-            # Sweep frequency at start (bytes 3233-3234)
-            'SweepFrequencyAtStart': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Sweep frequency at end (bytes 3235-3236)
-            'SweepFrequencyAtEnd': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Sweep length in milliseconds (bytes 3237-3238)
-            'SweepLengthInMilliseconds': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Sweep channel number (bytes 3241-3242)
-            'SweepChannelNumber': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Sweep trace taper length at start in milliseconds (bytes 3243-3244)
-            'SweepTraceTaperLengthAtStartInMilliseconds': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Sweep trace taper length at end in milliseconds (bytes 3245-3246)
-            'SweepTraceTaperLengthAtEndInMilliseconds': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Extended number of auxiliary traces per record (bytes 3255-3256)
-            'ExtendedNumberOfAuxiliaryTracesPerRecord': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Extended number of samples per data trace (bytes 3257-3258)
-            'ExtendedNumberOfSamplesPerDataTrace': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Extended number of samples per data trace for original field recording (bytes 3259-3260)
-            'ExtendedNumberOfSamplesPerDataTraceForOriginalFieldRecording': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Extended ensemble fold (bytes 3261-3262)
-            'ExtendedEnsembleFold': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # SEG-Y format revision number (bytes 3501-3502)
-            'SEGYFormatRevisionNumber': {
-                0: 'SEG-Y Rev 0',
-                1: 'SEG-Y Rev 1',
-                2: 'SEG-Y Rev 2'
-            },
-            
-            # SEG-Y format revision number minor (bytes 3503-3504)
-            'SEGYFormatRevisionNumberMinor': {
-                # This is typically a user-defined number, no standard values
-            },
-            
-            # Number of extended textual file header records (bytes 3505-3506)
-            'NumberOfExtendedTextualFileHeaderRecords': {
-                # This is typically a user-defined number, no standard values
-            }
-        }
-        return decoder
+        return _BINARY_HEADER_DECODER
     
     def decode_binary_header_value(self, field_name, value):
         """Decode a binary header field value to its description"""
-        decoder = self.get_binary_header_decoder()
-        
-        # Convert field_name to string if it's a BinField object
-        field_name_str = str(field_name)
-        
-        # Handle segyio's actual field names (based on the test output)
-        field_mappings = {
-            'DataSampleFormat': ['Format'],
-            'TraceSortingCode': ['SortingCode'],
-            'SweepTypeCode': ['Sweep'],
-            'TaperType': ['Taper'],
-            'CorrelatedDataTraces': ['CorrelatedTraces'],
-            'BinaryGainRecovered': ['BinaryGainRecovery'],
-            'AmplitudeRecoveryMethod': ['AmplitudeRecovery'],
-            'MeasurementSystem': ['MeasurementSystem'],
-            'ImpulseSignalPolarity': ['ImpulseSignalPolarity'],
-            'VibratoryPolarityCode': ['VibratoryPolarity'],
-            'FixedLengthTraceFlag': ['TraceFlag'],
-            'JobIdentificationNumber': ['JobID'],
-            'LineNumber': ['LineNumber'],
-            'ReelNumber': ['ReelNumber'],
-            'NumberOfDataTracesPerRecord': ['Traces'],
-            'NumberOfAuxiliaryTracesPerRecord': ['AuxTraces'],
-            'SampleIntervalInMicroseconds': ['Interval'],
-            'SampleIntervalInMicrosecondsOfOriginalFieldRecording': ['IntervalOriginal'],
-            'NumberOfSamplesPerDataTrace': ['Samples'],
-            'NumberOfSamplesPerDataTraceForOriginalFieldRecording': ['SamplesOriginal'],
-            'EnsembleFold': ['EnsembleFold'],
-            'VerticalSumCode': ['VerticalSum'],
-            'SweepFrequencyAtStart': ['SweepFrequencyStart'],
-            'SweepFrequencyAtEnd': ['SweepFrequencyEnd'],
-            'SweepLengthInMilliseconds': ['SweepLength'],
-            'SweepChannelNumber': ['SweepChannel'],
-            'SweepTraceTaperLengthAtStartInMilliseconds': ['SweepTaperStart'],
-            'SweepTraceTaperLengthAtEndInMilliseconds': ['SweepTaperEnd'],
-            'ExtendedNumberOfAuxiliaryTracesPerRecord': ['ExtAuxTraces'],
-            'ExtendedNumberOfSamplesPerDataTrace': ['ExtSamples'],
-            'ExtendedNumberOfSamplesPerDataTraceForOriginalFieldRecording': ['ExtSamplesOriginal'],
-            'ExtendedEnsembleFold': ['ExtEnsembleFold'],
-            'SEGYFormatRevisionNumber': ['SEGYRevision'],
-            'SEGYFormatRevisionNumberMinor': ['SEGYRevisionMinor'],
-            'NumberOfExtendedTextualFileHeaderRecords': ['ExtendedHeaders']
-        }
-        
-        # Find the correct decoder key
-        decoder_key = None
-        for key, variations in field_mappings.items():
-            if field_name_str in variations:
-                decoder_key = key
-                break
-        
-        if decoder_key and decoder_key in decoder:
-            if value in decoder[decoder_key]:
-                result = decoder[decoder_key][value]
-                return result
-            else:
-                return None  # Value not found in decoder, don't show "Unknown value"
-        else:
-            return None  # No decoder available for this field
+        return _decode_binary_header_value(field_name, value)
 
     def get_byte_location_mapping(self):
         """Get mapping of segyio field names to byte locations based on standard SEGY format"""
-        # This mapping is based on the actual segyio field names and their standard SEGY byte locations
-        # Each entry maps segyio field name to byte range in the 240-byte trace header
-        byte_mapping = {
-            # Bytes 1-4: Trace sequence number within line
-            'TRACE_SEQUENCE_LINE': '1-4',
-            'TRACE_SEQUENCE_NUMBER_LINE': '1-4',
-            
-            # Bytes 5-8: Trace sequence number within reel/file
-            'TRACE_SEQUENCE_FILE': '5-8',
-            'TRACE_SEQUENCE_NUMBER_REEL': '5-8',
-            'TRACE_SEQUENCE_NUMBER_FILE': '5-8',
-            
-            # Bytes 9-12: Original field record number
-            'FieldRecord': '9-12',
-            'FIELD_RECORD': '9-12',
-            'ORIGINAL_FIELD_RECORD': '9-12',
-            
-            # Bytes 13-16: Trace number within original field record
-            'TraceNumber': '13-16',
-            'TRACE_NUMBER': '13-16',
-            'TRACE_NUMBER_WITHIN_ORIGINAL_FIELD_RECORD': '13-16',
-            
-            # Bytes 17-20: Energy source point number
-            'EnergySourcePoint': '17-20',
-            'ENERGY_SOURCE_POINT': '17-20',
-            'ENERGY_SOURCE_POINT_NUMBER': '17-20',
-            
-            # Bytes 21-24: CDP ensemble number
-            'CDPEnsemble': '21-24',
-            'CDP_ENSEMBLE': '21-24',
-            'CDP_ENSEMBLE_NUMBER': '21-24',
-            'CDP': '21-24',
-            
-            # Bytes 25-26: Trace number within CDP ensemble
-            'TraceInEnsemble': '25-26',
-            'TRACE_IN_ENSEMBLE': '25-26',
-            'TRACE_NUMBER_WITHIN_CDP_ENSEMBLE': '25-26',
-            'CDP_TRACE': '25-26',
-            
-            # Bytes 27-28: Trace identification code
-            'TraceIdentificationCode': '27-28',
-            'TRACE_IDENTIFICATION_CODE': '27-28',
-            'TRACE_ID_CODE': '27-28',
-            
-            # Bytes 29-30: Number of vertically summed traces
-            'NumberOfVerticallySummedTraces': '29-30',
-            'NUMBER_OF_VERTICALLY_SUMMED_TRACES': '29-30',
-            'VERTICALLY_SUMMED_TRACES': '29-30',
-            'NSummedTraces': '29-30',
-            
-            # Bytes 31-32: Number of horizontally stacked traces
-            'NumberOfHorizontallyStackedTraces': '31-32',
-            'NUMBER_OF_HORIZONTALLY_STACKED_TRACES': '31-32',
-            'HORIZONTALLY_STACKED_TRACES': '31-32',
-            'NStackedTraces': '31-32',
-            
-            # Bytes 33-34: Data use
-            'DataUse': '33-34',
-            'DATA_USE': '33-34',
-            'DATA_USE_CODE': '33-34',
-            
-            # Bytes 35-40: Distance from center of source point to center of receiver group
-            'DistanceFromCenterOfSourcePoint': '35-40',
-            'DISTANCE_FROM_CENTER_OF_SOURCE_POINT': '35-40',
-            'DISTANCE_CENTER_SOURCE_TO_RECEIVER': '35-40',
-            'offset': '35-40',
-            
-            # Bytes 41-44: Receiver group elevation
-            'ReceiverGroupElevation': '41-44',
-            'RECEIVER_GROUP_ELEVATION': '41-44',
-            'GROUP_ELEVATION': '41-44',
-            
-            # Bytes 45-48: Surface elevation at source
-            'SurfaceElevationAtSource': '45-48',
-            'SURFACE_ELEVATION_AT_SOURCE': '45-48',
-            'SOURCE_SURFACE_ELEVATION': '45-48',
-            'SourceSurfaceElevation': '45-48',
-            
-            # Bytes 49-52: Source depth below surface
-            'SourceDepthBelowSurface': '49-52',
-            'SOURCE_DEPTH_BELOW_SURFACE': '49-52',
-            'SOURCE_DEPTH': '49-52',
-            'SourceDepth': '49-52',
-            
-            # Bytes 53-56: Datum elevation at receiver group
-            'DatumElevationAtReceiverGroup': '53-56',
-            'DATUM_ELEVATION_AT_RECEIVER_GROUP': '53-56',
-            'RECEIVER_DATUM_ELEVATION': '53-56',
-            'ReceiverDatumElevation': '53-56',
-            
-            # Bytes 57-60: Datum elevation at source
-            'DatumElevationAtSource': '57-60',
-            'DATUM_ELEVATION_AT_SOURCE': '57-60',
-            'SOURCE_DATUM_ELEVATION': '57-60',
-            'SourceDatumElevation': '57-60',
-            
-            # Bytes 61-64: Water depth at source
-            'WaterDepthAtSource': '61-64',
-            'WATER_DEPTH_AT_SOURCE': '61-64',
-            'SOURCE_WATER_DEPTH': '61-64',
-            'SourceWaterDepth': '61-64',
-            
-            # Bytes 65-68: Water depth at group
-            'WaterDepthAtGroup': '65-68',
-            'WATER_DEPTH_AT_GROUP': '65-68',
-            'GROUP_WATER_DEPTH': '65-68',
-            'GroupWaterDepth': '65-68',
-            
-            # Bytes 69-70: Scalar for elevations and depths
-            'ScalarForElevationsAndDepths': '69-70',
-            'SCALAR_FOR_ELEVATIONS_AND_DEPTHS': '69-70',
-            'ELEVATION_DEPTH_SCALAR': '69-70',
-            'ElevationScalar': '69-70',
-            
-            # Bytes 71-72: Scalar for coordinates
-            'ScalarForCoordinates': '71-72',
-            'SCALAR_FOR_COORDINATES': '71-72',
-            'COORDINATE_SCALAR': '71-72',
-            
-            # Bytes 73-76: Source coordinate X
-            'SourceCoordinateX': '73-76',
-            'SOURCE_COORDINATE_X': '73-76',
-            'SOURCE_X': '73-76',
-            'SourceX': '73-76',
-            
-            # Bytes 77-80: Source coordinate Y
-            'SourceCoordinateY': '77-80',
-            'SOURCE_COORDINATE_Y': '77-80',
-            'SOURCE_Y': '77-80',
-            'SourceY': '77-80',
-            
-            # Bytes 81-84: Group coordinate X
-            'GroupCoordinateX': '81-84',
-            'GROUP_COORDINATE_X': '81-84',
-            'GROUP_X': '81-84',
-            'GroupX': '81-84',
-            
-            # Bytes 85-88: Group coordinate Y
-            'GroupCoordinateY': '85-88',
-            'GROUP_COORDINATE_Y': '85-88',
-            'GROUP_Y': '85-88',
-            'GroupY': '85-88',
-            
-            # Bytes 89-90: Coordinate units
-            'CoordinateUnits': '89-90',
-            'COORDINATE_UNITS': '89-90',
-            'COORD_UNITS': '89-90',
-            
-            # Bytes 91-92: Weathering velocity
-            'WeatheringVelocity': '91-92',
-            'WEATHERING_VELOCITY': '91-92',
-            'WEATHERING_VEL': '91-92',
-            
-            # Bytes 93-94: Sub-weathering velocity
-            'SubWeatheringVelocity': '93-94',
-            'SUB_WEATHERING_VELOCITY': '93-94',
-            'SUB_WEATHERING_VEL': '93-94',
-            
-            # Bytes 95-96: Uphole time at source
-            'SourceUpholeTime': '95-96',
-            'SOURCE_UPHOLE_TIME': '95-96',
-            'SOURCE_UPHOLE': '95-96',
-            
-            # Bytes 97-98: Uphole time at group
-            'GroupUpholeTime': '97-98',
-            'GROUP_UPHOLE_TIME': '97-98',
-            'GROUP_UPHOLE': '97-98',
-            
-            # Bytes 99-100: Source static correction
-            'SourceStaticCorrection': '99-100',
-            'SOURCE_STATIC_CORRECTION': '99-100',
-            'SOURCE_STATIC': '99-100',
-            
-            # Bytes 101-102: Group static correction
-            'GroupStaticCorrection': '101-102',
-            'GROUP_STATIC_CORRECTION': '101-102',
-            'GROUP_STATIC': '101-102',
-            
-            # Bytes 103-104: Total static applied
-            'TotalStaticApplied': '103-104',
-            'TOTAL_STATIC_APPLIED': '103-104',
-            'TOTAL_STATIC': '103-104',
-            
-            # Bytes 105-106: Lag time A
-            'LagTimeA': '105-106',
-            'LAG_TIME_A': '105-106',
-            'LAG_A': '105-106',
-            
-            # Bytes 107-108: Lag time B
-            'LagTimeB': '107-108',
-            'LAG_TIME_B': '107-108',
-            'LAG_B': '107-108',
-            
-            # Bytes 109-110: Delay recording time
-            'DelayRecordingTime': '109-110',
-            'DELAY_RECORDING_TIME': '109-110',
-            'DELAY_TIME': '109-110',
-            
-            # Bytes 111-112: Mute time start
-            'MuteTimeStart': '111-112',
-            'MUTE_TIME_START': '111-112',
-            'MUTE_START': '111-112',
-            
-            # Bytes 113-114: Mute time end
-            'MuteTimeEnd': '113-114',
-            'MUTE_TIME_END': '113-114',
-            'MUTE_END': '113-114',
-            'MuteTimeEND': '113-114',
-            
-            # Bytes 115-116: Number of samples in this trace
-            'NumberOfSamples': '115-116',
-            'NUMBER_OF_SAMPLES': '115-116',
-            'SAMPLES': '115-116',
-            'TRACE_SAMPLE_COUNT': '115-116',
-            
-            # Bytes 117-118: Sample interval in microseconds
-            'SampleInterval': '117-118',
-            'SAMPLE_INTERVAL': '117-118',
-            'SAMPLE_RATE': '117-118',
-            'TRACE_SAMPLE_INTERVAL': '117-118',
-            
-            # Bytes 119-120: Gain type of field instruments
-            'GainType': '119-120',
-            'GAIN_TYPE': '119-120',
-            'INSTRUMENT_GAIN_TYPE': '119-120',
-            
-            # Bytes 121-122: Instrument gain constant
-            'InstrumentGainConstant': '121-122',
-            'INSTRUMENT_GAIN_CONSTANT': '121-122',
-            'GAIN_CONSTANT': '121-122',
-            
-            # Bytes 123-124: Instrument early or initial gain
-            'InstrumentInitialGain': '123-124',
-            'INSTRUMENT_INITIAL_GAIN': '123-124',
-            'INITIAL_GAIN': '123-124',
-            
-            # Bytes 125-126: Correlated
-            'Correlated': '125-126',
-            'CORRELATED': '125-126',
-            'CORRELATION_FLAG': '125-126',
-            
-            # Bytes 127-128: Sweep frequency at start
-            'SweepFrequencyStart': '127-128',
-            'SWEEP_FREQUENCY_START': '127-128',
-            'SWEEP_START_FREQ': '127-128',
-            
-            # Bytes 129-130: Sweep frequency at end
-            'SweepFrequencyEnd': '129-130',
-            'SWEEP_FREQUENCY_END': '129-130',
-            'SWEEP_END_FREQ': '129-130',
-            
-            # Bytes 131-132: Sweep length in milliseconds
-            'SweepLength': '131-132',
-            'SWEEP_LENGTH': '131-132',
-            'SWEEP_DURATION': '131-132',
-            
-            # Bytes 133-134: Sweep type
-            'SweepType': '133-134',
-            'SWEEP_TYPE': '133-134',
-            'SWEEP_TYPE_CODE': '133-134',
-            
-            # Bytes 135-136: Trace number of sweep channel
-            'TraceNumberOfSweepChannel': '135-136',
-            'TRACE_NUMBER_OF_SWEEP_CHANNEL': '135-136',
-            'SWEEP_CHANNEL_TRACE': '135-136',
-            
-            # Bytes 137-138: Sweep trace taper length at start
-            'SweepTraceTaperLengthStart': '137-138',
-            'SWEEP_TRACE_TAPER_LENGTH_START': '137-138',
-            'SWEEP_TAPER_START': '137-138',
-            
-            # Bytes 139-140: Sweep trace taper length at end
-            'SweepTraceTaperLengthEnd': '139-140',
-            'SWEEP_TRACE_TAPER_LENGTH_END': '139-140',
-            'SWEEP_TAPER_END': '139-140',
-            
-            # Bytes 141-142: Taper type
-            'TaperType': '141-142',
-            'TAPER_TYPE': '141-142',
-            'TAPER_TYPE_CODE': '141-142',
-            
-            # Bytes 143-144: Alias filter frequency
-            'AliasFilterFrequency': '143-144',
-            'ALIAS_FILTER_FREQUENCY': '143-144',
-            'ALIAS_FREQ': '143-144',
-            
-            # Bytes 145-146: Alias filter slope
-            'AliasFilterSlope': '145-146',
-            'ALIAS_FILTER_SLOPE': '145-146',
-            'ALIAS_SLOPE': '145-146',
-            
-            # Bytes 147-148: Notch filter frequency
-            'NotchFilterFrequency': '147-148',
-            'NOTCH_FILTER_FREQUENCY': '147-148',
-            'NOTCH_FREQ': '147-148',
-            
-            # Bytes 149-150: Notch filter slope
-            'NotchFilterSlope': '149-150',
-            'NOTCH_FILTER_SLOPE': '149-150',
-            'NOTCH_SLOPE': '149-150',
-            
-            # Bytes 151-152: Low-cut frequency
-            'LowCutFrequency': '151-152',
-            'LOW_CUT_FREQUENCY': '151-152',
-            'LOW_CUT_FREQ': '151-152',
-            
-            # Bytes 153-154: High-cut frequency
-            'HighCutFrequency': '153-154',
-            'HIGH_CUT_FREQUENCY': '153-154',
-            'HIGH_CUT_FREQ': '153-154',
-            
-            # Bytes 155-156: Low-cut slope
-            'LowCutSlope': '155-156',
-            'LOW_CUT_SLOPE': '155-156',
-            'LOW_CUT_SLOPE_DB': '155-156',
-            
-            # Bytes 157-158: High-cut slope
-            'HighCutSlope': '157-158',
-            'HIGH_CUT_SLOPE': '157-158',
-            'HIGH_CUT_SLOPE_DB': '157-158',
-            
-            # Bytes 159-160: Year data recorded
-            'YearDataRecorded': '159-160',
-            'YEAR_DATA_RECORDED': '159-160',
-            'RECORDING_YEAR': '159-160',
-            
-            # Bytes 161-162: Day of year
-            'DayOfYear': '161-162',
-            'DAY_OF_YEAR': '161-162',
-            'JULIAN_DAY': '161-162',
-            
-            # Bytes 163-164: Hour of day
-            'HourOfDay': '163-164',
-            'HOUR_OF_DAY': '163-164',
-            'RECORDING_HOUR': '163-164',
-            
-            # Bytes 165-166: Minute of hour
-            'MinuteOfHour': '165-166',
-            'MINUTE_OF_HOUR': '165-166',
-            'RECORDING_MINUTE': '165-166',
-            
-            # Bytes 167-168: Second of minute
-            'SecondOfMinute': '167-168',
-            'SECOND_OF_MINUTE': '167-168',
-            'RECORDING_SECOND': '167-168',
-            
-            # Bytes 169-170: Time basis code
-            'TimeBasisCode': '169-170',
-            'TIME_BASIS_CODE': '169-170',
-            'TIME_BASIS': '169-170',
-            'TimeBaseCode': '169-170',
-            
-            # Bytes 171-172: Trace weighting factor
-            'TraceWeightingFactor': '171-172',
-            'TRACE_WEIGHTING_FACTOR': '171-172',
-            'WEIGHTING_FACTOR': '171-172',
-            
-            # Bytes 173-174: Geophone group number of roll switch position one
-            'GeophoneGroupNumberRoll1': '173-174',
-            'GEOPHONE_GROUP_NUMBER_ROLL1': '173-174',
-            'GEOPHONE_ROLL1': '173-174',
-            
-            # Bytes 175-176: Geophone group number of trace one within original field record
-            'GeophoneGroupNumberFirstTraceOrigField': '175-176',
-            'GEOPHONE_GROUP_NUMBER_FIRST_TRACE_ORIG_FIELD': '175-176',
-            'GEOPHONE_FIRST_TRACE': '175-176',
-            
-            # Bytes 177-178: Geophone group number of last trace within original field record
-            'GeophoneGroupNumberLastTraceOrigField': '177-178',
-            'GEOPHONE_GROUP_NUMBER_LAST_TRACE_ORIG_FIELD': '177-178',
-            'GEOPHONE_LAST_TRACE': '177-178',
-            
-            # Bytes 179-180: Gap size
-            'GapSize': '179-180',
-            'GAP_SIZE': '179-180',
-            'GAP': '179-180',
-            
-            # Bytes 181-182: Over travel associated with taper
-            'OverTravel': '181-182',
-            'OVER_TRAVEL': '181-182',
-            'OVER_TRAVEL_TAPER': '181-182',
-            
-            # Bytes 183-184: CDP X coordinate
-            'CDPX': '183-184',
-            'CDP_X': '183-184',
-            'CDP_X_COORDINATE': '183-184',
-            
-            # Bytes 185-188: CDP Y coordinate
-            'CDPY': '185-188',
-            'CDP_Y': '185-188',
-            'CDP_Y_COORDINATE': '185-188',
-            
-            # Bytes 189-192: Inline number
-            'InlineNumber': '189-192',
-            'INLINE_NUMBER': '189-192',
-            'INLINE': '189-192',
-            'INLINE_3D': '189-192',
-            
-            # Bytes 193-196: Crossline number
-            'CrosslineNumber': '193-196',
-            'CROSSLINE_NUMBER': '193-196',
-            'CROSSLINE': '193-196',
-            'CROSSLINE_3D': '193-196',
-            
-            # Bytes 197-200: Shotpoint number
-            'ShotpointNumber': '197-200',
-            'SHOTPOINT_NUMBER': '197-200',
-            'SHOTPOINT': '197-200',
-            'ShotPoint': '197-200',
-            
-            # Bytes 201-202: Shotpoint scalar
-            'ShotpointScalar': '201-202',
-            'SHOTPOINT_SCALAR': '201-202',
-            'SHOTPOINT_SCALE': '201-202',
-            'ShotPointScalar': '201-202',
-            
-            # Bytes 203-204: Trace value measurement unit
-            'TraceValueMeasurementUnit': '203-204',
-            'TRACE_VALUE_MEASUREMENT_UNIT': '203-204',
-            'TRACE_UNIT': '203-204',
-            
-            # Bytes 205-208: Transduction constant mantissa
-            'TransductionConstantMantissa': '205-208',
-            'TRANSDUCTION_CONSTANT_MANTISSA': '205-208',
-            'TRANSDUCTION_MANTISSA': '205-208',
-            
-            # Bytes 209-210: Transduction constant exponent
-            'TransductionConstantExponent': '209-210',
-            'TRANSDUCTION_CONSTANT_EXPONENT': '209-210',
-            'TRANSDUCTION_EXPONENT': '209-210',
-            'TransductionConstantPower': '209-210',
-            
-            # Bytes 211-212: Transduction units
-            'TransductionUnits': '211-212',
-            'TRANSDUCTION_UNITS': '211-212',
-            'TRANSDUCTION_UNIT': '211-212',
-            'TransductionUnit': '211-212',
-            
-            # Bytes 213-214: Trace identifier
-            'TraceIdentifier': '213-214',
-            'TRACE_IDENTIFIER': '213-214',
-            'TRACE_ID': '213-214',
-            
-            # Bytes 215-216: Scalar for elevations
-            'ScalarForElevations': '215-216',
-            'SCALAR_FOR_ELEVATIONS': '215-216',
-            'ELEVATION_SCALAR': '215-216',
-            'ScalarTraceHeader': '215-216',
-            
-            # Bytes 217-220: Source group scalar
-            'SourceGroupScalar': '217-220',
-            'SOURCE_GROUP_SCALAR': '217-220',
-            'SOURCE_GROUP_SCALE': '217-220',
-            
-            # Bytes 221-222: Source group scalar units
-            'SourceGroupScalarUnits': '221-222',
-            'SOURCE_GROUP_SCALAR_UNITS': '221-222',
-            'SOURCE_GROUP_UNITS': '221-222',
-            
-            # Bytes 223-226: Group scalar
-            'GroupScalar': '223-226',
-            'GROUP_SCALAR': '223-226',
-            'GROUP_SCALE': '223-226',
-            
-            # Bytes 227-228: Group scalar units
-            'GroupScalarUnits': '227-228',
-            'GROUP_SCALAR_UNITS': '227-228',
-            'GROUP_UNITS': '227-228',
-            
-            # Bytes 229-232: Source coordinate X (extended)
-            'SourceCoordinateXExtended': '229-232',
-            'SOURCE_COORDINATE_X_EXTENDED': '229-232',
-            'SOURCE_X_EXT': '229-232',
-            
-            # Bytes 233-236: Source coordinate Y (extended)
-            'SourceCoordinateYExtended': '233-236',
-            'SOURCE_COORDINATE_Y_EXTENDED': '233-236',
-            'SOURCE_Y_EXT': '233-236',
-            
-            # Bytes 237-240: Group coordinate X (extended)
-            'GroupCoordinateXExtended': '237-240',
-            'GROUP_COORDINATE_X_EXTENDED': '237-240',
-            'GROUP_X_EXT': '237-240',
-            
-            # Additional fields that may appear in segyio but are not in standard 240-byte header
-            # These are likely extended or custom fields
-            'SourceType': 'Extended',
-            'SourceEnergyDirectionMantissa': 'Extended',
-            'SourceEnergyDirectionExponent': 'Extended',
-            'SourceMeasurementMantissa': 'Extended',
-            'SourceMeasurementExponent': 'Extended',
-            'SourceMeasurementUnit': 'Extended',
-            'UnassignedInt1': 'Extended',
-            'UnassignedInt2': 'Extended'
-        }
-        return byte_mapping
+        return _trace_byte_ranges()
     
     def on_trace_selected(self, trace_number):
         """Handle trace selection from plot click"""
@@ -2040,39 +3213,52 @@ class SegyGui(QMainWindow):
         if self.current_headers is None:
             return
         
+        # Nothing is drawn while the panel is hidden; render the latest selection once it shows
+        if not self.trace_info_text.isVisible():
+            self.pending_trace_number = trace_number
+            return
+        self.pending_trace_number = None
+        
         # Clear field description when selecting a new trace
         self.field_description_text.setPlainText("")
+        self.field_description_key = None
+        
+        # Revisiting a trace reuses its formatted rows instead of formatting every field again
+        cache_key = (trace_number, self.show_byte_locations)
+        cached = self.trace_info_cache.get(cache_key)
+        if cached is not None:
+            self.trace_info_cache.move_to_end(cache_key)
+            title, rows, self.current_trace_headers = cached
+            self._set_trace_info_rows(title, rows)
+            self.statusBar().showMessage(f"Selected trace {trace_number}")
+            return
         
         try:
             # Get the trace header data for the selected trace
-            trace_data = self.current_headers.loc[trace_number]
+            trace_data = self.current_headers.trace(trace_number)
             
             # Store current trace headers for field description lookup
             self.current_trace_headers = trace_data.to_dict()
             
             # Format the trace information
-            info_text = f"TRACE HEADER INFORMATION<br>"
-            info_text += f"{'='*50}<br>"
-            info_text += f"CDP Number: {trace_number}<br><br>"
+            rule = "=" * 50
+            title = (f"TRACE HEADER INFORMATION\n{rule}\nCDP Number: {trace_number}\n\n"
+                     f"ALL TRACE HEADER FIELDS:\n{rule}\n")
             
             # Display ALL trace header fields that exist in the data
-            info_text += f"ALL TRACE HEADER FIELDS:<br>"
-            info_text += f"{'='*50}<br>"
-            
-            # Get byte location mapping if needed
-            byte_mapping = self.get_byte_location_mapping() if self.show_byte_locations else None
-            
-            for field, value in trace_data.items():
-                if not pd.isna(value):
-                    if self.show_byte_locations and field in byte_mapping:
-                        info_text += f"<span style='text-decoration: underline; cursor: pointer;'>{field}</span> (bytes {byte_mapping[field]}): {value}<br>"
-                    elif self.show_byte_locations:
-                        # For fields not in mapping, show a generic byte location based on field order
-                        info_text += f"<span style='text-decoration: underline; cursor: pointer;'>{field}</span> (bytes ?): {value}<br>"
-                    else:
-                        info_text += f"<span style='text-decoration: underline; cursor: pointer;'>{field}</span>: {value}<br>"
-            
-            self.trace_info_text.setHtml(info_text)
+            # Integer header columns cannot hold NaN; other dtypes drop their empty fields first
+            if trace_data.dtype.kind not in 'iu':
+                trace_data = trace_data.dropna()
+            # The text after each field name only depends on the file's columns, so it is built once
+            fields = tuple(trace_data.index.tolist())
+            separators = _trace_row_separators(fields, self.show_byte_locations)
+            rows = [(field, f"{separator}{value}\n") for field, separator, value
+                    in zip(fields, separators, trace_data.astype(str).tolist())]
+            
+            self._set_trace_info_rows(title, rows)
+            self.trace_info_cache[cache_key] = (title, rows, self.current_trace_headers)
+            if len(self.trace_info_cache) > TRACE_INFO_CACHE_SIZE:
+                self.trace_info_cache.popitem(last=False)
             
             # Update status bar
             self.statusBar().showMessage(f"Selected trace {trace_number}")
@@ -2081,6 +3267,23 @@ class SegyGui(QMainWindow):
             error_text = f"Error displaying trace {trace_number} information:\n{str(e)}"
             self.trace_info_text.setPlainText(error_text)
     
+    def _set_trace_info_rows(self, title, rows):
+        """Fill the Trace Info panel directly through a cursor, so no HTML has to be parsed"""
+        document = self.trace_info_text.document()
+        document.clear()
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()  # One layout pass for the whole page
+        cursor.insertText(title, self.plain_format)
+        for field, rest in rows:
+            cursor.insertText(field, self.link_format)
+            cursor.insertText(rest, self.plain_format)
+        cursor.endEditBlock()
+    
+    def show_pending_trace_info(self):
+        """Display the trace selected while the Trace Info panel was hidden, if any"""
+        if self.pending_trace_number is not None:
+            self.display_trace_info(self.pending_trace_number)
+    
     def on_load_error(self, error_msg):
         """Handle file loading error"""
         self.file_button.setEnabled(True)
@@ -2096,117 +3299,103 @@ class SegyGui(QMainWindow):
         if not self.current_file_info:
             return
         
-        info_text = f"FILE INFORMATION<br>"
-        info_text += f"{'='*50}<br>"
-        info_text += f"Filename: {self.current_file_info['filename']}<br>"
-        info_text += f"Number of Traces: {self.current_file_info['n_traces']:,}<br>"
-        info_text += f"Number of Samples: {self.current_file_info['n_samples']:,}<br>"
-        info_text += f"Sample Rate: {self.current_file_info['sample_rate']:.2f} ms<br>"
-        info_text += f"Time Window: {self.current_file_info['twt'][0]:.1f} - {self.current_file_info['twt'][-1]:.1f} ms<br><br>"
+        file_info = self.current_file_info
+        parts = ["FILE INFORMATION<br>", _RULE_BR,
+                 f"Filename: {file_info['filename']}<br>",
+                 f"Number of Traces: {file_info['n_traces']:,}<br>",
+                 f"Number of Samples: {file_info['n_samples']:,}<br>",
+                 f"Sample Rate: {file_info['sample_rate']:.2f} ms<br>",
+                 f"Time Window: {file_info['twt'][0]:.1f} - {file_info['twt'][-1]:.1f} ms<br><br>"]
         
         # Binary headers
-        info_text += f"BINARY HEADERS<br>"
-        info_text += f"{'='*50}<br>"
-        for key, value in self.current_bin_headers.items():
-            field_name = str(key)
-            # Make field names clickable for all binary header fields
-            clickable_fields = ['JobID', 'LineNumber', 'ReelNumber', 'Traces', 'AuxTraces', 
-                              'Interval', 'IntervalOriginal', 'Samples', 'SamplesOriginal', 
-                              'Format', 'EnsembleFold', 'SortingCode', 'VerticalSum', 
-                              'SweepFrequencyStart', 'SweepFrequencyEnd', 'SweepLength', 
-                              'Sweep', 'SweepChannel', 'SweepTaperStart', 'SweepTaperEnd', 
-                              'Taper', 'CorrelatedTraces', 'BinaryGainRecovery', 
-                              'AmplitudeRecovery', 'MeasurementSystem', 'ImpulseSignalPolarity', 
-                              'VibratoryPolarity', 'ExtAuxTraces', 'ExtSamples', 
-                              'ExtSamplesOriginal', 'ExtEnsembleFold', 'SEGYRevision', 
-                              'SEGYRevisionMinor', 'TraceFlag', 'ExtendedHeaders']
-            
+        parts += ["BINARY HEADERS<br>", _RULE_BR]
+        for field_name, value, description in decode_binary_headers(self.current_bin_headers):
             # Always show descriptions (headers are always expanded)
-            if field_name in clickable_fields:
-                # Try to decode the value
-                description = self.decode_binary_header_value(key, value)
+            if field_name in _CLICKABLE_BIN_FIELDS:
                 if description:
-                    info_text += f"<span style='text-decoration: underline; cursor: pointer;'>{field_name}</span>: {value} ({description})<br>"
+                    parts.append(f"{_SPAN_OPEN}{field_name}</span>: {value} ({description})<br>")
                 else:
-                    info_text += f"<span style='text-decoration: underline; cursor: pointer;'>{field_name}</span>: {value}<br>"
+                    parts.append(f"{_SPAN_OPEN}{field_name}</span>: {value}<br>")
             else:
-                # Try to decode the value
-                description = self.decode_binary_header_value(key, value)
                 if description:
-                    info_text += f"{field_name}: {value} ({description})<br>"
+                    parts.append(f"{field_name}: {value} ({description})<br>")
                 else:
-                    info_text += f"{field_name}: {value}<br>"
-        info_text += "<br>"
+                    parts.append(f"{field_name}: {value}<br>")
+        parts.append("<br>")
         
         # Text headers
-        info_text += f"TEXT HEADERS<br>"
-        info_text += f"{'='*50}<br>"
+        parts += ["TEXT HEADERS<br>", _RULE_BR]
         for key, value in self.current_text_headers.items():
-            info_text += f"{key}: {value}<br>"
-        info_text += "<br>"
+            parts.append(f"{key}: {value}<br>")
+        parts.append("<br>")
         
+        info_text = "".join(parts)
         self.headers_text.setHtml(info_text)
     
     def on_colormap_changed(self, colormap):
         """Handle colormap selection change - automatically update plot if data is loaded"""
         if self.current_data is not None and self.current_file_info is not None:
-            # Save the new colormap setting
-            self.config.update_colormap(colormap)
-            # Automatically update the plot
-            self.update_plot()
+            # Automatically update the plot once the value settles (the replot saves the setting)
+            self.replot_timer.start()
     
     def on_clip_enabled_changed(self, state):
         """Handle clip checkbox change - automatically update plot if data is loaded"""
-        # If Clip is checked, uncheck Standard Deviation
+        # If Clip is checked, uncheck Standard Deviation (silently; this handler replots once)
         if self.clip_checkbox.isChecked():
-            self.std_dev_checkbox.setChecked(False)
+            self._set_checked_silently(self.std_dev_checkbox, False)
         
         if self.current_data is not None and self.current_file_info is not None:
-            # Automatically update the plot
-            self.update_plot()
+            # Automatically update the plot once the value settles
+            self.replot_timer.start()
     
     def on_std_dev_enabled_changed(self, state):
         """Handle standard deviation checkbox change - automatically update plot if data is loaded"""
-        # If Standard Deviation is checked, uncheck the Clip checkbox
+        # If Standard Deviation is checked, uncheck the Clip checkbox (silently; this handler replots once)
         if self.std_dev_checkbox.isChecked():
-            self.clip_checkbox.setChecked(False)
+            self._set_checked_silently(self.clip_checkbox, False)
         
         if self.current_data is not None and self.current_file_info is not None:
-            # Automatically update the plot
-            self.update_plot()
+            # Automatically update the plot once the value settles
+            self.replot_timer.start()
+    
+    def _set_checked_silently(self, checkbox, checked):
+        """Change a checkbox without running its stateChanged handler"""
+        checkbox.blockSignals(True)
+        checkbox.setChecked(checked)
+        checkbox.blockSignals(False)
     
     def on_std_dev_changed(self, value):
         """Handle standard deviation value change - automatically update plot if data is loaded"""
         if self.current_data is not None and self.current_file_info is not None:
             # Only update if standard deviation is enabled
             if self.std_dev_checkbox.isChecked():
-                # Automatically update the plot
-                self.update_plot()
+                # Automatically update the plot once the value settles
+                self.replot_timer.start()
     
     def on_clip_percentile_changed(self, percentile):
         """Handle clip percentile change - automatically update plot if data is loaded"""
         if self.current_data is not None and self.current_file_info is not None:
-            # Save the new clip percentile setting
-            self.config.update_clip_percentile(percentile)
-            # Automatically update the plot
-            self.update_plot()
+            # Automatically update the plot once the value settles (the replot saves the setting)
+            self.replot_timer.start()
     
     def on_depth_mode_changed(self, state):
         """Handle depth mode toggle change - automatically update plot if data is loaded"""
         if self.current_data is not None and self.current_file_info is not None:
-            # Automatically update the plot
-            self.update_plot()
+            # Automatically update the plot once the value settles
+            self.replot_timer.start()
     
     def on_velocity_changed(self, velocity):
         """Handle velocity change - automatically update plot if data is loaded and depth mode is on"""
         if self.current_data is not None and self.current_file_info is not None:
             # Only update if depth mode is enabled
             if self.depth_mode_checkbox.isChecked():
-                # Automatically update the plot
-                self.update_plot()
+                # Automatically update the plot once the value settles
+                self.replot_timer.start()
     
     def update_plot(self):
         """Update the plot with current settings"""
+        # A direct update supersedes any replot still waiting on the timer
+        self.replot_timer.stop()
         if self.current_data is not None and self.current_file_info is not None:
             clip_percentile = self.clip_spinbox.value()
             colormap = self.colormap_combo.currentText()
@@ -2224,22 +3413,55 @@ class SegyGui(QMainWindow):
             self.depth_mode = depth_mode
             self.velocity = velocity
             
-            vm, vm1 = self.plot_widget.plot_segy_data(
-                self.current_data, 
-                self.current_file_info, 
-                self.current_headers,
-                clip_percentile, 
-                colormap,
-                depth_mode,
-                velocity,
-                clip_enabled,
-                std_dev_enabled,
-                std_dev_value
-            )
+            plot_args = (self.current_data, self.current_file_info, self.current_headers,
+                         clip_percentile, colormap, depth_mode, velocity,
+                         clip_enabled, std_dev_enabled, std_dev_value)
+            limit_args = (clip_enabled, clip_percentile, std_dev_enabled, std_dev_value)
+            
+            # A render still waiting for its color limits is superseded by this one
+            self.plot_generation += 1
+            if self.current_file_info.get('stats') is None and (
+                    self.current_data_max is None
+                    or not self.plot_widget.color_limits_cached(self.current_data, *limit_args)):
+                # Without the per-file stats the limits need full passes over the data; compute
+                # them off the GUI thread and draw once they arrive
+                generation = self.plot_generation
+                
+                def on_finished(result):
+                    self.on_color_limits_ready(generation, plot_args, limit_args, result)
+                
+                self.statusBar().showMessage("Computing color limits...")
+                self._start_worker(self.plot_pool, on_finished, self.on_color_limits_error,
+                                   self._scan_color_limits, self.current_data, limit_args)
+                return
             
-            self.statusBar().showMessage(
-                f"Plot updated - {clip_percentile}th percentile: {vm:.0f}, Max: {self.current_data.max():.0f}"
-            )
+            self._draw_plot(plot_args)
+    
+    def _scan_color_limits(self, data, limit_args):
+        """Compute the color limits and maximum of the data (runs on the plot pool)"""
+        limits = self.plot_widget._compute_color_limits(data, *limit_args)
+        return limits, float(data.max())
+    
+    def on_color_limits_ready(self, generation, plot_args, limit_args, result):
+        """Cache color limits computed in the background and draw if they are still wanted"""
+        data = plot_args[0]
+        if data is not self.current_data:
+            return  # Another file was loaded in the meantime
+        limits, self.current_data_max = result
+        self.plot_widget.store_color_limits(data, *limit_args, limits)
+        if generation == self.plot_generation:
+            self._draw_plot(plot_args)
+    
+    def on_color_limits_error(self, error_msg):
+        """Report a failed background color limit computation"""
+        self.statusBar().showMessage(f"Error computing color limits: {error_msg}")
+    
+    def _draw_plot(self, plot_args):
+        """Draw the plot on the GUI thread and report the limits in the status bar"""
+        vm, vm1 = self.plot_widget.plot_segy_data(*plot_args)
+        self.statusBar().showMessage(
+            f"Plot updated - {plot_args[3]}th percentile: {vm:.0f}, Max: {self.current_data_max:.0f}"
+        )
     
     def save_plot(self):
         """Save the current plot to a file"""
@@ -2257,28 +3479,31 @@ class SegyGui(QMainWindow):
             self.config.update_last_save_directory(save_dir)
             
             # Generate filename based on original SEGY file
-            base_name = Path(self.current_file_info['filename']).stem
-            save_path = os.path.join(save_dir, f"{base_name}_plot.png")
+            save_path = os.path.join(save_dir, f"{self.current_file_stem}_plot.png")
             
             try:
                 # Check if full resolution is enabled
-                full_resolution = self.full_res_checkbox.isChecked()
-                
-                if full_resolution:
-                    # Show progress for full resolution export
+                if self.full_res_checkbox.isChecked():
+                    # Render the full resolution export on the save pool so the GUI stays responsive
                     self.statusBar().showMessage("Exporting full resolution plot...")
-                    QApplication.processEvents()  # Update UI
+                    fn, args = self.plot_widget.full_resolution_export(save_path)
+                    self._start_save(self.on_full_resolution_plot_saved, self.on_plot_save_error, fn, *args)
+                    return
                 
-                self.plot_widget.save_plot(save_path, full_resolution=full_resolution)
-                
-                if full_resolution:
-                    QMessageBox.information(self, "Success", f"Full resolution plot saved to:\n{save_path}")
-                    self.statusBar().showMessage(f"Full resolution plot saved to {save_path}")
-                else:
-                    QMessageBox.information(self, "Success", f"Plot saved to:\n{save_path}")
-                    self.statusBar().showMessage(f"Plot saved to {save_path}")
+                self.plot_widget.save_plot(save_path)
+                QMessageBox.information(self, "Success", f"Plot saved to:\n{save_path}")
+                self.statusBar().showMessage(f"Plot saved to {save_path}")
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save plot:\n{str(e)}")
+                self.on_plot_save_error(str(e))
+    
+    def on_full_resolution_plot_saved(self, save_path):
+        """Report a finished full resolution export"""
+        QMessageBox.information(self, "Success", f"Full resolution plot saved to:\n{save_path}")
+        self.statusBar().showMessage(f"Full resolution plot saved to {save_path}")
+    
+    def on_plot_save_error(self, error_msg):
+        """Report a failed plot save"""
+        QMessageBox.critical(self, "Error", f"Failed to save plot:\n{error_msg}")
     
     def save_shapefile(self):
         """Save CDP coordinates as a shapefile"""
@@ -2296,33 +3521,40 @@ class SegyGui(QMainWindow):
             self.config.update_last_save_directory(save_dir)
             
             # Generate filename based on original SEGY file
-            base_name = Path(self.current_file_info['filename']).stem
+            base_name = self.current_file_stem
             shapefile_path = os.path.join(save_dir, f"{base_name}_source_points.shp")
             
-            try:
-                self.statusBar().showMessage("Creating shapefile...")
-                QApplication.processEvents()  # Update UI
-                
-                # Create shapefiles with source coordinates
-                coord_info, point_path, line_path = self._create_cdp_shapefile(shapefile_path)
-                
-                # Show success message with coordinate system info
-                if coord_info:
-                    QMessageBox.information(self, "Success", 
-                        f"Shapefiles saved:\n"
-                        f"Points: {point_path}\n"
-                        f"Line: {line_path}\n\n"
-                        f"Coordinate System: {coord_info}")
-                else:
-                    QMessageBox.information(self, "Success", 
-                        f"Shapefiles saved:\n"
-                        f"Points: {point_path}\n"
-                        f"Line: {line_path}")
-                self.statusBar().showMessage(f"Shapefiles saved: {point_path}, {line_path}")
-                
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save shapefile:\n{str(e)}")
-                self.statusBar().showMessage("Shapefile export failed")
+            self.statusBar().showMessage("Creating shapefile...")
+            self.save_shapefile_button.setEnabled(False)
+            
+            # Create shapefiles with source coordinates on the save pool
+            self._start_save(self.on_shapefile_saved, self.on_shapefile_error,
+                             self._create_cdp_shapefile, shapefile_path, self.current_headers)
+    
+    def on_shapefile_saved(self, result):
+        """Report shapefiles written by the save pool"""
+        coord_info, point_path, line_path = result
+        self.save_shapefile_button.setEnabled(True)
+        
+        # Show success message with coordinate system info
+        if coord_info:
+            QMessageBox.information(self, "Success", 
+                f"Shapefiles saved:\n"
+                f"Points: {point_path}\n"
+                f"Line: {line_path}\n\n"
+                f"Coordinate System: {coord_info}")
+        else:
+            QMessageBox.information(self, "Success", 
+                f"Shapefiles saved:\n"
+                f"Points: {point_path}\n"
+                f"Line: {line_path}")
+        self.statusBar().showMessage(f"Shapefiles saved: {point_path}, {line_path}")
+    
+    def on_shapefile_error(self, error_msg):
+        """Report a shapefile export that failed on the save pool"""
+        self.save_shapefile_button.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to save shapefile:\n{error_msg}")
+        self.statusBar().showMessage("Shapefile export failed")
     
     def save_header_info(self):
         """Save Header Information to a text file"""
@@ -2340,25 +3572,54 @@ class SegyGui(QMainWindow):
             self.config.update_last_save_directory(save_dir)
             
             # Generate filename based on original SEGY file with .txt extension
-            base_name = Path(self.current_file_info['filename']).stem
+            base_name = self.current_file_stem
             txt_file_path = os.path.join(save_dir, f"{base_name}.txt")
             
-            try:
-                # Get the header information content as plain text
-                header_content = self.headers_text.toPlainText()
-                
-                # Write to file
-                with open(txt_file_path, 'w', encoding='utf-8') as f:
-                    f.write(header_content)
-                
-                # Show success message
-                QMessageBox.information(self, "Success", 
-                    f"Header information saved to:\n{txt_file_path}")
-                self.statusBar().showMessage(f"Header information saved: {txt_file_path}")
-                
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save header information:\n{str(e)}")
-                self.statusBar().showMessage("Header information export failed")
+            # Get the header information content as plain text (widgets are only read on the GUI thread)
+            header_content = self.headers_text.toPlainText()
+            self.save_info_button.setEnabled(False)
+            
+            # Write to file on the save pool
+            self._start_save(self.on_header_info_saved, self.on_header_info_error,
+                             self._write_text_file, txt_file_path, header_content)
+    
+    def on_header_info_saved(self, txt_file_path):
+        """Report header information written by the save pool"""
+        self.save_info_button.setEnabled(True)
+        QMessageBox.information(self, "Success", 
+            f"Header information saved to:\n{txt_file_path}")
+        self.statusBar().showMessage(f"Header information saved: {txt_file_path}")
+    
+    def on_header_info_error(self, error_msg):
+        """Report a header information export that failed on the save pool"""
+        self.save_info_button.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to save header information:\n{error_msg}")
+        self.statusBar().showMessage("Header information export failed")
+    
+    def _write_text_file(self, path, content):
+        """Write content to a UTF-8 text file and return its path"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+    
+    def _start_save(self, on_finished, on_error, fn, *args):
+        """Run fn(*args) on the save pool, calling on_finished(result) or on_error(message) on the GUI thread"""
+        self._start_worker(self.save_pool, on_finished, on_error, fn, *args)
+    
+    def _start_worker(self, pool, on_finished, on_error, fn, *args):
+        """Run fn(*args) on the given pool, reporting back like _start_save"""
+        worker = SaveWorker(fn, *args)
+        worker.setAutoDelete(False)  # Released from save_workers once it has reported back
+        self.save_workers.add(worker)
+        
+        def release(*_):
+            self.save_workers.discard(worker)
+        
+        worker.signals.finished.connect(on_finished, Qt.ConnectionType.QueuedConnection)
+        worker.signals.error.connect(on_error, Qt.ConnectionType.QueuedConnection)
+        worker.signals.finished.connect(release, Qt.ConnectionType.QueuedConnection)
+        worker.signals.error.connect(release, Qt.ConnectionType.QueuedConnection)
+        pool.start(worker)
     
     def batch_process(self):
         """Batch process multiple SEGY files"""
@@ -2398,76 +3659,106 @@ class SegyGui(QMainWindow):
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
         
-        # Store shapefile paths for combining
-        all_point_shapefiles = []
-        all_line_shapefiles = []
+        settings = {
+            'colormap': colormap,
+            'clip_percentile': clip_percentile,
+            'full_resolution': full_resolution,
+            'depth_mode': depth_mode,
+            'velocity': velocity,
+            'clip_enabled': clip_enabled,
+            'std_dev_enabled': std_dev_enabled,
+            'std_dev_value': std_dev_value,
+        }
+        
+        # Export each file in a worker process; the files are independent and the per-file
+        # steps draw with Agg, so nothing in the workers touches Qt. Workers are spawned rather
+        # than forked (forking a process that runs Qt threads can deadlock), and only a few run
+        # at once since each holds a file's samples, plot pixels and shapefile frames
+        n_workers = max(1, min(len(filenames), BATCH_MAX_WORKERS, os.cpu_count() or 1))
+        executor = ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context('spawn'))
+        futures = {executor.submit(process_batch_file, filename, output_dir, settings): i
+                   for i, filename in enumerate(filenames)}
+        results = {}
         processed_count = 0
         error_count = 0
-        
-        # Process each file
-        for i, filename in enumerate(filenames):
-            if progress.wasCanceled():
-                break
-            
-            progress.setValue(i)
-            progress.setLabelText(f"Processing: {os.path.basename(filename)} ({i+1}/{len(filenames)})")
-            QApplication.processEvents()
-            
-            try:
-                # Load file data
-                data, trace_headers, text_headers, bin_headers, file_info = self._load_segy_file_data(filename)
-                
-                if data is None or file_info is None:
+        canceled_count = 0
+        canceling = False
+        
+        # Collect results as they finish, keeping the GUI and the progress dialog responsive
+        not_done = set(futures)
+        while not_done:
+            if progress.wasCanceled() and not canceling:
+                # Drop the files that have not started; the running ones are still writing their
+                # output, so they are waited for and counted
+                canceling = True
+                canceled_count = sum(future.cancel() for future in not_done)
+                not_done = {future for future in not_done if not future.cancelled()}
+                continue
+            done, not_done = wait(not_done, timeout=0.05, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
                     error_count += 1
+                    self.statusBar().showMessage(f"Error processing {os.path.basename(filenames[i])}: {str(e)}")
                     continue
-                
-                base_name = Path(file_info['filename']).stem
-                
-                # Save plot
-                plot_path = os.path.join(output_dir, f"{base_name}_plot.png")
-                self._save_plot_for_file(data, file_info, plot_path, colormap, clip_percentile, full_resolution, depth_mode, velocity, clip_enabled, std_dev_enabled, std_dev_value)
-                
-                # Save shapefile
-                shapefile_base = os.path.join(output_dir, f"{base_name}_source_points")
-                point_path, line_path = self._save_shapefile_for_file(trace_headers, shapefile_base)
-                if point_path:
-                    all_point_shapefiles.append(point_path)
-                if line_path:
-                    all_line_shapefiles.append(line_path)
-                
-                # Save header info
-                txt_path = os.path.join(output_dir, f"{base_name}.txt")
-                self._save_header_info_for_file(file_info, text_headers, bin_headers, txt_path)
-                
+                if result is None:
+                    error_count += 1
+                    continue
+                results[i] = result
                 processed_count += 1
-                
-            except Exception as e:
-                error_count += 1
-                self.statusBar().showMessage(f"Error processing {os.path.basename(filename)}: {str(e)}")
-                continue
+            
+            finished = len(futures) - len(not_done)
+            if canceling:
+                if not_done:
+                    self.statusBar().showMessage(f"Canceling batch: waiting for {len(not_done)} running file(s) to finish...")
+            else:
+                progress.setValue(finished)
+                if not_done:
+                    progress.setLabelText(f"Processing files... ({finished}/{len(filenames)} done)")
+            QApplication.processEvents()
         
-        progress.setValue(len(filenames))
+        # Every submitted file has finished or was canceled before it started
+        executor.shutdown()
+        
+        # Keep the written shapefile frames, as (file name, frame) in file order, for combining
+        all_point_frames = []
+        all_line_frames = []
+        for i in sorted(results):
+            base_name, points, line = results[i]
+            if points is not None:
+                all_point_frames.append((base_name, points))
+            if line is not None:
+                all_line_frames.append((base_name, line))
+        
+        if not canceling:
+            progress.setValue(len(filenames))
         
         # Combine shapefiles if we have multiple files
         combined_point_path = None
         combined_line_path = None
-        if len(all_point_shapefiles) > 1:
+        if len(all_point_frames) > 1:
             try:
                 combined_point_path = os.path.join(output_dir, "SEGY_Combined_Nav_points.shp")
                 combined_line_path = os.path.join(output_dir, "SEGY_Combined_Nav_line.shp")
-                self._combine_shapefiles(all_point_shapefiles, all_line_shapefiles, 
+                self._combine_shapefiles(all_point_frames, all_line_frames, 
                                        combined_point_path, combined_line_path)
             except Exception as e:
                 self.statusBar().showMessage(f"Error combining shapefiles: {str(e)}")
         
         # Show completion message
         message = f"Batch processing complete!\n\nProcessed: {processed_count}\nErrors: {error_count}"
+        if canceled_count:
+            message = (f"Batch processing canceled.\n\nProcessed: {processed_count}\nErrors: {error_count}"
+                       f"\nCanceled before starting: {canceled_count}")
         if combined_point_path and combined_line_path:
             point_name = os.path.basename(combined_point_path)
             line_name = os.path.basename(combined_line_path)
             message += f"\n\nCombined shapefiles created:\n  - {point_name}\n  - {line_name}"
         QMessageBox.information(self, "Batch Processing Complete", message)
-        self.statusBar().showMessage(f"Batch processing complete: {processed_count} files processed, {error_count} errors")
+        self.statusBar().showMessage(f"Batch processing complete: {processed_count} files processed, {error_count} errors"
+                                     + (f", {canceled_count} canceled" if canceled_count else ""))
     
     def show_about_dialog(self):
         """Show About dialog with program information"""
@@ -2577,539 +3868,118 @@ class SegyGui(QMainWindow):
         # Show dialog
         dialog.exec()
     
-    def _load_segy_file_data(self, filename):
-        """Load SEGY file data without updating GUI"""
-        try:
-            with segyio.open(filename, ignore_geometry=True, strict=False) as f:
-                # Get basic attributes
-                n_traces = f.tracecount
-                sample_rate = segyio.tools.dt(f) / 1000
-                n_samples = f.samples.size
-                twt = f.samples
-                
-                # Load data
-                data = f.trace.raw[:]
-                
-                # Load headers
-                bin_headers = f.bin
-                text_headers = self._parse_text_header(f)
-                trace_headers = self._parse_trace_headers(f, n_traces)
-                
-                # File information
-                file_info = {
-                    'filename': os.path.basename(filename),
-                    'n_traces': n_traces,
-                    'n_samples': n_samples,
-                    'sample_rate': sample_rate,
-                    'twt': twt
-                }
-                
-                return data, trace_headers, text_headers, bin_headers, file_info
-        except Exception as e:
-            return None, None, None, None, None
-    
-    def _parse_text_header(self, segyfile):
-        """Parse text header (duplicate of SegyLoaderThread method)"""
-        try:
-            raw_header = segyio.tools.wrap(segyfile.text[0])
-            cut_header = re.split(r'C ', raw_header)[1::]
-            text_header = [x.replace('\n', ' ') for x in cut_header]
-            
-            if not text_header:
-                return {"C01": "No text header found or unsupported format"}
-            
-            if text_header[-1]:
-                text_header[-1] = text_header[-1][:-2]
-            
-            clean_header = {}
-            i = 1
-            for item in text_header:
-                key = "C" + str(i).rjust(2, '0')
-                i += 1
-                clean_header[key] = item
-            return clean_header
-        except Exception as e:
-            return {"C01": f"Text header parsing failed: {str(e)}"}
-    
-    def _parse_trace_headers(self, segyfile, n_traces):
-        """Parse trace headers (duplicate of SegyLoaderThread method)"""
-        headers = segyio.tracefield.keys
-        df = pd.DataFrame(index=range(1, n_traces + 1), columns=headers.keys())
-        for k, v in headers.items():
-            df[k] = segyfile.attributes(v)[:]
-        return df
-    
-    def _save_plot_for_file(self, data, file_info, filename, colormap, clip_percentile, full_resolution, depth_mode=False, velocity=1500.0, clip_enabled=True, std_dev_enabled=False, std_dev_value=2.0):
-        """Save plot for a specific file"""
-        # Apply standard deviation clipping if enabled
-        plot_data = data.copy()
-        if std_dev_enabled:
-            plot_data = self.plot_widget._apply_std_dev_clipping(plot_data, std_dev_value)
-        
-        # Calculate amplitude clipping
-        if clip_enabled:
-            vm = np.percentile(plot_data, clip_percentile)
-            vm0 = 0
-            vm1 = vm
-        else:
-            # No clipping - use full data range
-            vm0 = plot_data.min()
-            vm1 = plot_data.max()
-        
-        # Create extent
-        n_traces = file_info['n_traces']
-        twt = file_info['twt']
-        
-        # Convert TWT to depth if depth mode is enabled
-        if depth_mode:
-            # Convert TWT (ms) to depth (m): Depth = (TWT_ms / 1000) × Velocity_m/s / 2
-            depth = (twt / 1000.0) * velocity / 2.0
-            y_min = depth[-1]  # Last depth value (deepest)
-            y_max = depth[0]   # First depth value (shallowest)
-            y_label = 'Depth [m]'
-        else:
-            y_min = twt[-1]  # Last TWT value (deepest)
-            y_max = twt[0]   # First TWT value (shallowest)
-            y_label = 'TWT [ms]'
-        
-        extent = [1, n_traces, y_min, y_max]
-        
-        if full_resolution:
-            # Calculate figure size based on data dimensions
-            data_shape = data.shape
-            fig_width = max(12, data_shape[1] * 0.01)
-            fig_height = max(8, data_shape[0] * 0.002)
-            fig, ax = plt.subplots(figsize=(fig_width, fig_height), dpi=300)
-        else:
-            fig, ax = plt.subplots(figsize=(12, 6), dpi=300)
-        
-        # Plot the data
-        im = ax.imshow(plot_data.T, cmap=colormap, vmin=vm0, vmax=vm1, 
-                      aspect='auto', extent=extent)
-        
-        # Add labels and title
-        ax.set_xlabel('CDP number')
-        ax.set_ylabel(y_label)
-        title = f'{file_info["filename"]}'
-        if full_resolution:
-            title += ' (Full Resolution)'
-        ax.set_title(title)
-        
-        # Add colorbar
-        plt.colorbar(im, ax=ax, label='Amplitude')
-        
-        # Save
-        fig.savefig(filename, dpi=300, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        plt.close(fig)
-    
-    def _format_datetime_from_trace(self, trace_data):
-        """Format date/time string from trace header data"""
-        try:
-            year = trace_data.get('YearDataRecorded', None)
-            day = trace_data.get('DayOfYear', None)
-            hour = trace_data.get('HourOfDay', None)
-            minute = trace_data.get('MinuteOfHour', None)
-            second = trace_data.get('SecondOfMinute', None)
-            
-            # Check if we have valid date/time data
-            if year is None or pd.isna(year) or day is None or pd.isna(day):
-                return None
-            
-            # Handle 2-digit years (assume 1900-2099 range)
-            if year < 100:
-                if year < 50:
-                    year = 2000 + year
-                else:
-                    year = 1900 + year
-            
-            # Format as YYYY-DOY HH:MM:SS
-            if hour is not None and not pd.isna(hour) and minute is not None and not pd.isna(minute):
-                if second is not None and not pd.isna(second):
-                    return f"{int(year)}-{int(day):03d} {int(hour):02d}:{int(minute):02d}:{int(second):02d}"
-                else:
-                    return f"{int(year)}-{int(day):03d} {int(hour):02d}:{int(minute):02d}:00"
-            else:
-                return f"{int(year)}-{int(day):03d}"
-        except:
-            return None
-    
-    def _save_shapefile_for_file(self, trace_headers, shapefile_base_path):
-        """Save shapefile for a specific file, returns (point_path, line_path)"""
-        try:
-            import geopandas as gpd
-            from shapely.geometry import Point, LineString
-        except ImportError:
-            try:
-                import fiona
-                from shapely.geometry import Point, LineString
-                import json
-            except ImportError:
-                return None, None
-        
-        # Extract coordinates
-        cdp_data = []
-        line_coords = []
-        coord_units = 2  # Default coordinate units
-        
-        for i, trace_num in enumerate(trace_headers.index):
-            trace_data = trace_headers.loc[trace_num]
-            
-            # Get source coordinates
-            source_x = trace_data.get('SourceX', None)
-            source_y = trace_data.get('SourceY', None)
-            
-            if source_x is None or source_y is None:
-                source_x = trace_data.get('GroupX', None)
-                source_y = trace_data.get('GroupY', None)
-            
-            if source_x is None or source_y is None:
-                source_x = trace_data.get('CDP_X', None)
-                source_y = trace_data.get('CDP_Y', None)
-            
-            if source_x is None or source_y is None:
-                continue
-            
-            if abs(float(source_x)) < 1e-6 and abs(float(source_y)) < 1e-6:
-                continue
-            
-            # Get coordinate units from first valid trace
-            if not cdp_data:
-                coord_units = trace_data.get('CoordinateUnits', 2)
-            
-            source_group_scalar = trace_data.get('SourceGroupScalar', 1)
-            
-            # Apply SourceGroupScalar to coordinates
-            if source_group_scalar > 0:
-                x_coord = float(source_x) * source_group_scalar
-                y_coord = float(source_y) * source_group_scalar
-            elif source_group_scalar < 0:
-                x_coord = float(source_x) / abs(source_group_scalar)
-                y_coord = float(source_y) / abs(source_group_scalar)
-            else:
-                # scalar = 0 means scalar = 1
-                x_coord = float(source_x)
-                y_coord = float(source_y)
-            
-            # Convert coordinates based on units
-            if coord_units == 1:  # Length (meters/feet) - treat as local coordinates
-                pass  # Already in meters/feet
-            elif coord_units == 2:  # Seconds of arc
-                x_coord = x_coord / 3600.0  # Convert to degrees
-                y_coord = y_coord / 3600.0
-            elif coord_units == 3:  # Decimal degrees
-                pass  # Already in degrees
-            elif coord_units == 4:  # Degrees, minutes, seconds
-                # For now, treat as decimal degrees (would need proper DMS parsing)
-                pass  # Already in degrees
-            else:
-                # Unknown units - assume decimal degrees
-                pass
-            
-            line_coords.append((x_coord, y_coord))
-            
-            # Get date/time for this trace
-            trace_datetime = self._format_datetime_from_trace(trace_data)
-            
-            cdp_data.append({
-                'geometry': Point(x_coord, y_coord),
-                'CDP_NUM': int(trace_data.get('CDP', trace_num)),
-                'TRACE_NUM': int(trace_num),
-                'TRACE_SEQ': int(trace_data.get('TRACE_SEQUENCE_LINE', trace_num)),
-                'SOURCE_X': x_coord,
-                'SOURCE_Y': y_coord,
-                'COORD_UNIT': int(coord_units),
-                'SCALAR': int(source_group_scalar),
-                'OFFSET': float(trace_data.get('offset', 0)),
-                'ELEVATION': float(trace_data.get('SourceSurfaceElevation', 0)),
-                'DATETIME': trace_datetime if trace_datetime else ''
-            })
-        
-        if not cdp_data:
-            return None, None
-        
-        point_path = None
-        line_path = None
-        
-        # Create point shapefile
-        try:
-            gdf_points = gpd.GeoDataFrame(cdp_data)
-            if coord_units in [2, 3, 4]:
-                gdf_points.crs = "EPSG:4326"
-            else:
-                gdf_points.crs = None
-            
-            point_path = f"{shapefile_base_path}_points.shp"
-            gdf_points.to_file(point_path)
-        except:
-            pass
-        
-        # Create line shapefile
-        if len(line_coords) > 1:
-            try:
-                line_geometry = LineString(line_coords)
-                
-                # Get start and end date/time from first and last traces
-                first_trace_num = trace_headers.index[0]
-                last_trace_num = trace_headers.index[-1]
-                first_trace_data = trace_headers.loc[first_trace_num]
-                last_trace_data = trace_headers.loc[last_trace_num]
-                
-                start_datetime = self._format_datetime_from_trace(first_trace_data)
-                end_datetime = self._format_datetime_from_trace(last_trace_data)
-                
-                # Create line GeoDataFrame with date/time fields
-                line_attrs = {'geometry': line_geometry}
-                if start_datetime:
-                    line_attrs['START_DT'] = start_datetime
-                else:
-                    line_attrs['START_DT'] = ''
-                if end_datetime:
-                    line_attrs['END_DT'] = end_datetime
-                else:
-                    line_attrs['END_DT'] = ''
-                
-                gdf_line = gpd.GeoDataFrame([line_attrs])
-                if coord_units in [2, 3, 4]:
-                    gdf_line.crs = "EPSG:4326"
-                else:
-                    gdf_line.crs = None
-                
-                line_path = f"{shapefile_base_path}_line.shp"
-                gdf_line.to_file(line_path)
-            except:
-                pass
-        
-        return point_path, line_path
-    
-    def _save_header_info_for_file(self, file_info, text_headers, bin_headers, filename):
-        """Save header information for a specific file"""
-        info_text = f"FILE INFORMATION\n"
-        info_text += f"{'='*50}\n"
-        info_text += f"Filename: {file_info['filename']}\n"
-        info_text += f"Number of Traces: {file_info['n_traces']:,}\n"
-        info_text += f"Number of Samples: {file_info['n_samples']:,}\n"
-        info_text += f"Sample Rate: {file_info['sample_rate']:.2f} ms\n"
-        info_text += f"Time Window: {file_info['twt'][0]:.1f} - {file_info['twt'][-1]:.1f} ms\n\n"
-        
-        # Binary headers
-        info_text += f"BINARY HEADERS\n"
-        info_text += f"{'='*50}\n"
-        for key, value in bin_headers.items():
-            field_name = str(key)
-            description = self.decode_binary_header_value(key, value)
-            if description:
-                info_text += f"{field_name}: {value} ({description})\n"
-            else:
-                info_text += f"{field_name}: {value}\n"
-        info_text += "\n"
-        
-        # Text headers
-        info_text += f"TEXT HEADERS\n"
-        info_text += f"{'='*50}\n"
-        for key, value in text_headers.items():
-            info_text += f"{key}: {value}\n"
-        info_text += "\n"
-        
-        # Write to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(info_text)
-    
-    def _combine_shapefiles(self, point_paths, line_paths, combined_point_path, combined_line_path):
-        """Combine multiple shapefiles into one"""
+    def _combine_shapefiles(self, point_frames, line_frames, combined_point_path, combined_line_path):
+        """Combine the per-file shapefile GeoDataFrames, given as (source name, frame) pairs, into one of each"""
         try:
-            import geopandas as gpd
+            gpd = geospatial_modules()[0]
             
-            # Combine point shapefiles
-            if point_paths:
-                point_gdfs = []
-                for path in point_paths:
-                    if os.path.exists(path):
-                        gdf = gpd.read_file(path)
-                        # Add source file name
-                        base_name = Path(path).stem.replace('_source_points_points', '')
-                        gdf['SOURCE_FILE'] = base_name
-                        point_gdfs.append(gdf)
-                
-                if point_gdfs:
-                    combined_points = gpd.GeoDataFrame(pd.concat(point_gdfs, ignore_index=True))
-                    # Preserve CRS from first file
-                    if point_gdfs[0].crs is not None:
-                        combined_points.crs = point_gdfs[0].crs
-                    combined_points.to_file(combined_point_path)
+            # Combine point shapefiles, tagging each feature with its source file name
+            if point_frames:
+                combined_points = gpd.GeoDataFrame(pd.concat(
+                    [gdf.assign(SOURCE_FILE=name) for name, gdf in point_frames], ignore_index=True))
+                # Preserve CRS from first file
+                if point_frames[0][1].crs is not None:
+                    combined_points.crs = point_frames[0][1].crs
+                write_shapefile(combined_points, combined_point_path)
             
             # Combine line shapefiles
-            if line_paths:
-                line_gdfs = []
-                for path in line_paths:
-                    if os.path.exists(path):
-                        gdf = gpd.read_file(path)
-                        base_name = Path(path).stem.replace('_source_points_line', '')
-                        gdf['SOURCE_FILE'] = base_name
-                        line_gdfs.append(gdf)
-                
-                if line_gdfs:
-                    combined_lines = gpd.GeoDataFrame(pd.concat(line_gdfs, ignore_index=True))
-                    if line_gdfs[0].crs is not None:
-                        combined_lines.crs = line_gdfs[0].crs
-                    combined_lines.to_file(combined_line_path)
+            if line_frames:
+                combined_lines = gpd.GeoDataFrame(pd.concat(
+                    [gdf.assign(SOURCE_FILE=name) for name, gdf in line_frames], ignore_index=True))
+                if line_frames[0][1].crs is not None:
+                    combined_lines.crs = line_frames[0][1].crs
+                write_shapefile(combined_lines, combined_line_path)
         except Exception as e:
             raise Exception(f"Failed to combine shapefiles: {str(e)}")
     
-    def _create_cdp_shapefile(self, shapefile_path):
+    def _create_cdp_shapefile(self, shapefile_path, trace_headers):
         """Create both point and line shapefiles with CDP coordinates"""
-        try:
-            import geopandas as gpd
-            from shapely.geometry import Point, LineString
-        except ImportError:
-            # Fallback to fiona and shapely if geopandas not available
-            try:
-                import fiona
-                from shapely.geometry import Point, LineString
-                import json
-            except ImportError:
-                raise ImportError("Required geospatial libraries not found. Please install geopandas or fiona+shapely")
-        
-        # Extract source coordinates from trace headers
-        cdp_data = []
-        line_coords = []
-        
-        for i, trace_num in enumerate(self.current_headers.index):
-            trace_data = self.current_headers.loc[trace_num]
-            
-            # Get source coordinates (primary choice)
-            source_x = trace_data.get('SourceX', None)
-            source_y = trace_data.get('SourceY', None)
-            
-            # If source coordinates not available, try group coordinates
-            if source_x is None or source_y is None:
-                source_x = trace_data.get('GroupX', None)
-                source_y = trace_data.get('GroupY', None)
-            
-            # If still not available, try CDP coordinates as fallback
-            if source_x is None or source_y is None:
-                source_x = trace_data.get('CDP_X', None)
-                source_y = trace_data.get('CDP_Y', None)
-            
-            # Skip if no coordinates available or coordinates are essentially zero
-            if source_x is None or source_y is None:
-                continue
-            
-            # Check if coordinates are essentially zero (uninitialized)
-            if abs(float(source_x)) < 1e-6 and abs(float(source_y)) < 1e-6:
-                continue
-            
-            # Get coordinate units and scalar
-            coord_units = trace_data.get('CoordinateUnits', 2)  # Default to seconds of arc
-            source_group_scalar = trace_data.get('SourceGroupScalar', 1)  # Default to 1
-            
-            # Apply SourceGroupScalar to coordinates
-            if source_group_scalar > 0:
-                x_coord = float(source_x) * source_group_scalar
-                y_coord = float(source_y) * source_group_scalar
-            elif source_group_scalar < 0:
-                x_coord = float(source_x) / abs(source_group_scalar)
-                y_coord = float(source_y) / abs(source_group_scalar)
-            else:
-                # scalar = 0 means scalar = 1
-                x_coord = float(source_x)
-                y_coord = float(source_y)
-            
-            # Convert coordinates based on units FIRST
-            if coord_units == 1:  # Length (meters/feet) - treat as local coordinates
-                pass  # Already in meters
-            elif coord_units == 2:  # Seconds of arc
-                x_coord = x_coord / 3600.0  # Convert to degrees
-                y_coord = y_coord / 3600.0
-                if i < 3:
-                    print(f"Debug - Trace {i+1}: After degrees conversion=({x_coord}, {y_coord})")
-            elif coord_units == 3:  # Decimal degrees
-                pass  # Already in degrees
-            elif coord_units == 4:  # Degrees, minutes, seconds
-                # For now, treat as decimal degrees (would need proper DMS parsing)
-                pass  # Already in degrees
-            else:
-                # Unknown units - assume decimal degrees
-                pass
-            
-            # Create point geometry
-            point = Point(x_coord, y_coord)
-            
-            # Get date/time for this trace
-            trace_datetime = self._format_datetime_from_trace(trace_data)
-            
-            # Collect attributes
-            attributes = {
-                'CDP_NUM': trace_data.get('CDP', i + 1),
-                'TRACE_NUM': trace_num,
-                'TRACE_SEQ': trace_data.get('TRACE_SEQUENCE_LINE', i + 1),
-                'SOURCE_X': x_coord,
-                'SOURCE_Y': y_coord,
-                'COORD_UNIT': coord_units,
-                'SCALAR': source_group_scalar,
-                'OFFSET': trace_data.get('offset', 0),
-                'ELEVATION': trace_data.get('ReceiverGroupElevation', 0),
-                'DATETIME': trace_datetime if trace_datetime else ''
-            }
-            
-            # Debug: Print first few coordinates to verify conversion
-            if i < 3:
-                print(f"Debug - Trace {i+1}: Raw=({source_x}, {source_y}), Scaled=({x_coord}, {y_coord}), Units={coord_units}")
-            
-            cdp_data.append({
-                'geometry': point,
-                **attributes
-            })
-            
-            # Collect coordinates for line
-            line_coords.append((x_coord, y_coord))
-        
-        if not cdp_data:
-            # Check if coordinates exist but are zero
-            has_zero_coords = False
-            for trace_num in list(self.current_headers.index)[:5]:  # Check first 5 traces
-                trace_data = self.current_headers.loc[trace_num]
-                source_x = trace_data.get('SourceX', None)
-                source_y = trace_data.get('SourceY', None)
-                if source_x is not None and source_y is not None:
-                    if abs(float(source_x)) < 1e-6 and abs(float(source_y)) < 1e-6:
-                        has_zero_coords = True
-                        break
-            
-            if has_zero_coords:
+        gpd, fiona, LineString = geospatial_modules()
+        
+        # Read every trace header now that a shapefile has been requested
+        headers = trace_headers.to_dataframe()
+        
+        # Extract source coordinates as whole columns (the parsed frame always has the source fields,
+        # so the Group/CDP coordinates are never needed as a fallback)
+        source_x = headers['SourceX'].to_numpy(dtype=np.float64)
+        source_y = headers['SourceY'].to_numpy(dtype=np.float64)
+        
+        # Skip traces whose coordinates are essentially zero (uninitialized)
+        valid = (np.abs(source_x) >= 1e-6) | (np.abs(source_y) >= 1e-6)
+        if not valid.any():
+            # Every trace there is has zero coordinates
+            if len(headers):
                 raise ValueError("No valid coordinate data found in trace headers. Coordinates appear to be uninitialized (near zero values). This SEGY file may not contain spatial coordinate information.")
             else:
                 raise ValueError("No valid coordinate data found in trace headers. Please check that SourceX/SourceY, GroupX/GroupY, or CDP_X/CDP_Y fields contain valid coordinate values.")
+        valid_headers = headers[valid]
+        
+        # Apply SourceGroupScalar to coordinates (scalar = 0 means scalar = 1)
+        scalars = valid_headers['SourceGroupScalar'].to_numpy(dtype=np.int64)
+        x_coords = apply_coordinate_scalar(source_x[valid], scalars)
+        y_coords = apply_coordinate_scalar(source_y[valid], scalars)
+        
+        # Convert coordinates based on units; only seconds of arc need converting (to degrees),
+        # lengths and degrees are used as they are (DMS is treated as decimal degrees for now)
+        units = valid_headers['CoordinateUnits'].to_numpy(dtype=np.int64)
+        if (units == units[0]).all():
+            # One unit code for the whole file, the usual case
+            if units[0] == 2:
+                x_coords /= 3600.0
+                y_coords /= 3600.0
+        else:
+            arc_seconds = units == 2
+            x_coords[arc_seconds] /= 3600.0
+            y_coords[arc_seconds] /= 3600.0
+        
+        # The coordinate system is decided from the last trace, as before
+        coord_units = int(units[-1])
+        source_group_scalar = int(scalars[-1])
+        x_coord = float(x_coords[-1])
+        y_coord = float(y_coords[-1])
+        
+        # (n, 2) coordinate array, handed to shapely without building a list of tuples
+        line_coords = np.column_stack((x_coords, y_coords))
+        
+        # Build the attribute table column by column
+        cdp_data = {
+            'CDP_NUM': valid_headers['CDP'].to_numpy(dtype=np.int64),
+            'TRACE_NUM': valid_headers.index.to_numpy(dtype=np.int64),
+            'TRACE_SEQ': valid_headers['TRACE_SEQUENCE_LINE'].to_numpy(dtype=np.int64),
+            'SOURCE_X': x_coords,
+            'SOURCE_Y': y_coords,
+            'COORD_UNIT': units,
+            'SCALAR': scalars,
+            'OFFSET': valid_headers['offset'].to_numpy(dtype=np.float64),
+            'ELEVATION': valid_headers['ReceiverGroupElevation'].to_numpy(dtype=np.float64),
+            'DATETIME': format_datetimes_from_headers(valid_headers),
+        }
         
-        # Determine coordinate system based on converted coordinates
+        # Determine coordinate system based on converted coordinates, once for both shapefiles
         coord_system_info = None
-        if coord_units in [2, 3, 4]:
+        if coord_units in [2, 3, 4]:  # Geographic coordinates
             coord_system_info = "Geographic (EPSG:4326 - WGS84) - Applied SourceGroupScalar and unit conversion"
+            crs = "EPSG:4326"  # WGS84
         elif self._is_utm_coordinates(x_coord, y_coord):
             coord_system_info = "UTM (EPSG:32633 - Zone 33N) - Please verify zone and coordinate system"
-        else:
+            # UTM coordinates - use a generic UTM CRS (user may need to adjust)
+            crs = "EPSG:32633"  # UTM Zone 33N (common for Europe) - user should verify
+        else:  # Local/projected coordinates
             coord_system_info = "Local/Unknown coordinate system - Applied SourceGroupScalar"
+            crs = None  # No CRS specified
         
         # Create base filename without extension
         base_path = str(shapefile_path).replace('.shp', '')
         
         # Create point shapefile
         point_path = f"{base_path}_points.shp"
-        try:
-            gdf_points = gpd.GeoDataFrame(cdp_data)
-            # Set CRS based on coordinate units
-            if coord_units in [2, 3, 4]:  # Geographic coordinates
-                gdf_points.crs = "EPSG:4326"  # WGS84
-            elif self._is_utm_coordinates(x_coord, y_coord):
-                # UTM coordinates - use a generic UTM CRS (user may need to adjust)
-                gdf_points.crs = "EPSG:32633"  # UTM Zone 33N (common for Europe) - user should verify
-            else:  # Local/projected coordinates
-                gdf_points.crs = None  # No CRS specified
+        if gpd is not None:
+            gdf_points = gpd.GeoDataFrame(cdp_data, geometry=gpd.points_from_xy(x_coords, y_coords), crs=crs)
             
             # Save point shapefile
-            gdf_points.to_file(point_path)
+            write_shapefile(gdf_points, point_path)
             
-        except NameError:
+        else:
             # Fallback using fiona
             schema = {
                 'geometry': 'Point',
@@ -3127,72 +3997,52 @@ class SegyGui(QMainWindow):
                 }
             }
             
-            # Set CRS based on coordinate units
-            if coord_units in [2, 3, 4]:
-                crs = "EPSG:4326"  # WGS84
-            elif self._is_utm_coordinates(x_coord, y_coord):
-                crs = "EPSG:32633"  # UTM Zone 33N (user should verify)
-            else:
-                crs = None  # No CRS specified
-            
             with fiona.open(point_path, 'w', driver='ESRI Shapefile', 
                           schema=schema, crs=crs) as shp:
-                for item in cdp_data:
-                    shp.write(item)
+                # Hand fiona every record in one call, built straight from the attribute columns
+                # (as native Python values) without going through a DataFrame
+                names = list(cdp_data)
+                columns = [np.asarray(column).tolist() for column in cdp_data.values()]
+                shp.writerecords({'geometry': {'type': 'Point', 'coordinates': tuple(xy)},
+                                  'properties': dict(zip(names, row))}
+                                 for xy, row in zip(line_coords.tolist(), zip(*columns)))
         
         # Create line shapefile
         line_path = f"{base_path}_line.shp"
         if len(line_coords) > 1:
-            try:
-                # Create line geometry connecting all points in sequence
-                line_geometry = LineString(line_coords)
-                
-                # Get start and end date/time from first and last traces
-                first_trace_num = self.current_headers.index[0]
-                last_trace_num = self.current_headers.index[-1]
-                first_trace_data = self.current_headers.loc[first_trace_num]
-                last_trace_data = self.current_headers.loc[last_trace_num]
-                
-                start_datetime = self._format_datetime_from_trace(first_trace_data)
-                end_datetime = self._format_datetime_from_trace(last_trace_data)
-                
-                line_data = [{
-                    'geometry': line_geometry,
-                    'LINE_ID': 1,
-                    'NUM_POINTS': len(line_coords),
-                    'START_TRACE': cdp_data[0]['TRACE_NUM'],
-                    'END_TRACE': cdp_data[-1]['TRACE_NUM'],
-                    'LENGTH_M': 0,  # Could calculate actual length if needed
-                    'COORD_UNIT': coord_units,
-                    'SCALAR': source_group_scalar,
-                    'START_DT': start_datetime if start_datetime else '',
-                    'END_DT': end_datetime if end_datetime else ''
-                }]
-                
-                gdf_line = gpd.GeoDataFrame(line_data)
-                # Set CRS based on coordinate units
-                if coord_units in [2, 3, 4]:  # Geographic coordinates
-                    gdf_line.crs = "EPSG:4326"  # WGS84
-                elif self._is_utm_coordinates(x_coord, y_coord):
-                    # UTM coordinates - use a generic UTM CRS (user may need to adjust)
-                    gdf_line.crs = "EPSG:32633"  # UTM Zone 33N (common for Europe) - user should verify
-                else:  # Local/projected coordinates
-                    gdf_line.crs = None  # No CRS specified
+            # Create line geometry connecting all points in sequence
+            line_geometry = LineString(line_coords)
+            
+            # Get start and end date/time from first and last traces
+            first_trace_num = headers.index[0]
+            last_trace_num = headers.index[-1]
+            first_trace_data = headers.loc[first_trace_num]
+            last_trace_data = headers.loc[last_trace_num]
+            
+            start_datetime = format_trace_datetime(first_trace_data)
+            end_datetime = format_trace_datetime(last_trace_data)
+            
+            line_data = [{
+                'geometry': line_geometry,
+                'LINE_ID': 1,
+                'NUM_POINTS': len(line_coords),
+                'START_TRACE': int(cdp_data['TRACE_NUM'][0]),
+                'END_TRACE': int(cdp_data['TRACE_NUM'][-1]),
+                'LENGTH_M': 0,  # Could calculate actual length if needed
+                'COORD_UNIT': coord_units,
+                'SCALAR': source_group_scalar,
+                'START_DT': start_datetime if start_datetime else '',
+                'END_DT': end_datetime if end_datetime else ''
+            }]
+            
+            if gpd is not None:
+                gdf_line = gpd.GeoDataFrame(line_data, crs=crs)
                 
                 # Save line shapefile
-                gdf_line.to_file(line_path)
+                write_shapefile(gdf_line, line_path)
                 
-            except NameError:
+            else:
                 # Fallback using fiona
-                # Get start and end date/time from first and last traces
-                first_trace_num = self.current_headers.index[0]
-                last_trace_num = self.current_headers.index[-1]
-                first_trace_data = self.current_headers.loc[first_trace_num]
-                last_trace_data = self.current_headers.loc[last_trace_num]
-                
-                start_datetime = self._format_datetime_from_trace(first_trace_data)
-                end_datetime = self._format_datetime_from_trace(last_trace_data)
-                
                 line_schema = {
                     'geometry': 'LineString',
                     'properties': {
@@ -3208,21 +4058,10 @@ class SegyGui(QMainWindow):
                     }
                 }
                 
-                # Update line_data with date/time fields
-                line_data[0]['START_DT'] = start_datetime if start_datetime else ''
-                line_data[0]['END_DT'] = end_datetime if end_datetime else ''
-                
-                # Set CRS based on coordinate units
-                if coord_units in [2, 3, 4]:
-                    crs = "EPSG:4326"  # WGS84
-                elif self._is_utm_coordinates(x_coord, y_coord):
-                    crs = "EPSG:32633"  # UTM Zone 33N (user should verify)
-                else:
-                    crs = None  # No CRS specified
-                
                 with fiona.open(line_path, 'w', driver='ESRI Shapefile', 
                               schema=line_schema, crs=crs) as shp:
-                    shp.write(line_data[0])
+                    shp.write({'geometry': {'type': 'LineString', 'coordinates': line_coords.tolist()},
+                               'properties': {k: v for k, v in line_data[0].items() if k != 'geometry'}})
         
         return coord_system_info, point_path, line_path
     
@@ -3238,9 +4077,9 @@ class SegyGui(QMainWindow):
         utm_x_range = 100000 <= abs(x) <= 900000
         utm_y_range = 0 <= y <= 10000000
         
-        # Additional checks for UTM characteristics
+        # Additional checks for UTM characteristics (both values over 10000 also means both
+        # have at least 5 integer digits)
         large_numbers = abs(x) > 10000 and y > 10000
-        reasonable_precision = len(str(int(abs(x)))) >= 5 and len(str(int(y))) >= 5
         
         # UTM coordinates are typically not in degree ranges
         not_degrees = not (-180 <= x <= 180 and -90 <= y <= 90)
@@ -3249,12 +4088,21 @@ class SegyGui(QMainWindow):
         # Valid seconds of arc range: -648,000 to +648,000 (for ±180°)
         invalid_seconds_arc = abs(x) > 648000 or abs(y) > 648000
         
-        return (utm_x_range and utm_y_range) or (large_numbers and reasonable_precision and not_degrees and invalid_seconds_arc)
+        return (utm_x_range and utm_y_range) or (large_numbers and not_degrees and invalid_seconds_arc)
     
     def closeEvent(self, event):
         """Handle application close event"""
-        # Save configuration when closing
-        self.config.save_config()
+        # Save any pending configuration changes when closing
+        self.config.flush()
+        
+        # Loader threads may still be caching samples; stop them before the application exits
+        loaders = list(self.superseded_loaders)
+        if self.loader_thread is not None:
+            loaders.append(self.loader_thread)
+        for loader in loaders:
+            loader.requestInterruption()
+        for loader in loaders:
+            loader.wait()
         event.accept()
 
 
@@ -3270,4 +4118,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Batch processing starts worker processes, which a frozen executable has to hand off here
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,86 @@
+"""
+Byte locations and descriptions of the SEG-Y Rev 2.0 trace header fields
+"""
+
+# Field name -> (first byte, last byte, description), imported by segy_viewer.py the first
+# time a trace field is inspected
+TRACE_FIELD_DOCS = {
+    'TRACE_SEQUENCE_LINE': (1, 4, 'Trace sequence number within line — Numbers continue to increase if the same line continues across multiple SEG-Y files.'),
+    'TRACE_SEQUENCE_FILE': (5, 8, 'Trace sequence number within SEG-Y file — Each file starts with trace sequence one.'),
+    'FieldRecord': (9, 12, 'Original field record number.'),
+    'TraceNumber': (13, 16, 'Trace number within the original field record. If supplying multi-cable data with identical channel numbers on each cable, either supply the cable ID number in bytes 153–156 of SEG-Y Trace Header Extension 1 or enter (cable–1)*nchan_per_cable+channel_no here.'),
+    'EnergySourcePoint': (17, 20, 'Energy source point number — Used when more than one record occurs at the same effective surface location. It is recommended that the new entry defined in Trace Header bytes 197–202 be used for shotpoint number.'),
+    'CDP': (21, 24, 'Ensemble number (i.e. CDP, CMP, CRP, etc.)'),
+    'CDP_TRACE': (25, 28, 'Trace number within the ensemble — Each ensemble starts with trace number one.'),
+    'TraceIdentificationCode': (29, 30, 'Trace identification code: –1 = Other, 0 = Unknown, 1 = Time domain seismic data, 2 = Dead, 3 = Dummy, 4 = Time break, 5 = Uphole, 6 = Sweep, 7 = Timing, 8 = Waterbreak, 9 = Near-field gun signature, 10 = Far-field gun signature, 11 = Seismic pressure sensor, 12 = Multicomponent seismic sensor – Vertical component, 13 = Multicomponent seismic sensor – Cross-line component, 14 = Multicomponent seismic sensor – In-line component, 15 = Rotated multicomponent seismic sensor – Vertical component, 16 = Rotated multicomponent seismic sensor – Transverse component, 17 = Rotated multicomponent seismic sensor – Radial component, 18 = Vibrator reaction mass, 19 = Vibrator baseplate, 20 = Vibrator estimated ground force, 21 = Vibrator reference, 22 = Time-velocity pairs, 23 = Time-depth pairs, 24 = Depth-velocity pairs, 25 = Depth domain seismic data, 26 = Gravity potential, 27 = Electric field – Vertical component, 28 = Electric field – Cross-line component, 29 = Electric field – In-line component, 30 = Rotated electric field – Vertical component, 31 = Rotated electric field – Transverse component, 32 = Rotated electric field – Radial component, 33 = Magnetic field – Vertical component, 34 = Magnetic field – Cross-line component, 35 = Magnetic field – In-line component, 36 = Rotated magnetic field – Vertical component, 37 = Rotated magnetic field – Transverse component, 38 = Rotated magnetic field – Radial component, 39 = Rotational sensor – Pitch, 40 = Rotational sensor – Roll, 41 = Rotational sensor – Yaw, 42 … 255 = Reserved, 256 … N = optional use, (maximum N = 16,383) N+16,384 = Interpolated, i.e. not original, seismic trace.'),
+    'NSummedTraces': (31, 32, 'Number of vertically summed traces yielding this trace. (1 is one trace, 2 is two summed traces, etc.)'),
+    'NStackedTraces': (33, 34, 'Number of horizontally stacked traces yielding this trace. (1 is one trace, 2 is two stacked traces, etc.)'),
+    'DataUse': (35, 36, 'Data use: 1 = Production, 2 = Test'),
+    'offset': (37, 40, 'Distance from center of the source point to the center of the receiver group (negative if opposite to direction in which line is shot).'),
+    'ReceiverGroupElevation': (41, 44, 'Elevation of receiver group. This is, of course, normally equal to or lower than the surface elevation at the group location. The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.'),
+    'SourceSurfaceElevation': (45, 48, 'Surface elevation at source location. The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.'),
+    'SourceDepth': (49, 52, 'Source depth below surface. The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.'),
+    'ReceiverDatumElevation': (53, 56, 'Seismic Datum elevation at receiver group. (If different from the survey vertical datum, Seismic Datum should be defined through a vertical CRS in an extended textual stanza.) The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.'),
+    'SourceDatumElevation': (57, 60, 'Seismic Datum elevation at source. (As above) The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.'),
+    'SourceWaterDepth': (61, 64, 'Water column height at source location (at time of source event). The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.'),
+    'GroupWaterDepth': (65, 68, 'Water column height at receiver group location (at time of recording of first source event into that receiver). The scalar in Trace Header bytes 69–70 applies to these values. The units are feet or meters as specified in Binary File Header bytes 3255–3256. Elevations and depths and their signs (+ve or – ve) are tied to a vertical CRS defined through an Extended Textual Header (see Appendix D-1). Historical usage had been that all elevations above the vertical datum were positive and below were negative. Elevations should now be defined with respect to the CRS.'),
+    'ElevationScalar': (69, 70, 'Scalar to be applied to all elevations and depths specified in Standard Trace Header bytes 41–68 to give the real value. Scalar = 1, ±10, ±100, ±1000, or ±10,000. If positive, scalar is used as a multiplier; if negative, scalar is used as a divisor. A value of zero is assumed to be a scalar value of 1.'),
+    'SourceGroupScalar': (71, 72, 'Scalar to be applied to all coordinates specified in Standard Trace Header bytes 73–88 and to bytes Trace Header 181–188 to give the real value. Scalar = 1, ±10, ±100, ±1000, or ±10,000. If positive, scalar is used as a multiplier; if negative, scalar is used as divisor. A value of zero is assumed to be a scalar value of 1.'),
+    'SourceX': (73, 76, 'Source coordinate – X. The coordinate reference system should be identified through an Extended Textual Header (see Appendix D-1). If the coordinate units are in seconds of arc, decimal degrees or DMS, the X values represent longitude and the Y values latitude. A positive value designates east of Greenwich Meridian or north of the equator and a negative value designates south or west.'),
+    'SourceY': (77, 80, 'Source coordinate – Y. The coordinate reference system should be identified through an Extended Textual Header (see Appendix D-1). If the coordinate units are in seconds of arc, decimal degrees or DMS, the X values represent longitude and the Y values latitude. A positive value designates east of Greenwich Meridian or north of the equator and a negative value designates south or west.'),
+    'GroupX': (81, 84, 'Group coordinate – X. The coordinate reference system should be identified through an Extended Textual Header (see Appendix D-1). If the coordinate units are in seconds of arc, decimal degrees or DMS, the X values represent longitude and the Y values latitude. A positive value designates east of Greenwich Meridian or north of the equator and a negative value designates south or west.'),
+    'GroupY': (85, 88, 'Group coordinate – Y. The coordinate reference system should be identified through an Extended Textual Header (see Appendix D-1). If the coordinate units are in seconds of arc, decimal degrees or DMS, the X values represent longitude and the Y values latitude. A positive value designates east of Greenwich Meridian or north of the equator and a negative value designates south or west.'),
+    'CoordinateUnits': (89, 90, 'Coordinate units: 1 = Length (meters or feet as specified in Binary File Header bytes 3255-3256 and in Extended Textual Header if Location Data are included in the file), 2 = Seconds of arc (deprecated), 3 = Decimal degrees (preferred degree representation), 4 = Degrees, minutes, seconds (DMS). Note: To encode ±DDDMMSS set bytes 73–88 = ±DDD*104 + MM*102 + SS with bytes 71–72 set to 1; To encode ±DDDMMSS.ss set bytes 73–88 = ±DDD*106 + MM*104 + SS*102 + ss with bytes 71–72 set to –100.'),
+    'WeatheringVelocity': (91, 92, 'Weathering velocity. (ft/s or m/s as specified in Binary File Header bytes 3255– 3256)'),
+    'SubWeatheringVelocity': (93, 94, 'Subweathering velocity. (ft/s or m/s as specified in Binary File Header bytes 3255–3256)'),
+    'SourceUpholeTime': (95, 96, 'Uphole time at source in milliseconds. Time in milliseconds as scaled by the scalar specified in Standard Trace Header bytes 215-216.'),
+    'GroupUpholeTime': (97, 98, 'Uphole time at group in milliseconds. Time in milliseconds as scaled by the scalar specified in Standard Trace Header bytes 215-216.'),
+    'SourceStaticCorrection': (99, 100, 'Source static correction in milliseconds. Time in milliseconds as scaled by the scalar specified in Standard Trace Header bytes 215-216.'),
+    'GroupStaticCorrection': (101, 102, 'Group static correction in milliseconds. Time in milliseconds as scaled by the scalar specified in Standard Trace Header bytes 215-216.'),
+    'TotalStaticApplied': (103, 104, 'Total static applied in milliseconds. (Zero if no static has been applied,) Time in milliseconds as scaled by the scalar specified in Standard Trace Header bytes 215-216.'),
+    'LagTimeA': (105, 106, 'Lag time A — Time in milliseconds between end of 240-byte trace identification header and time break. The value is positive if time break occurs after the end of header; negative if time break occurs before the end of header. Time break is defined as the initiation pulse that may be recorded on an auxiliary trace or as otherwise specified by the recording system.'),
+    'LagTimeB': (107, 108, 'Lag Time B — Time in milliseconds between time break and the initiation time of the energy source. May be positive or negative.'),
+    'DelayRecordingTime': (109, 110, 'Delay recording time — Time in milliseconds between initiation time of energy source and the time when recording of data samples begins. In SEG-Y rev 0 this entry was intended for deep-water work if data recording did not start at zero time. The entry can be negative to accommodate negative start times (i.e. data recorded before time zero, presumably as a result of static application to the data trace). If a non-zero value (negative or positive) is recorded in this entry, a comment to that effect should appear in the Textual File Header.'),
+    'MuteTimeStart': (111, 112, 'Mute time — Start time in milliseconds.'),
+    'MuteTimeEND': (113, 114, 'Mute time — End time in milliseconds.'),
+    'TRACE_SAMPLE_COUNT': (115, 116, 'Number of samples in this trace. The number of bytes in a trace record must be consistent with the number of samples written in the Binary File Header and/or the SEG-defined Trace Header(s). This is important for all recording media; but it is particularly crucial for the correct processing of SEG-Y data in disk files (see Appendix A). If the fixed length trace flag in bytes 3503–3504 of the Binary File Header is set, the number of samples in every trace in the SEG-Y file is assumed to be the same as the value recorded in the Binary File Header and this field is ignored. If the fixed length trace flag is not set, the number of samples may vary from trace to trace.'),
+    'TRACE_SAMPLE_INTERVAL': (117, 118, 'Sample interval for this trace. Microseconds (µs) for time data, Hertz (Hz) for frequency data, meters (m) or feet (ft) for depth data. If the fixed length trace flag in bytes 3503–3504 of the Binary File Header is set, the sample interval in every trace in the SEG-Y file is assumed to be the same as the value recorded in the Binary File Header and this field is ignored. If the fixed length trace flag is not set, the sample interval may vary from trace to trace.'),
+    'GainType': (119, 120, 'Gain type of field instruments: 1 = fixed, 2 = binary, 3 = floating point, 4 … N = optional use'),
+    'InstrumentGainConstant': (121, 122, 'Instrument gain constant (dB).'),
+    'InstrumentInitialGain': (123, 124, 'Instrument early or initial gain (dB).'),
+    'Correlated': (125, 126, 'Correlated: 1 = no, 2 = yes'),
+    'SweepFrequencyStart': (127, 128, 'Sweep frequency at start (Hz).'),
+    'SweepFrequencyEnd': (129, 130, 'Sweep frequency at end (Hz).'),
+    'SweepLength': (131, 132, 'Sweep length in milliseconds.'),
+    'SweepType': (133, 134, 'Sweep type: 1 = linear, 2 = parabolic, 3 = exponential, 4 = other'),
+    'SweepTraceTaperLengthStart': (135, 136, 'Sweep trace taper length at start in milliseconds.'),
+    'SweepTraceTaperLengthEnd': (137, 138, 'Sweep trace taper length at end in milliseconds.'),
+    'TaperType': (139, 140, 'Taper type: 1 = linear, 2 = cos2, 3 = other'),
+    'AliasFilterFrequency': (141, 142, 'Alias filter frequency (Hz), if used.'),
+    'AliasFilterSlope': (143, 144, 'Alias filter slope (dB/octave).'),
+    'NotchFilterFrequency': (145, 146, 'Notch filter frequency (Hz), if used.'),
+    'NotchFilterSlope': (147, 148, 'Notch filter slope (dB/octave).'),
+    'LowCutFrequency': (149, 150, 'Low-cut frequency (Hz), if used.'),
+    'HighCutFrequency': (151, 152, 'High-cut frequency (Hz), if used.'),
+    'LowCutSlope': (153, 154, 'Low-cut slope (dB/octave)'),
+    'HighCutSlope': (155, 156, 'High-cut slope (dB/octave)'),
+    'YearDataRecorded': (157, 158, 'Year data recorded — The 1975 standard was unclear as to whether this should be recorded as a 2-digit or a 4-digit year and both have been used. For SEG-Y revisions beyond rev 0, the year should be recorded as the complete 4-digit Gregorian calendar year, e.g., the year 2001 should be recorded as 2001 (07D116).'),
+    'DayOfYear': (159, 160, 'Day of year (Range 1–366 for GMT, UTC, and GPS time basis).'),
+    'HourOfDay': (161, 162, 'Hour of day (24 hour clock).'),
+    'MinuteOfHour': (163, 164, 'Minute of hour.'),
+    'SecondOfMinute': (165, 166, 'Second of minute.'),
+    'TimeBaseCode': (167, 168, 'Time basis code. If nonzero, overrides Binary File Header bytes 3511–3512. 1 = Local, 2 = GMT (Greenwich Mean Time), 3 = Other, should be explained in a user defined stanza in the Extended Textual File Header, 4 = UTC (Coordinated Universal Time), 5 = GPS (Global Positioning System Time)'),
+    'TraceWeightingFactor': (169, 170, 'Trace weighting factor — Defined as 2–N units (volts unless bytes 203–204 specify a different unit) for the least significant bit. (N = 0, 1, …, 32767)'),
+    'GeophoneGroupNumberRoll1': (171, 172, 'Geophone group number of roll switch position one.'),
+    'GeophoneGroupNumberFirstTraceOrigField': (173, 174, 'Geophone group number of trace number one within original field record.'),
+    'GeophoneGroupNumberLastTraceOrigField': (175, 176, 'Geophone group number of last trace within original field record.'),
+    'GapSize': (177, 178, 'Gap size (total number of groups dropped).'),
+    'OverTravel': (179, 180, 'Over travel associated with taper at beginning or end of line: 1 = down (or behind), 2 = up (or ahead)'),
+    'CDP_X': (181, 184, 'X coordinate of ensemble (CDP) position of this trace (scalar in Standard Trace Header bytes 71–72 applies). The coordinate reference system should be identified through an Extended Textual Header (see Appendices D-1 or D-3).'),
+    'CDP_Y': (185, 188, 'Y coordinate of ensemble (CDP) position of this trace (scalar in Standard Trace Header bytes 71–72 applies). The coordinate reference system should be identified through an Extended Textual Header (see Appendices D-1 or D-3).'),
+    'INLINE_3D': (189, 192, 'For 3-D poststack data, this field should be used for the in-line number. If one in-line per SEG-Y file is being recorded, this value should be the same for all traces in the file and the same value will be recorded in bytes 3205–3208 of the Binary File Header.'),
+    'CROSSLINE_3D': (193, 196, 'For 3-D poststack data, this field should be used for the cross-line number. This will typically be the same value as the ensemble (CDP) number in Standard Trace Header bytes 21–24, but this does not have to be the case.'),
+    'ShotPoint': (197, 200, 'Shotpoint number — This is probably only applicable to 2-D poststack data. Note that it is assumed that the shotpoint number refers to the source location nearest to the ensemble (CDP) location for a particular trace. If this is not the case, there should be a comment in the Textual File Header explaining what the shotpoint number actually refers to.'),
+    'ShotPointScalar': (201, 202, 'Scalar to be applied to the shotpoint number in Standard Trace Header bytes 197–200 to give the real value. If positive, scalar is used as a multiplier; if negative as a divisor; if zero the shotpoint number is not scaled (i.e. it is an integer. A typical value will be –10, allowing shotpoint numbers with one decimal digit to the right of the decimal point).'),
+    'TraceValueMeasurementUnit': (203, 204, 'Trace value measurement unit: –1 = Other (should be described in Data Sample Measurement Units Stanza), 0 = Unknown, 1 = Pascal (Pa), 2 = Volts (v), 3 = Millivolts (mV), 4 = Amperes (A), 5 = Meters (m), 6 = Meters per second (m/s), 7 = Meters per second squared (m/s2), 8 = Newton (N), 9 = Watt (W), 10-255 = reserved for future use, 256 … N = optional use. (maximum N = 32,767)'),
+}